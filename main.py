@@ -8,12 +8,17 @@ __version__ = "1.0.0-pre-alpha"
 
 # Standard library imports / Importaciones de biblioteca estándar
 import asyncio    # Async/await support for web / Soporte async/await para web
+import collections  # LRU ordering for caches / Orden LRU para cachés
+import contextlib  # Context managers for profiling phases / Gestores de contexto para fases de perfilado
+import hashlib    # Asset cache keys and checksums / Claves y sumas de verificación de caché
 import json       # JSON parsing / Análisis JSON
 import math       # Mathematical functions / Funciones matemáticas
 import os         # Operating system interface / Interfaz del sistema operativo
+import queue      # Thread-safe loading results / Resultados de carga seguros entre hilos
 import random     # Random number generation / Generación de números aleatorios
 import socket     # Network communication / Comunicación de red
 import string     # String operations / Operaciones de cadenas
+import struct     # Binary cache headers / Cabeceras binarias de caché
 import sys        # System-specific parameters / Parámetros específicos del sistema
 import threading  # Thread-based parallelism / Paralelismo basado en hilos
 import time       # Time access and conversions / Acceso y conversiones de tiempo
@@ -24,23 +29,11 @@ from pathlib import Path  # Object-oriented filesystem paths / Rutas del sistema
 # Third-party imports / Importaciones de terceros
 import numpy as np  # Numerical computing / Computación numérica
 
-# Windows DPI awareness fix / Corrección de DPI para Windows
-# This prevents blurry text on high-DPI displays
-# Esto previene texto borroso en pantallas de alto DPI
-if sys.platform == 'win32':
-    import ctypes
-    try:
-        ctypes.windll.user32.SetProcessDPIAware()
-    except (AttributeError, OSError):
-        pass  # DPI awareness not available / DPI no disponible
-
-# Center game window on screen / Centrar ventana del juego en pantalla
-os.environ['SDL_VIDEO_CENTERED'] = '1'
-
-# Initialize Pygame / Inicializar Pygame
+# Pygame is imported here but initialized lazily (see init_display / init_audio),
+# so importing this module opens no window or audio device (headless tools, tests, servers)
+# Pygame se importa aquí pero se inicializa de forma diferida (ver init_display / init_audio),
+# así importar este módulo no abre ventana ni dispositivo de audio (herramientas, pruebas, servidores)
 import pygame
-pygame.init()  # Initialize display and input / Inicializar pantalla y entrada
-pygame.mixer.init()  # Initialize audio system / Inicializar sistema de audio
 
 # Web environment detection / Detección de entorno web
 # Check if running in browser via Pygbag/Pyodide
@@ -55,12 +48,163 @@ if IS_WEB:
     os.environ.setdefault("HOME", "/tmp")
     os.environ.setdefault("USERPROFILE", "/tmp")
 
+# ============================================================================
+# SUBSYSTEM INITIALIZATION / INICIALIZACIÓN DE SUBSISTEMAS
+# Explicit, idempotent initializers called by Game (never at import time)
+# Inicializadores explícitos e idempotentes llamados por Game (nunca al importar)
+# ============================================================================
+
+def init_display():
+    """
+    Initialize display, input and fonts (idempotent).
+    Inicializar pantalla, entrada y fuentes (idempotente).
+    """
+    if pygame.display.get_init():
+        return
+    # Windows DPI awareness fix / Corrección de DPI para Windows
+    # This prevents blurry text on high-DPI displays
+    # Esto previene texto borroso en pantallas de alto DPI
+    if sys.platform == 'win32':
+        import ctypes
+        try:
+            ctypes.windll.user32.SetProcessDPIAware()
+        except (AttributeError, OSError):
+            pass  # DPI awareness not available / DPI no disponible
+    
+    # Center game window on screen / Centrar ventana del juego en pantalla
+    os.environ['SDL_VIDEO_CENTERED'] = '1'
+    pygame.display.init()  # Display and input / Pantalla y entrada
+    pygame.font.init()  # Text rendering / Renderizado de texto
+
+_AUDIO_STATE = {'ready': None}  # None = not attempted yet / None = aún no intentado
+
+def init_audio():
+    """
+    Initialize audio mixer (idempotent, safe without an audio device).
+    Inicializar mezclador de audio (idempotente, seguro sin dispositivo de audio).
+    
+    Returns / Retorna:
+        bool: True if the mixer is available / True si el mezclador está disponible
+    """
+    if _AUDIO_STATE['ready'] is None:
+        try:
+            pygame.mixer.init()  # Initialize audio system / Inicializar sistema de audio
+            _AUDIO_STATE['ready'] = True
+        except pygame.error as e:
+            print(f"[Audio] Mixer unavailable: {e}")
+            _AUDIO_STATE['ready'] = False
+    return _AUDIO_STATE['ready']
+
+def measure_import_time(module='main', runs=3):
+    """
+    Measure `import <module>` cost in fresh interpreters (best of N runs).
+    Medir el costo de `import <module>` en intérpretes nuevos (mejor de N ejecuciones).
+    
+    Returns / Retorna:
+        tuple: (best_ms, side_effects) where side_effects lists subsystems left initialized
+               (mejor_ms, efectos) donde efectos lista subsistemas que quedaron inicializados
+    """
+    import subprocess
+    probe = (
+        "import time; t = time.perf_counter(); import {0}; ms = (time.perf_counter() - t) * 1000; "
+        "import pygame; "
+        "print(ms, int(pygame.display.get_init()), int(bool(pygame.mixer.get_init())))"
+    ).format(module)
+    env = dict(os.environ, PYGAME_HIDE_SUPPORT_PROMPT='1')
+    best, side_effects = float('inf'), []
+    for _ in range(runs):
+        out = subprocess.run([sys.executable, '-c', probe], cwd=str(Path(__file__).resolve().parent),
+                             env=env, capture_output=True, text=True, check=True).stdout.split()
+        best = min(best, float(out[-3]))
+        side_effects = [name for name, flag in (('display', out[-2]), ('mixer', out[-1])) if flag == '1']
+    return best, side_effects
+
+class StartupProfiler:
+    """
+    Timestamps named startup phases with time.perf_counter_ns (--profile-startup).
+    Marca tiempos de fases de inicio con time.perf_counter_ns (--profile-startup).
+    
+    Usage / Uso:
+        with profiler.phase('fonts'):
+            ...
+    A disabled profiler records nothing and costs one attribute check per phase.
+    Un perfilador desactivado no registra nada y cuesta una verificación por fase.
+    """
+    
+    def __init__(self, enabled=True):
+        self.enabled = enabled
+        self.origin_ns = time.perf_counter_ns()  # Reference for phase offsets / Referencia para offsets
+        self.phases = []  # (name, start_ns, end_ns) in completion order / en orden de finalización
+    
+    def phase(self, name):
+        """Context manager timing one phase. / Gestor de contexto que mide una fase."""
+        if not self.enabled:
+            return contextlib.nullcontext()
+        return self._timed(name)
+    
+    @contextlib.contextmanager
+    def _timed(self, name):
+        start = time.perf_counter_ns()
+        try:
+            yield
+        finally:
+            self.phases.append((name, start, time.perf_counter_ns()))
+    
+    def report(self):
+        """
+        Build machine-readable report.
+        Construir reporte legible por máquina.
+        
+        Returns / Retorna:
+            dict: Version, environment, total and per-phase timings in ms
+                  Versión, entorno, total y tiempos por fase en ms
+        """
+        end_ns = max((end for _, _, end in self.phases), default=self.origin_ns)
+        return {
+            'version': __version__,
+            'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S%z'),
+            'python': sys.version.split()[0],
+            'pygame': pygame.version.ver,
+            'platform': sys.platform,
+            'total_ms': round((end_ns - self.origin_ns) / 1e6, 3),
+            'phases': [
+                {'name': name, 'start_ms': round((start - self.origin_ns) / 1e6, 3), 'duration_ms': round((end - start) / 1e6, 3)}
+                for name, start, end in self.phases
+            ],
+        }
+    
+    def print_report(self):
+        """Print phases sorted by duration (slowest first). / Imprimir fases ordenadas por duración."""
+        report = self.report()
+        total = report['total_ms'] or 1.0
+        print(f"Startup profile ({report['total_ms']:.1f} ms total)")
+        for entry in sorted(report['phases'], key=lambda p: p['duration_ms'], reverse=True):
+            share = 100.0 * entry['duration_ms'] / total
+            print(f"  {entry['name']:<28} {entry['duration_ms']:9.2f} ms  {share:5.1f}%")
+    
+    def write_json(self, path):
+        """Write report as JSON. / Escribir reporte como JSON."""
+        with open(path, 'w') as f:
+            json.dump(self.report(), f, indent=2)
+
 # Settings file location / Ubicación del archivo de configuración
 # Stored in user's home directory (desktop only) / Almacenado en el directorio personal (solo escritorio)
 try:
     SETTINGS_FILE = Path.home() / '.pong_ai_settings.json' if not IS_WEB else None
 except:
     SETTINGS_FILE = None  # Web mode or filesystem unavailable / Modo web o sistema de archivos no disponible
+
+# Baked asset cache location (desktop only) / Ubicación de caché de recursos (solo escritorio)
+try:
+    CACHE_DIR = Path.home() / '.pong_ai_cache' if not IS_WEB else None
+except:
+    CACHE_DIR = None  # Web mode or filesystem unavailable / Modo web o sistema de archivos no disponible
+
+# Particle emitter overrides (desktop only) / Sobrescrituras de emisores de partículas (solo escritorio)
+try:
+    EMITTERS_FILE = Path.home() / '.pong_ai_emitters.json' if not IS_WEB else None
+except:
+    EMITTERS_FILE = None  # Web mode or filesystem unavailable / Modo web o sistema de archivos no disponible
 # ============================================================================
 # TRANSLATION SYSTEM / SISTEMA DE TRADUCCIÓN
 # All UI text in English and Spanish / Todo el texto de UI en Inglés y Español
@@ -81,7 +225,7 @@ TRANSLATIONS = {
         'wins': 'wins!', 'rematch': 'Rematch (R)', 'menu': 'Menu (M)', 
         '2player': '2 PLAYER', 'system_diagnostics': 'System Diagnostics', 'hosting_game': 'Hosting Game',
         'share_code': 'Share code:', 'or_ip': 'Or IP:', 'waiting_player': 'Waiting for player', 
-        'player_connected': 'Player Connected!', 'internet': 'Internet:'
+        'player_connected': 'Player Connected!', 'internet': 'Internet:', 'loading': 'Loading'
     },
     'es': {  # Spanish translations / Traducciones en español
         'title': 'Pong IA', 'subtitle': 'ESPACIO / ENTER para iniciar', 'easy': 'Fácil', 'medium': 'Medio', 'hard': 'Difícil',
@@ -97,7 +241,7 @@ TRANSLATIONS = {
         'wins': 'gana!', 'rematch': 'Revancha (R)', 'menu': 'Menú (M)',
         '2player': '2 JUGADORES', 'system_diagnostics': 'Diagnósticos del Sistema', 'hosting_game': 'Creando Partida',
         'share_code': 'Compartir código:', 'or_ip': 'O IP:', 'waiting_player': 'Esperando jugador',
-        'player_connected': '¡Jugador Conectado!', 'internet': 'Internet:'
+        'player_connected': '¡Jugador Conectado!', 'internet': 'Internet:', 'loading': 'Cargando'
     }
 }
 # ============================================================================
@@ -239,11 +383,30 @@ def get_external_ip():
         Used for internet multiplayer (requires port forwarding)
         Usado para multijugador por internet (requiere reenvío de puertos)
     """
+    if 'ip' in _EXTERNAL_IP:
+        return _EXTERNAL_IP['ip']  # Prefetched during loading / Precargada durante la carga
     try:
         response = urllib.request.urlopen('https://api.ipify.org?format=text', timeout=3)
         return response.read().decode('utf8')
     except (urllib.error.URLError, socket.timeout):
         return None  # No internet or API unavailable / Sin internet o API no disponible
+
+_EXTERNAL_IP = {}  # Result of prefetch_external_ip / Resultado de prefetch_external_ip
+
+def prefetch_external_ip():
+    """
+    Look up external IP on a daemon thread so hosting does not block on it.
+    Consultar IP externa en un hilo daemon para que crear partida no se bloquee.
+    """
+    if IS_WEB or 'ip' in _EXTERNAL_IP:
+        return
+    
+    def lookup():
+        ip = get_external_ip()
+        if ip is not None:
+            _EXTERNAL_IP['ip'] = ip  # Failures are retried by NetworkHost.start / Fallos se reintentan en NetworkHost.start
+    
+    threading.Thread(target=lookup, daemon=True).start()
 # ============================================================================
 # MULTIPLAYER NETWORKING CLASSES / CLASES DE RED MULTIJUGADOR
 # Host/Client architecture for real-time gameplay synchronization
@@ -797,6 +960,10 @@ class PowerUp:
     vx: float = 0.0  # Horizontal drift / Deriva horizontal
     vy: float = 50.0  # Vertical fall speed / Velocidad de caída vertical
     glow_phase: float = 0.0  # Animation phase / Fase de animación
+    
+    def reset(self, type, x, y, vx=0.0, vy=50.0):
+        """Reinitialize every field (pool reuse). / Reinicializar todos los campos (reutilización del pool)."""
+        self.__init__(type, x, y, vx=vx, vy=vy)
 
 # Power-up configuration / Configuración de power-ups
 POWERUP_TYPES = ['big_paddle', 'speed_boost', 'shield', 'slow_motion', 'multi_ball', 'chaos_ball']
@@ -825,6 +992,217 @@ YELLOW = (255, 255, 0)    # Amarillo
 # Procedurally generated sound effects / Efectos de sonido generados proceduralmente
 # ============================================================================
 
+# Synth patches: a patch is a list of voices mixed together; a voice is one oscillator
+#   wave: 'sine' | 'square' | 'triangle' | 'saw' (default 'sine')
+#   freq: Hz, or (start, end) for a linear sweep / Hz, o (inicio, fin) para un barrido lineal
+#   start, duration: seconds; voices with staggered starts form a sequence / segundos; inicios escalonados forman una secuencia
+#   gain: voice level / nivel de la voz;  adsr: (attack, decay, sustain level, release), optional
+# Parches de síntesis: un parche es una lista de voces mezcladas; una voz es un oscilador
+SFX_PATCHES = {
+    'bounce': {'volume': 0.6, 'voices': [{'freq': 440, 'duration': 0.09}]},  # Wall/paddle bounce (A4 note) / Rebote en pared/paleta (nota LA4)
+    'score': {'volume': 0.7, 'voices': [{'freq': 220, 'duration': 0.22}]},   # Score point (A3 note, longer) / Punto anotado (nota LA3, más largo)
+    'paddle': {'volume': 0.5, 'voices': [{'freq': 660, 'duration': 0.07}]},  # Paddle hit (E5 note, short) / Golpe de paleta (nota MI5, corto)
+    # Four simultaneous tones / Cuatro tonos simultáneos
+    'powerup_collect': {'volume': 0.244, 'voices': [{'freq': f, 'duration': 0.05} for f in (500, 650, 800, 1000)]},
+    # Descending chirp / Chirrido descendente
+    'powerup_expire': {'volume': 0.183, 'voices': [{'freq': (600, 0), 'duration': 0.3}]},
+}
+
+# Effects always loaded into Game.sounds / Efectos siempre cargados en Game.sounds
+SOUND_BANK_NAMES = ('bounce', 'score', 'paddle')
+
+# Bump when render_patches output changes (invalidates .npy banks)
+# Incrementar cuando cambie la salida de render_patches (invalida bancos .npy)
+SYNTH_VERSION = 1
+
+# Mixer format banks are rendered for until the mixer reports its own
+# Formato de mezclador para el que se renderizan bancos hasta que el mezclador informe el suyo
+DEFAULT_MIXER_FORMAT = (44100, -16, 2)
+
+_WAVE_IDS = {'sine': 0, 'square': 1, 'triangle': 2, 'saw': 3}
+
+def pitch_patch(patch, pitch):
+    """
+    Copy of a patch with every frequency multiplied by pitch.
+    Copia de un parche con cada frecuencia multiplicada por el tono.
+    """
+    voices = []
+    for voice in patch['voices']:
+        freq = voice['freq']
+        scaled = tuple(f * pitch for f in freq) if isinstance(freq, (tuple, list)) else freq * pitch
+        voices.append(dict(voice, freq=scaled))
+    return dict(patch, voices=voices)
+
+def patch_layout(patches, sample_rate):
+    """
+    Offset and length (in samples) of each patch inside a bank buffer.
+    Offset y longitud (en muestras) de cada parche dentro de un buffer de banco.
+    
+    Returns / Retorna:
+        tuple: ({name: (offset, length)}, total_samples) / ({nombre: (offset, longitud)}, total_muestras)
+    """
+    layout, offset = {}, 0
+    for name, patch in patches.items():
+        length = max(int(round((v.get('start', 0.0) + v['duration']) * sample_rate)) for v in patch['voices'])
+        layout[name] = (offset, length)
+        offset += length
+    return layout, offset
+
+def render_patches(patches, sample_rate=44100, channels=2):
+    """
+    Render every patch in one vectorized pass into a single int16 buffer.
+    Renderizar todos los parches en una pasada vectorizada a un único buffer int16.
+    
+    All voices of all patches are flattened into one sample axis; oscillators,
+    sweeps and envelopes are evaluated once over it and scatter-added (np.bincount)
+    into the bank, so chords and sequences mix without per-voice temporaries.
+    Todas las voces se aplanan en un eje de muestras; osciladores, barridos y
+    envolventes se evalúan una vez y se suman por dispersión (np.bincount) al banco.
+    
+    Args / Argumentos:
+        patches (dict): name -> patch (see SFX_PATCHES) / nombre -> parche
+        sample_rate (int): Samples per second / Muestras por segundo
+        channels (int): Output channels (mono duplicated) / Canales de salida (mono duplicado)
+    
+    Returns / Retorna:
+        tuple: (buffer (samples, channels) int16, layout {name: (offset, length)})
+    """
+    layout, total = patch_layout(patches, sample_rate)
+    voices = [(layout[name][0], patch['volume'], voice) for name, patch in patches.items() for voice in patch['voices']]
+    
+    # Per-voice parameters / Parámetros por voz
+    counts = np.array([int(v['duration'] * sample_rate) for _, _, v in voices], dtype=np.int64)
+    dest = np.array([off + int(round(v.get('start', 0.0) * sample_rate)) for off, _, v in voices], dtype=np.int64)
+    f0 = np.array([v['freq'][0] if isinstance(v['freq'], (tuple, list)) else v['freq'] for _, _, v in voices], dtype=np.float64)
+    f1 = np.array([v['freq'][1] if isinstance(v['freq'], (tuple, list)) else v['freq'] for _, _, v in voices], dtype=np.float64)
+    length = np.array([v['duration'] for _, _, v in voices], dtype=np.float64)
+    amp = np.array([32767.0 * vol * v.get('gain', 1.0) for _, vol, v in voices], dtype=np.float64)
+    wave = np.array([_WAVE_IDS[v.get('wave', 'sine')] for _, _, v in voices], dtype=np.int8)
+    adsr = np.array([v.get('adsr') or (0.0, 0.0, 1.0, 0.0) for _, _, v in voices], dtype=np.float64)
+    
+    # One flat sample axis across all voices / Un eje plano de muestras para todas las voces
+    vid = np.repeat(np.arange(len(voices)), counts)
+    k = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    t = k / sample_rate
+    
+    # Linear sweep with integrated phase / Barrido lineal con fase integrada
+    phase = 2 * np.pi * (f0[vid] * t + (f1 - f0)[vid] * t * t / (2 * length[vid]))
+    signal = np.sin(phase)
+    w = wave[vid]
+    if (w == 1).any():
+        signal[w == 1] = np.sign(signal[w == 1])
+    if (w == 2).any():
+        signal[w == 2] = np.arcsin(signal[w == 2]) * (2 / np.pi)
+    if (w == 3).any():
+        signal[w == 3] = 2 * ((phase[w == 3] / (2 * np.pi)) % 1.0) - 1
+    
+    # ADSR envelope; voices without one keep unit gain / Envolvente ADSR; voces sin ella mantienen ganancia 1
+    if (adsr != (0.0, 0.0, 1.0, 0.0)).any():
+        a, d, s, r = (adsr[:, i][vid] for i in range(4))
+        env = np.where(t < a, t / np.maximum(a, 1e-9),
+                       np.where(t < a + d, 1 - (1 - s) * (t - a) / np.maximum(d, 1e-9), s))
+        env *= np.clip((length[vid] - t) / np.maximum(r, 1e-9), 0.0, 1.0)
+        signal *= env
+    signal *= amp[vid]
+    
+    # Scatter-add into the bank, then fill the preallocated int16 buffer in place
+    # Suma por dispersión en el banco, luego llenar el buffer int16 preasignado en sitio
+    mix = np.bincount(dest[vid] + k, weights=signal, minlength=total)
+    np.clip(mix, -32768, 32767, out=mix)
+    buffer = np.empty((total, channels), dtype=np.int16)
+    buffer[...] = mix[:, None]  # Truncates like astype(np.int16) / Trunca como astype(np.int16)
+    return buffer, layout
+
+def _bank_path(patches, fmt, directory):
+    """On-disk .npy path keyed by patch contents and mixer format. / Ruta .npy por contenido y formato."""
+    payload = json.dumps([patches, list(fmt), SYNTH_VERSION], sort_keys=True)
+    return Path(directory) / 'audio' / f"sfx-v{SYNTH_VERSION}-{hashlib.sha256(payload.encode('utf-8')).hexdigest()[:24]}.npy"
+
+def load_or_render_bank(patches, fmt=DEFAULT_MIXER_FORMAT, directory=CACHE_DIR):
+    """
+    Memory-map a previously rendered bank, or render and persist it (thread-safe).
+    Mapear en memoria un banco ya renderizado, o renderizarlo y guardarlo (seguro en hilos).
+    
+    Returns / Retorna:
+        tuple: (buffer, layout, fmt) / (buffer, distribución, formato)
+    """
+    sample_rate, _, channels = fmt
+    layout, total = patch_layout(patches, sample_rate)
+    path = _bank_path(patches, fmt, directory) if directory is not None else None
+    if path is not None:
+        try:
+            buffer = np.load(path, mmap_mode='r')
+            if buffer.dtype == np.int16 and buffer.shape == (total, channels):
+                return buffer, layout, fmt
+        except (OSError, ValueError):
+            pass  # Missing or corrupt - render again / Falta o está corrupto - renderizar otra vez
+    buffer, layout = render_patches(patches, sample_rate, channels)
+    if path is not None:
+        tmp_path = path.with_suffix(f'.tmp{os.getpid()}')
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, 'wb') as f:
+                np.save(f, buffer)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass  # Cache is optional / La caché es opcional
+    return buffer, layout, fmt
+
+def mixer_format():
+    """Actual mixer format, or the default before init. / Formato real del mezclador, o el predeterminado."""
+    return pygame.mixer.get_init() or DEFAULT_MIXER_FORMAT
+
+def mixer_samples(buffer):
+    """
+    Convert rendered int16 samples to the mixer's sample type; Sound(buffer=...) reads raw bytes.
+    Convertir muestras int16 renderizadas al tipo del mezclador; Sound(buffer=...) lee bytes crudos.
+    
+    Args / Argumentos:
+        buffer (np.ndarray): int16 samples / Muestras int16
+    
+    Returns / Retorna:
+        np.ndarray: buffer itself for 16-bit signed mixers, else a converted copy
+                    El mismo buffer para mezcladores de 16 bits con signo, si no una copia convertida
+    """
+    size = mixer_format()[1]
+    if abs(size) == 32:  # float32; pygame reports it as 32 or -32 / pygame lo reporta como 32 o -32
+        return buffer.astype(np.float32) * np.float32(1 / 32768)
+    if size == 16:
+        return (buffer.astype(np.int32) + 32768).astype(np.uint16)
+    if size == -8:
+        return (buffer >> 8).astype(np.int8)
+    if size == 8:
+        return ((buffer >> 8) + 128).astype(np.uint8)
+    return buffer
+
+def bank_sounds(bank):
+    """
+    Slice a rendered bank into Sounds (main thread, re-renders if the mixer format differs).
+    Cortar un banco renderizado en Sounds (hilo principal, re-renderiza si el formato difiere).
+    
+    Args / Argumentos:
+        bank (tuple): Result of load_or_render_bank / Resultado de load_or_render_bank
+    
+    Returns / Retorna:
+        dict: name -> Sound (None without audio device) / nombre -> Sound (None sin audio)
+    """
+    buffer, layout, fmt = bank
+    if not init_audio():
+        return dict.fromkeys(layout)
+    if tuple(fmt) != tuple(mixer_format()):
+        return bank_sounds(load_or_render_bank(_patches_for_layout(layout), mixer_format()))
+    # Views into the bank; the mixer keeps its own copy / Vistas del banco; el mezclador guarda su copia
+    buffer = mixer_samples(buffer)
+    return {name: pygame.mixer.Sound(buffer=buffer[offset:offset + length]) for name, (offset, length) in layout.items()}
+
+def _patches_for_layout(layout):
+    """Rebuild the patch dict a layout was rendered from. / Reconstruir el diccionario de parches de una distribución."""
+    patches = {}
+    for name in layout:
+        base, _, step = name.partition('@')
+        patches[name] = pitch_patch(SFX_PATCHES[base], int(step) * SoundCache.PITCH_STEP) if step else SFX_PATCHES[base]
+    return patches
+
 def create_sound(frequency, duration, volume=0.5):
     """
     Create sine wave sound effect using NumPy.
@@ -836,319 +1214,1268 @@ def create_sound(frequency, duration, volume=0.5):
         volume (float): Volume (0.0 to 1.0) / Volumen (0.0 a 1.0)
     
     Returns / Retorna:
-        pygame.mixer.Sound: Playable sound object / Objeto de sonido reproducible
+        pygame.mixer.Sound or None: Playable sound, None without audio device
+                                    Sonido reproducible, None sin dispositivo de audio
     """
-    sample_rate = 44100  # CD quality / Calidad de CD
-    
-    # Generate time array / Generar arreglo de tiempo
-    t = np.linspace(0, duration, int(sample_rate * duration), False)
-    
-    # Create sine wave / Crear onda sinusoidal
-    wave = np.sin(2 * np.pi * frequency * t)
-    
-    # Convert to 16-bit audio / Convertir a audio de 16 bits
-    audio = (wave * 32767 * volume).astype(np.int16)
+    if not init_audio():
+        return None  # No audio device / Sin dispositivo de audio
+    sample_rate, _, channels = mixer_format()
+    buffer, _ = render_patches({'tone': {'volume': volume, 'voices': [{'freq': frequency, 'duration': duration}]}}, sample_rate, channels)
+    return pygame.mixer.Sound(buffer=mixer_samples(buffer))
+
+_SOUND_BANK = {}  # Built on first use / Construido en el primer uso
+
+def get_sound_bank(bank=None):
+    """
+    Get shared sound effects, rendering them on first call.
+    Obtener efectos de sonido compartidos, renderizándolos en la primera llamada.
     
-    # Create stereo audio (duplicate mono to both channels)
-    # Crear audio estéreo (duplicar mono a ambos canales)
-    stereo_audio = np.ascontiguousarray(np.column_stack((audio, audio)))
+    Args / Argumentos:
+        bank (tuple, optional): Pre-rendered bank from load_or_render_bank / Banco ya renderizado
     
-    return pygame.sndarray.make_sound(stereo_audio)
+    Returns / Retorna:
+        dict: name -> Sound for every patch in the bank (None without audio device)
+              nombre -> Sound para cada parche del banco (None sin dispositivo de audio)
+    """
+    if not _SOUND_BANK:
+        if bank is None:
+            bank = load_or_render_bank({name: SFX_PATCHES[name] for name in SOUND_BANK_NAMES}, mixer_format())
+        _SOUND_BANK.update(bank_sounds(bank))
+    return _SOUND_BANK
 
-# Pre-generate sound effects / Pre-generar efectos de sonido
-bounce_sound = create_sound(440, 0.09, 0.6)  # Wall/paddle bounce (A4 note) / Rebote en pared/paleta (nota LA4)
-score_sound = create_sound(220, 0.22, 0.7)   # Score point (A3 note, longer) / Punto anotado (nota LA3, más largo)
-paddle_sound = create_sound(660, 0.07, 0.5)  # Paddle hit (E5 note, short) / Golpe de paleta (nota MI5, corto)
-# ============================================================================
-# PARTICLE SYSTEM / SISTEMA DE PARTÍCULAS
-# Visual effects for ball collisions / Efectos visuales para colisiones de bola
-# ============================================================================
+# Variants rendered with the bank during loading / Variantes renderizadas con el banco durante la carga
+EFFECT_PREWARM = (('powerup_collect', 0.8), ('powerup_collect', 1.0), ('powerup_collect', 1.5), ('powerup_expire', 1.0))
 
-class Particle:
+class SoundCache:
     """
-    Lightweight particle with fade-out effect.
-    Partícula ligera con efecto de desvanecimiento.
+    Bounded LRU of synthesized effects keyed by (sound_type, quantized pitch).
+    LRU acotada de efectos sintetizados indexada por (tipo de sonido, tono cuantizado).
     
-    Uses __slots__ for memory efficiency (object pooling)
-    Usa __slots__ para eficiencia de memoria (agrupación de objetos)
+    Pitch is rounded to PITCH_STEP so nearby pitches share one Sound.
+    El tono se redondea a PITCH_STEP para que tonos cercanos compartan un Sound.
     """
-    __slots__ = ("x", "y", "color", "size", "speed_x", "speed_y", "life", "initial_life", "active")
+    PITCH_STEP = 0.05
     
-    def __init__(self):
+    def __init__(self, capacity=32):
         """
-        Initialize inactive particle.
-        Inicializar partícula inactiva.
+        Args / Argumentos:
+            capacity (int): Maximum cached variants / Máximo de variantes en caché
         """
-        self.active = False  # Particle enabled flag / Indicador de partícula activada
-        self.x = 0.0         # X position / Posición X
-        self.y = 0.0         # Y position / Posición Y
-        self.color = (255, 255, 255)  # RGB color / Color RGB
-        self.size = 2        # Particle radius / Radio de partícula
-        self.speed_x = 0.0   # Horizontal velocity / Velocidad horizontal
-        self.speed_y = 0.0   # Vertical velocity / Velocidad vertical
-        self.life = 0.0      # Remaining lifetime / Vida restante
-        self.initial_life = 0.0  # Starting lifetime for alpha calculation / Vida inicial para cálculo de alfa
+        self.capacity = capacity
+        self._sounds = collections.OrderedDict()  # key -> Sound, least recent first / menos reciente primero
+        self.hits = 0
+        self.misses = 0
+    
+    def key(self, sound_type, pitch=1.0):
+        """Cache key with pitch quantized to PITCH_STEP. / Clave con tono cuantizado a PITCH_STEP."""
+        return (sound_type, round(pitch / self.PITCH_STEP))
     
-    def reset(self, x, y, color, *, size=None, life=0.35):
+    @staticmethod
+    def variant_name(key):
+        """Bank patch name for a key, e.g. 'powerup_collect@30'. / Nombre de parche del banco para una clave."""
+        return f"{key[0]}@{key[1]}"
+    
+    def patches(self, variants):
         """
-        Activate particle with new properties (object pool reuse).
-        Activar partícula con nuevas propiedades (reutilización de pool de objetos).
-        
-        Args / Argumentos:
-            x, y (float): Starting position / Posición inicial
-            color (tuple): RGB color / Color RGB
-            size (int, optional): Particle size / Tamaño de partícula
-            life (float): Lifetime in seconds / Vida en segundos
+        Patches for (sound_type, pitch) variants, to render with the bank.
+        Parches para variantes (tipo, tono), para renderizar con el banco.
         """
-        self.x = float(x)
-        self.y = float(y)
-        self.color = color
-        self.size = size if size is not None else random.randint(2, 5)
-        
-        # Random velocity for explosion effect / Velocidad aleatoria para efecto de explosión
-        self.speed_x = random.uniform(-220, 220)
-        self.speed_y = random.uniform(-220, 220)
-        
-        self.life = life
-        self.initial_life = life
-        self.active = True  # Enable particle / Activar partícula
+        patches = {}
+        for sound_type, pitch in variants:
+            key = self.key(sound_type, pitch)
+            if sound_type in SFX_PATCHES:
+                patches[self.variant_name(key)] = pitch_patch(SFX_PATCHES[sound_type], key[1] * self.PITCH_STEP)
+        return patches
     
-    def update(self, dt):
+    def adopt(self, sounds):
+        """Store Sounds for variants found in a bank. / Guardar Sounds de variantes encontradas en un banco."""
+        for name, sound in sounds.items():
+            sound_type, _, step = name.partition('@')
+            if step and sound is not None:
+                self._store((sound_type, int(step)), sound)
+    
+    def _store(self, key, sound):
+        self._sounds[key] = sound
+        self._sounds.move_to_end(key)
+        while len(self._sounds) > self.capacity:
+            self._sounds.popitem(last=False)  # Evict least recently used / Desalojar el menos usado
+    
+    def get(self, sound_type, pitch=1.0):
         """
-        Update particle physics.
-        Actualizar física de partícula.
+        Cached Sound for a variant, synthesizing it on a miss.
+        Sound en caché para una variante, sintetizándolo en un fallo.
         
+        Returns / Retorna:
+            pygame.mixer.Sound or None: None for unknown types or without audio / None si tipo desconocido o sin audio
+        """
+        key = self.key(sound_type, pitch)
+        sound = self._sounds.get(key)
+        if sound is not None:
+            self.hits += 1
+            self._sounds.move_to_end(key)
+            return sound
+        self.misses += 1
+        if sound_type not in SFX_PATCHES or not init_audio():
+            return None
+        sample_rate, _, channels = mixer_format()
+        buffer, _ = render_patches({'variant': pitch_patch(SFX_PATCHES[sound_type], key[1] * self.PITCH_STEP)}, sample_rate, channels)
+        sound = pygame.mixer.Sound(buffer=mixer_samples(buffer))
+        self._store(key, sound)
+        return sound
+    
+    def __len__(self):
+        return len(self._sounds)
+
+# Mixer voice categories: name -> (reserved channels, priority; higher steals lower)
+# Categorías de voces: nombre -> (canales reservados, prioridad; mayor roba a menor)
+VOICE_CATEGORIES = {
+    'music': (1, 4),  # Used directly by MusicStream, never stolen / Usado por MusicStream, nunca robado
+    'score': (1, 3),
+    'powerup': (2, 2),
+    'paddle': (2, 1),
+    'bounce': (2, 0),
+}
+
+class VoiceManager:
+    """
+    Plays sounds on reserved mixer channels per category with priority voice stealing.
+    Reproduce sonidos en canales reservados por categoría con robo de voces por prioridad.
+    
+    A category first uses a free channel of its own, then a free channel of any category
+    with equal or lower priority. When all of those are busy it steals the lowest-priority
+    playing voice among them (the oldest one on ties). Identical sounds retriggered
+    within `repeat_window` seconds are dropped.
+    Una categoría usa primero un canal libre propio y luego uno libre de cualquier categoría
+    de prioridad igual o menor. Si todos están ocupados roba la voz sonando de menor
+    prioridad entre ellos (la más antigua si empatan). Sonidos idénticos repetidos dentro
+    de `repeat_window` segundos se descartan.
+    """
+    
+    def __init__(self, categories=VOICE_CATEGORIES, repeat_window=0.03):
+        """
         Args / Argumentos:
-            dt (float): Delta time in seconds / Delta de tiempo en segundos
+            categories (dict): name -> (reserved channels, priority) / nombre -> (canales, prioridad)
+            repeat_window (float): Minimum seconds between identical sounds / Segundos mínimos entre sonidos idénticos
+        """
+        self.categories = categories
+        self.repeat_window = repeat_window
+        self.channels = {}      # category -> [Channel] / categoría -> [Channel]
+        self._voices = {}       # Channel -> (priority, start time) / Channel -> (prioridad, inicio)
+        self._last_played = {}  # Sound -> last start time / Sound -> último inicio
+        self.started = 0        # This frame / Este fotograma
+        self.dropped = 0
+        self.stolen = 0
+        self.total_started = 0
+        self.total_dropped = 0
+    
+    def setup(self):
+        """
+        Reserve channels once the mixer is open (main thread).
+        Reservar canales cuando el mezclador esté abierto (hilo principal).
         
         Returns / Retorna:
-            bool: True if still active / True si aún está activa
+            bool: True if channels are ready / True si los canales están listos
         """
-        if not self.active:
+        if self.channels:
+            return True
+        if not init_audio():
             return False
-        
-        # Update position / Actualizar posición
-        self.x += self.speed_x * dt
-        self.y += self.speed_y * dt
-        
-        # Decrease lifetime / Disminuir vida
-        self.life -= dt
-        
-        if self.life <= 0:
-            self.active = False
-        
-        return self.active
+        reserved = sum(count for count, _ in self.categories.values())
+        # Keep a few unreserved channels for Sound.play() callers / Dejar canales libres para Sound.play()
+        pygame.mixer.set_num_channels(max(pygame.mixer.get_num_channels(), reserved + 4))
+        pygame.mixer.set_reserved(reserved)
+        index = 0
+        for name, (count, _) in self.categories.items():
+            self.channels[name] = [pygame.mixer.Channel(index + i) for i in range(count)]
+            index += count
+        return True
     
-    def draw(self, surface):
+    def begin_frame(self):
+        """Reset per-frame counters. / Reiniciar contadores por fotograma."""
+        self.started = self.dropped = self.stolen = 0
+    
+    def _drop(self):
+        self.dropped += 1
+        self.total_dropped += 1
+        return False
+    
+    def play(self, sound, category):
         """
-        Render particle with alpha fade.
-        Renderizar partícula con desvanecimiento alfa.
+        Play a sound in a category, stealing a voice if needed.
+        Reproducir un sonido en una categoría, robando una voz si es necesario.
         
-        Args / Argumentos:
-            surface (pygame.Surface): Target surface / Superficie objetivo
+        Returns / Retorna:
+            bool: True if the sound started / True si el sonido comenzó
         """
-        if not self.active:
-            return
-        
-        # Calculate alpha based on remaining life / Calcular alfa basado en vida restante
-        alpha_ratio = max(0.0, min(1.0, self.life / self.initial_life if self.initial_life else 0.0))
-        alpha = int(255 * alpha_ratio)
-        
-        if alpha <= 0:
-            return
-        
-        # Create RGBA color with alpha / Crear color RGBA con alfa
-        color = (*self.color[:3], alpha)
-        
-        # Draw fading circle / Dibujar círculo desvaneciente
-        surf = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-        pygame.draw.circle(surf, color, (self.size // 2, self.size // 2), self.size // 2)
-        surface.blit(surf, (int(self.x), int(self.y)))
-class ParticlePool:
+        if sound is None or not self.setup():
+            return False
+        now = time.perf_counter()
+        if now - self._last_played.get(sound, -1.0) < self.repeat_window:
+            return self._drop()  # Same sound just started / El mismo sonido acaba de empezar
+        priority = self.categories[category][1]
+        channel = next((c for c in self.channels[category] if not c.get_busy()), None)
+        if channel is None:
+            eligible = [c for name, (_, p) in self.categories.items() if p <= priority for c in self.channels[name]]
+            # Any idle channel of an equal or lower priority category / Cualquier canal libre de prioridad igual o menor
+            channel = next((c for c in eligible if not c.get_busy()), None)
+        if channel is None:
+            # Steal the lowest-priority playing voice, oldest on ties
+            # Robar la voz sonando de menor prioridad, la más antigua si empatan
+            candidates = [(self._voices.get(c, (-1, 0.0)), c) for c in eligible]
+            if not candidates:
+                return self._drop()
+            (victim_priority, _), channel = min(candidates, key=lambda item: item[0])
+            if victim_priority > priority:
+                return self._drop()
+            self.stolen += 1
+        channel.play(sound)
+        self._voices[channel] = (priority, now)
+        self._last_played[sound] = now
+        self.started += 1
+        self.total_started += 1
+        return True
+
+# Background music: A minor pentatonic over an Am-F-C-G bass line, eighth-note arpeggio
+# Música de fondo: pentatónica de La menor sobre bajo Am-F-C-G, arpegio en corcheas
+MUSIC_SCALE = (220.0, 261.63, 293.66, 329.63, 392.0, 440.0, 523.25, 587.33)
+MUSIC_PATTERN = (0, 2, 4, 5, 7, 5, 4, 2, 0, 3, 4, 6, 7, 6, 4, 3)  # Indices into MUSIC_SCALE / Índices en MUSIC_SCALE
+MUSIC_BASS = (110.0, 87.31, 130.81, 98.0)  # One root per bar / Una raíz por compás
+MUSIC_BASE_BPM = 96.0
+
+def music_chunks(sample_rate=44100, channels=2, chunk_seconds=0.5, volume=0.12):
     """
-    Object pool for particle reuse (performance optimization).
-    Pool de objetos para reutilización de partículas (optimización de rendimiento).
+    Generator of fixed-size music chunks, synthesized with sines like create_sound.
+    Generador de fragmentos de música de tamaño fijo, sintetizados con senos como create_sound.
     
-    Why? / ¿Por qué?:
-        Creating new objects every frame is slow
-        Crear nuevos objetos cada cuadro es lento
-        Reusing existing objects is ~10x faster
-        Reutilizar objetos existentes es ~10x más rápido
+    Prime with next(), then send the tempo (BPM) for each chunk. Phases carry over
+    between chunks so notes never click, and every chunk is written into the same
+    preallocated buffer, so memory stays constant however long it plays.
+    Iniciar con next() y luego enviar el tempo (BPM) de cada fragmento. Las fases se
+    conservan entre fragmentos y cada uno se escribe en el mismo buffer preasignado,
+    así la memoria es constante sin importar cuánto suene.
+    
+    Yields / Produce:
+        np.ndarray: (samples, channels) int16 view, valid until the next send / válida hasta el siguiente send
+    """
+    n = int(sample_rate * chunk_seconds)
+    buffer = np.empty((n, channels), dtype=np.int16)
+    beat_pos = np.empty(n)
+    mix = np.empty(n)
+    work = np.empty(n)
+    scale = np.asarray(MUSIC_SCALE)
+    pattern = scale[np.asarray(MUSIC_PATTERN)]
+    bass = np.asarray(MUSIC_BASS)
+    beat = lead_phase = bass_phase = 0.0
+    bpm = yield None
+    while True:
+        # Beat position of every sample (tempo fixed within a chunk) / Posición de pulso de cada muestra
+        np.multiply(np.arange(n), bpm / 60.0 / sample_rate, out=beat_pos)
+        beat_pos += beat
+        eighth = (beat_pos * 2).astype(np.int64)
+        
+        # Lead: eighth-note arpeggio with plucked decay / Melodía: arpegio en corcheas con decaimiento
+        np.multiply(pattern[eighth % len(pattern)], 2 * np.pi / sample_rate, out=work)
+        np.cumsum(work, out=work)
+        work += lead_phase
+        lead_phase = work[-1] % (2 * np.pi)
+        np.sin(work, out=mix)
+        np.multiply(beat_pos, 2, out=work)
+        work -= eighth
+        mix *= np.exp(-4.0 * work)
+        
+        # Bass: bar root an octave down, steady level / Bajo: raíz del compás, nivel constante
+        np.multiply(bass[(beat_pos // 4).astype(np.int64) % len(bass)], 2 * np.pi / sample_rate, out=work)
+        np.cumsum(work, out=work)
+        work += bass_phase
+        bass_phase = work[-1] % (2 * np.pi)
+        mix += 0.6 * np.sin(work)
+        
+        mix *= 32767 * volume / 1.6
+        buffer[...] = mix[:, None]
+        beat = beat_pos[-1] + bpm / 60.0 / sample_rate
+        bpm = yield buffer
+
+class MusicStream:
+    """
+    Feeds music_chunks to the reserved music channel just in time (Channel.queue).
+    Alimenta music_chunks al canal de música reservado justo a tiempo (Channel.queue).
+    
+    At most two chunks exist as Sounds (playing + queued); generation cost is tracked
+    in `chunk_ms` (last) and `avg_chunk_ms` (exponential average).
+    Como máximo existen dos fragmentos como Sounds (sonando + en cola); el costo de
+    generación se mide en `chunk_ms` (último) y `avg_chunk_ms` (promedio exponencial).
     """
     
-    def __init__(self, initial_size=256):
+    def __init__(self, voices, chunk_seconds=0.5):
         """
-        Create pool of reusable particles.
-        Crear pool de partículas reutilizables.
-        
         Args / Argumentos:
-            initial_size (int): Number of particles to pre-allocate / Número de partículas a pre-asignar
-        """
-        self._pool = [Particle() for _ in range(initial_size)]
+            voices (VoiceManager): Provides the reserved 'music' channel / Provee el canal 'music' reservado
+            chunk_seconds (float): Chunk length / Duración del fragmento
+        """
+        self.voices = voices
+        self.chunk_seconds = chunk_seconds
+        self.bpm = MUSIC_BASE_BPM
+        self.chunk_ms = 0.0
+        self.avg_chunk_ms = 0.0
+        self.chunks = 0
+        self._generator = None
     
-    def acquire(self):
-        """
-        Get particle from pool or create new one.
-        Obtener partícula del pool o crear una nueva.
-        
-        Returns / Retorna:
-            Particle: Reusable particle / Partícula reutilizable
-        """
-        if self._pool:
-            return self._pool.pop()  # Reuse from pool / Reutilizar del pool
-        return Particle()  # Create new if pool empty / Crear nueva si pool vacío
+    def _next_sound(self):
+        if self._generator is None:
+            sample_rate, _, channels = mixer_format()
+            self._generator = music_chunks(sample_rate, channels, self.chunk_seconds)
+            next(self._generator)
+        start = time.perf_counter()
+        sound = pygame.mixer.Sound(buffer=mixer_samples(self._generator.send(self.bpm)))
+        self.chunk_ms = (time.perf_counter() - start) * 1000
+        self.avg_chunk_ms = self.chunk_ms if not self.chunks else self.avg_chunk_ms * 0.9 + self.chunk_ms * 0.1
+        self.chunks += 1
+        return sound
     
-    def release(self, particle: Particle):
+    def update(self, bpm):
         """
-        Return particle to pool for reuse.
-        Devolver partícula al pool para reutilizar.
-        
-        Args / Argumentos:
-            particle (Particle): Particle to return / Partícula a devolver
+        Keep one chunk queued behind the playing one (call once per frame).
+        Mantener un fragmento en cola detrás del que suena (llamar una vez por fotograma).
         """
-        particle.active = False
-        self._pool.append(particle)
-class ScoreBurst:
+        if not self.voices.setup():
+            return
+        self.bpm = bpm
+        channel = self.voices.channels['music'][0]
+        if not channel.get_busy():
+            channel.play(self._next_sound())
+        if channel.get_queue() is None:
+            channel.queue(self._next_sound())
+    
+    def stop(self):
+        """Silence the music channel. / Silenciar el canal de música."""
+        if self.voices.channels:
+            self.voices.channels['music'][0].stop()
+# ============================================================================
+# OBJECT POOLING / AGRUPACIÓN DE OBJETOS
+# Reuse transient entities instead of reallocating / Reutilizar entidades transitorias en vez de reasignarlas
+# ============================================================================
+
+class ObjectPool:
     """
-    Expanding ring effect when scoring.
-    Efecto de anillo expansivo al anotar.
+    Instrumented free-list pool for one entity class.
+    Pool de lista libre instrumentado para una clase de entidad.
+    
+    Pooled classes take the same arguments in __init__ and reset(); acquire() calls
+    whichever applies. Idle objects beyond the recent high watermark are dropped by trim().
+    Las clases agrupadas aceptan los mismos argumentos en __init__ y reset(); acquire()
+    llama al que corresponda. trim() descarta objetos inactivos sobre la marca máxima reciente.
     """
     
-    def __init__(self, x, y, base_color):
+    def __init__(self, cls, capacity=16):
         """
-        Create score burst effect.
-        Crear efecto de ráfaga de puntaje.
-        
         Args / Argumentos:
-            x, y (float): Center position / Posición central
-            base_color (tuple): RGB color / Color RGB
+            cls (type): Pooled class, must define reset() / Clase agrupada, debe definir reset()
+            capacity (int): Max objects kept (live + idle) / Máximo de objetos retenidos (vivos + inactivos)
+        """
+        self.cls = cls
+        self.capacity = capacity
+        self._free = []
+        self.in_use = 0
+        self.acquired = 0   # acquire() calls / llamadas a acquire()
+        self.released = 0   # release() calls / llamadas a release()
+        self.created = 0    # New instances / Instancias nuevas
+        self.peak = 0       # Max simultaneous live / Máximo de vivos simultáneos
+        self._window_peak = 0  # Peak since last trim() / Máximo desde el último trim()
+    
+    def __len__(self):
+        return len(self._free)
+    
+    def acquire(self, *args, **kwargs):
         """
-        self.x = float(x)
-        self.y = float(y)
-        self.base_color = base_color
-        self.radius = 12.0  # Starting radius / Radio inicial
-        self.max_radius = 160.0  # Maximum expansion / Expansión máxima
-        self.life = 0.45  # Duration in seconds / Duración en segundos
+        Take an idle object (reset with args) or create one.
+        Tomar un objeto inactivo (reseteado con args) o crear uno.
+        """
+        if self._free:
+            obj = self._free.pop()
+            obj.reset(*args, **kwargs)
+        else:
+            obj = self.cls(*args, **kwargs)
+            self.created += 1
+        self.acquired += 1
+        self.in_use += 1
+        self.peak = max(self.peak, self.in_use)
+        self._window_peak = max(self._window_peak, self.in_use)
+        return obj
     
-    def update(self, dt):
-        """Update effect (expand and fade). / Actualizar efecto (expandir y desvanecer)."""
-        self.radius += 320.0 * dt  # Expand / Expandir
-        self.life -= dt  # Fade / Desvanecer
+    def release(self, obj):
+        """Return obj; dropped if the pool is at capacity. / Devolver obj; se descarta si el pool está lleno."""
+        self.released += 1
+        self.in_use -= 1
+        if self.in_use + len(self._free) < self.capacity:
+            self._free.append(obj)
     
-    def alive(self):
-        """Check if still active. / Verificar si aún está activo."""
-        return self.life > 0
+    def release_all(self, objs):
+        """Release every object in a list and empty it. / Liberar todos los objetos de una lista y vaciarla."""
+        for obj in objs:
+            self.release(obj)
+        objs.clear()
     
-    def draw(self, surface):
+    def trim(self):
         """
-        Render expanding ring with additive blending.
-        Renderizar anillo expansivo con mezcla aditiva.
-        
-        Args / Argumentos:
-            surface (pygame.Surface): Target surface / Superficie objetivo
+        Shrink idle objects to the high watermark since the last trim.
+        Reducir los objetos inactivos a la marca máxima desde el último trim.
         """
-        if self.life <= 0:
-            return
-        
-        # Calculate fade progress (0.0 = start, 1.0 = end)
-        # Calcular progreso de desvanecimiento (0.0 = inicio, 1.0 = fin)
-        progress = max(0.0, min(1.0, 1.0 - self.life / 0.45))
-        
-        # Fade alpha over time / Desvanecer alfa con el tiempo
-        alpha_outer = int(140 * max(0.0, 1.0 - progress))
-        alpha_inner = int(220 * max(0.0, 1.0 - progress * 1.1))
-        
-        # Calculate radii / Calcular radios
-        radius_outer = int(min(self.max_radius, self.radius * 1.6))
-        radius_inner = int(min(self.max_radius, self.radius))
-        
-        # Create temporary surface for ring / Crear superficie temporal para anillo
-        size = radius_outer * 2 + 4
-        burst_surf = pygame.Surface((size, size), pygame.SRCALPHA)
-        center = size // 2
-        
-        # Draw outer ring / Dibujar anillo exterior
-        if alpha_outer > 0 and radius_outer > 0:
-            pygame.draw.circle(burst_surf, (*self.base_color, alpha_outer), (center, center), radius_outer, width=4)
-        
-        # Draw inner core / Dibujar núcleo interior
-        if alpha_inner > 0 and radius_inner > 0:
-            core_color = (
-                min(255, self.base_color[0] + 30),
-                min(255, self.base_color[1] + 30),
-                min(255, self.base_color[2] + 30),
-                alpha_inner
-            )
-            pygame.draw.circle(burst_surf, core_color, (center, center), radius_inner // 3)
-        
-        # Blit with additive blending for glow effect / Blit con mezcla aditiva para efecto de brillo
-        surface.blit(burst_surf, (self.x - center, self.y - center), special_flags=pygame.BLEND_ADD)
+        keep = max(0, self._window_peak - self.in_use)
+        del self._free[keep:]
+        self._window_peak = self.in_use
+    
+    def stats(self):
+        """Counter snapshot. / Instantánea de contadores."""
+        return {'in_use': self.in_use, 'idle': len(self._free), 'acquired': self.acquired,
+                'released': self.released, 'created': self.created, 'peak': self.peak}
+
 # ============================================================================
-# GAME ENTITIES / ENTIDADES DEL JUEGO
-# Paddle and Ball classes / Clases de Paleta y Bola
+# QUALITY GOVERNOR / GOBERNADOR DE CALIDAD
+# Trade visual effects for frame time / Cambiar efectos visuales por tiempo de fotograma
 # ============================================================================
 
-class Paddle:
+# Quality tiers, best first / Niveles de calidad, el mejor primero
+#   particle_scale: burst size multiplier / multiplicador de tamaño de ráfaga
+#   trail_length: ball trail positions / posiciones de la estela de la bola
+#   glow: glow surfaces on paddles, ball and power-ups / superficies de brillo en paletas, bola y power-ups
+#   post_effects: additive / full-screen effects (splat, bloom) / efectos aditivos / de pantalla completa (splat, bloom)
+QUALITY_TIERS = (
+    {'name': 'high',    'particle_scale': 1.0,  'trail_length': 10, 'glow': True,  'post_effects': True},
+    {'name': 'medium',  'particle_scale': 0.6,  'trail_length': 6,  'glow': True,  'post_effects': False},
+    {'name': 'low',     'particle_scale': 0.35, 'trail_length': 3,  'glow': False, 'post_effects': False},
+    {'name': 'minimal', 'particle_scale': 0.15, 'trail_length': 0,  'glow': False, 'post_effects': False},
+)
+
+class QualityGovernor:
     """
-    Player or AI paddle.
-    Paleta del jugador o IA.
+    Steps QUALITY_TIERS down/up from a rolling percentile of frame work time.
+    Baja/sube QUALITY_TIERS según un percentil móvil del tiempo de trabajo por fotograma.
+    
+    Hysteresis / Histéresis:
+        Step down as soon as one window is over budget; step up only after several
+        consecutive windows with clear headroom. Samples restart after every change.
+        Baja en cuanto una ventana excede el presupuesto; sube solo tras varias
+        ventanas consecutivas con margen claro. Las muestras se reinician tras cada cambio.
     """
     
-    def __init__(self, x, y, color, speed=PADDLE_SPEED):
+    def __init__(self, budget_ms=1000 / 60, window=60, percentile=90, down_ratio=0.9, up_ratio=0.5, up_windows=3):
         """
-        Create paddle.
-        Crear paleta.
-        
         Args / Argumentos:
-            x, y (float): Position / Posición
-            color (tuple): RGB color / Color RGB
-            speed (float): Movement speed in pixels/sec / Velocidad de movimiento en píxeles/seg
-        """
-        self.x = float(x)
-        self.y = float(y)
-        self.width = PADDLE_WIDTH
-        self.height = PADDLE_HEIGHT
-        self.speed = float(speed)
-        self.color = color
+            budget_ms (float): Frame budget / Presupuesto por fotograma
+            window (int): Frames per evaluation / Fotogramas por evaluación
+            percentile (float): Percentile compared to the budget / Percentil comparado con el presupuesto
+            down_ratio, up_ratio (float): Budget fractions to step down / up / Fracciones del presupuesto para bajar / subir
+            up_windows (int): Calm windows required to step up / Ventanas tranquilas para subir
+        """
+        self.budget_ms = budget_ms
+        self.percentile = percentile
+        self.down_ms = budget_ms * down_ratio
+        self.up_ms = budget_ms * up_ratio
+        self.up_windows = up_windows
+        self._samples = np.zeros(window, dtype=np.float32)
+        self._count = 0
+        self._calm = 0
+        self.level = 0          # Index into QUALITY_TIERS / Índice en QUALITY_TIERS
+        self.frame_ms = 0.0     # Last evaluated percentile / Último percentil evaluado
+        self.changes = 0
+        self.work_ms = None     # Last measured update+draw time / Último tiempo medido de actualización+dibujo
+        self._work_start = None
     
-    def get_rect(self):
-        """Get collision rectangle. / Obtener rectángulo de colisión."""
-        return pygame.Rect(int(self.x), int(self.y), self.width, self.height)
+    @property
+    def tier(self):
+        return QUALITY_TIERS[self.level]
     
-    def move(self, direction, dt):
+    def begin_work(self):
         """
-        Move paddle (clamped to screen).
-        Mover paleta (limitada a la pantalla).
-        
-        Args / Argumentos:
-            direction (float): -1 (up/arriba), +1 (down/abajo)
-            dt (float): Delta time / Delta de tiempo
+        Start timing a frame's update+draw (after clock.tick(), after any yield).
+        Empezar a medir la actualización+dibujo (tras clock.tick(), tras cualquier cesión).
         """
-        # Update position and clamp to screen bounds
-        # Actualizar posición y limitar a los bordes de la pantalla
-        self.y = max(0, min(SCREEN_HEIGHT - self.height, self.y + self.speed * direction * dt))
+        self._work_start = time.perf_counter()
     
-    def draw(self, screen):
+    def end_work(self):
+        """
+        Stop timing before the frame is presented, so vsync / flip waits are excluded.
+        Detener la medición antes de presentar, así se excluyen las esperas de vsync / flip.
+        """
+        if self._work_start is not None:
+            self.work_ms = (time.perf_counter() - self._work_start) * 1000.0
+            self._work_start = None
+    
+    def update(self, work_ms):
+        """
+        Record one frame's work time.
+        Registrar el tiempo de trabajo de un fotograma.
+        
+        Returns / Retorna:
+            bool: True if the tier changed / True si cambió el nivel
+        """
+        self._samples[self._count] = work_ms
+        self._count += 1
+        if self._count < len(self._samples):
+            return False
+        self._count = 0
+        self.frame_ms = float(np.percentile(self._samples, self.percentile))
+        if self.frame_ms > self.down_ms:
+            self._calm = 0
+            if self.level < len(QUALITY_TIERS) - 1:
+                return self._set_level(self.level + 1)
+        elif self.frame_ms < self.up_ms:
+            self._calm += 1
+            if self._calm >= self.up_windows and self.level > 0:
+                return self._set_level(self.level - 1)
+        else:
+            self._calm = 0  # Inside the dead band / Dentro de la banda muerta
+        return False
+    
+    def _set_level(self, level):
+        self.level = level
+        self._calm = 0
+        self.changes += 1
+        print(f"[Quality] Tier: {self.tier['name']} (p{self.percentile} {self.frame_ms:.1f} ms)")
+        return True
+
+# ============================================================================
+# PARTICLE SYSTEM / SISTEMA DE PARTÍCULAS
+# Visual effects for ball collisions / Efectos visuales para colisiones de bola
+# ============================================================================
+
+class ParticleSystem:
+    """
+    Structure-of-arrays particle engine: every attribute lives in a preallocated NumPy array.
+    Motor de partículas estructura-de-arreglos: cada atributo vive en un arreglo NumPy preasignado.
+    
+    Why? / ¿Por qué?:
+        One vectorized step integrates all particles instead of one method call each,
+        and dead slots are recycled through a free-index stack (no allocations per frame)
+        Un paso vectorizado integra todas las partículas en vez de una llamada por partícula,
+        y los huecos muertos se reciclan con una pila de índices libres (sin asignaciones)
+    """
+    
+    def __init__(self, capacity=2048, seed=None):
+        """
+        Args / Argumentos:
+            capacity (int): Maximum live particles / Máximo de partículas vivas
+            seed (int, optional): RNG seed / Semilla del generador aleatorio
+        """
+        self.capacity = capacity
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)    # x, y position / posición
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)    # Velocity px/s / Velocidad px/s
+        self.life = np.zeros(capacity, dtype=np.float32)        # Remaining lifetime / Vida restante
+        self.initial_life = np.ones(capacity, dtype=np.float32) # For alpha fade / Para desvanecimiento alfa
+        self.size = np.zeros(capacity, dtype=np.int16)          # Diameter in px / Diámetro en px
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)    # RGB color / Color RGB
+        self.alive = np.zeros(capacity, dtype=bool)
+        # Free-index stack; smallest index on top keeps live slots packed low
+        # Pila de índices libres; el menor arriba mantiene los vivos agrupados abajo
+        self._free = np.arange(capacity - 1, -1, -1, dtype=np.int32)
+        self._free_top = capacity
+        self._high = 0        # One past the highest live slot / Uno más que el mayor hueco vivo
+        self.overflow = 0     # Spawns dropped at capacity / Generaciones descartadas por capacidad
+        self.rng = np.random.default_rng(seed)
+    
+    def __len__(self):
+        return self.capacity - self._free_top
+    
+    def __bool__(self):
+        return self._free_top < self.capacity
+    
+    @property
+    def nbytes(self):
+        """Memory held by the arrays. / Memoria ocupada por los arreglos."""
+        return sum(a.nbytes for a in (self.pos, self.vel, self.life, self.initial_life, self.size, self.color, self.alive, self._free))
+    
+    def radial_velocities(self, count, speed_min, speed_max):
+        """
+        Random directions with speeds in [speed_min, speed_max).
+        Direcciones aleatorias con velocidades en [speed_min, speed_max).
+        
+        Returns / Retorna:
+            tuple: (vx, vy) arrays / arreglos (vx, vy)
+        """
+        angle = self.rng.random(count) * math.tau
+        speed = self.rng.uniform(speed_min, speed_max, count)
+        return np.cos(angle) * speed, np.sin(angle) * speed
+    
+    def emit(self, x, y, vx, vy, color, size, life):
+        """
+        Spawn len(vx) particles at once; other arguments may be scalars or per-particle arrays.
+        Generar len(vx) partículas a la vez; los demás argumentos pueden ser escalares o arreglos.
+        
+        Args / Argumentos:
+            x, y: Start position / Posición inicial
+            vx, vy: Velocities (arrays define the count) / Velocidades (los arreglos definen la cantidad)
+            color: RGB or (n, 3) / RGB o (n, 3)
+            size: Diameter(s) in px / Diámetro(s) en px
+            life: Lifetime(s) in seconds / Vida(s) en segundos
+        
+        Returns / Retorna:
+            int: Particles spawned (fewer if at capacity) / Partículas generadas (menos si se llena)
+        """
+        vx = np.atleast_1d(vx)
+        count = len(vx)
+        n = min(count, self._free_top)
+        self.overflow += count - n
+        if n == 0:
+            return 0
+        idx = self._free[self._free_top - n:self._free_top][::-1].copy()
+        self._free_top -= n
+        self.pos[idx, 0] = x if np.ndim(x) == 0 else np.asarray(x)[:n]
+        self.pos[idx, 1] = y if np.ndim(y) == 0 else np.asarray(y)[:n]
+        self.vel[idx, 0] = vx[:n]
+        self.vel[idx, 1] = np.atleast_1d(vy)[:n]
+        self.color[idx] = color if np.ndim(color) == 1 else np.asarray(color)[:n]
+        self.size[idx] = size if np.ndim(size) == 0 else np.asarray(size)[:n]
+        self.life[idx] = life if np.ndim(life) == 0 else np.asarray(life)[:n]
+        self.initial_life[idx] = self.life[idx]
+        self.alive[idx] = True
+        self._high = max(self._high, int(idx.max()) + 1)
+        return n
+    
+    def update(self, dt):
+        """
+        Integrate all live particles in one step and recycle the dead.
+        Integrar todas las partículas vivas en un paso y reciclar las muertas.
+        
+        Args / Argumentos:
+            dt (float): Delta time in seconds / Delta de tiempo en segundos
+        """
+        hw = self._high
+        if hw == 0:
+            return
+        alive = self.alive[:hw]
+        # Dead slots are integrated too; cheaper than masking / También se integran huecos muertos; más barato que enmascarar
+        self.pos[:hw] += self.vel[:hw] * np.float32(dt)
+        self.life[:hw] -= np.float32(dt)
+        dead = np.flatnonzero(alive & (self.life[:hw] <= 0))
+        if len(dead):
+            alive[dead] = False
+            self._free[self._free_top:self._free_top + len(dead)] = dead[::-1]
+            self._free_top += len(dead)
+            live = np.flatnonzero(alive)
+            self._high = int(live[-1]) + 1 if len(live) else 0
+    
+    def live_indices(self):
+        """Indices of live particles. / Índices de partículas vivas."""
+        return np.flatnonzero(self.alive[:self._high])
+    
+    def alphas(self, idx):
+        """Fade alpha (0-255) for particles idx. / Alfa de desvanecimiento (0-255) para idx."""
+        ratio = np.clip(self.life[idx] / np.maximum(self.initial_life[idx], 1e-6), 0.0, 1.0)
+        return (ratio * 255).astype(np.int32)
+    
+    def clear(self):
+        """Kill every particle. / Eliminar todas las partículas."""
+        self.alive[:] = False
+        self._free[:] = np.arange(self.capacity - 1, -1, -1, dtype=np.int32)
+        self._free_top = self.capacity
+        self._high = 0
+    
+    def draw(self, surface):
+        """
+        Render particles as fading circles.
+        Renderizar partículas como círculos que se desvanecen.
+        
+        Args / Argumentos:
+            surface (pygame.Surface): Target surface / Superficie objetivo
+        """
+        idx = self.live_indices()
+        if not len(idx):
+            return
+        alphas = self.alphas(idx)
+        keep = alphas > 0
+        idx, alphas = idx[keep], alphas[keep]
+        for (x, y), size, (r, g, b), alpha in zip(self.pos[idx].astype(np.int32).tolist(), self.size[idx].tolist(),
+                                                  self.color[idx].tolist(), alphas.tolist()):
+            # Draw fading circle / Dibujar círculo desvaneciente
+            surf = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(surf, (r, g, b, alpha), (size // 2, size // 2), size // 2)
+            surface.blit(surf, (x, y))
+
+class LegacyParticleRenderer:
+    """
+    Reference renderer: one temporary surface and circle per particle.
+    Renderizador de referencia: una superficie temporal y un círculo por partícula.
+    """
+    name = 'legacy'
+    
+    def draw(self, system, surface):
+        system.draw(surface)
+
+class AtlasParticleRenderer:
+    """
+    Pre-rendered sprites keyed by (size, quantized color, alpha bucket), drawn with one blits() call.
+    Sprites pre-renderizados indexados por (tamaño, color cuantizado, nivel de alfa), dibujados con una llamada a blits().
+    
+    Sprites are built the first time a key is seen and reused afterwards, so a
+    warm frame allocates no surfaces.
+    Los sprites se construyen la primera vez que aparece una clave y luego se reutilizan,
+    así un fotograma en caliente no asigna superficies.
+    """
+    name = 'atlas'
+    COLOR_SHIFT = 4    # 16 levels per channel / 16 niveles por canal
+    ALPHA_BUCKETS = 16
+    
+    def __init__(self):
+        self.sprites = {}  # packed key -> Surface / clave empaquetada -> Surface
+    
+    def _build(self, key):
+        """Render the sprite for a packed key. / Renderizar el sprite para una clave empaquetada."""
+        size = key >> 16
+        half = 1 << (self.COLOR_SHIFT - 1)
+        r, g, b = ((((key >> shift) & 0xF) << self.COLOR_SHIFT) + half for shift in (12, 8, 4))
+        alpha = min(255, int(((key & 0xF) + 0.5) * 256 / self.ALPHA_BUCKETS))
+        sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, (r, g, b, alpha), (size // 2, size // 2), size // 2)
+        self.sprites[key] = sprite
+        return sprite
+    
+    def draw(self, system, surface):
+        idx = system.live_indices()
+        if not len(idx):
+            return
+        alphas = system.alphas(idx)
+        keep = alphas > 0
+        idx, alphas = idx[keep], alphas[keep]
+        # Pack (size, r, g, b, alpha bucket) into one int per particle / Empaquetar en un entero por partícula
+        color = system.color[idx].astype(np.int64) >> self.COLOR_SHIFT
+        keys = ((system.size[idx].astype(np.int64) << 16) | (color[:, 0] << 12) | (color[:, 1] << 8)
+                | (color[:, 2] << 4) | (alphas * self.ALPHA_BUCKETS // 256))
+        sprites = self.sprites
+        build = self._build
+        positions = system.pos[idx].astype(np.int32).tolist()
+        surface.blits([(sprites.get(key) or build(key), pos) for key, pos in zip(keys.tolist(), positions)], doreturn=False)
+
+class SplatParticleRenderer:
+    """
+    Additive glow renderer: particles are scatter-added into a quarter-resolution
+    light grid with one NumPy bincount, blurred with a 5-tap binomial kernel, smoothscaled
+    up and blitted with BLEND_ADD.
+    Renderizador de brillo aditivo: las partículas se suman por dispersión en una rejilla
+    de luz a un cuarto de resolución con un solo bincount, se desenfocan, se amplían
+    con smoothscale y se dibujan con BLEND_ADD.
+    
+    Per-particle cost is one packed index and weight; everything else scales with the
+    bounding box at grid resolution, so dense bursts beat one blit per particle.
+    El costo por partícula es un índice empaquetado y un peso; el resto escala con la
+    caja envolvente a resolución de rejilla, así las ráfagas densas superan un blit por partícula.
+    """
+    name = 'splat'
+    additive = True  # Needs an opaque destination / Necesita un destino opaco
+    DOWNSAMPLE = 4     # Screen pixels per grid cell / Píxeles de pantalla por celda
+    GAIN = 2.5         # Compensates the blur spread / Compensa la dispersión del desenfoque
+    BOX_STEP = 16      # Box sizes snap to this many cells / Las cajas se ajustan a este múltiplo de celdas
+    SCALED_CACHE = 8   # Upscale targets kept / Destinos de ampliación guardados
+    
+    def __init__(self):
+        self._grid = None      # Opaque grid-resolution surface / Superficie opaca a resolución de rejilla
+        self._scaled = collections.OrderedDict()  # (w, h) -> upscale target / destino de ampliación
+    
+    @staticmethod
+    def _blur(light):
+        """[1, 4, 6, 4, 1] / 16 blur along both grid axes, in place. / Desenfoque binomial en ambos ejes, en el sitio."""
+        for axis in (0, 1):
+            data = np.moveaxis(light, axis, 0)
+            source = data.copy()
+            data *= 6.0
+            data[1:] += 4.0 * source[:-1]
+            data[:-1] += 4.0 * source[1:]
+            data[2:] += source[:-2]
+            data[:-2] += source[2:]
+            data *= 1.0 / 16.0
+    
+    def _target(self, size):
+        """Reusable smoothscale destination for a snapped box size. / Destino reutilizable de smoothscale."""
+        target = self._scaled.get(size)
+        if target is None:
+            target = self._scaled[size] = pygame.Surface(size)
+            while len(self._scaled) > self.SCALED_CACHE:
+                self._scaled.popitem(last=False)
+        else:
+            self._scaled.move_to_end(size)
+        return target
+    
+    def draw(self, system, surface, offset=(0, 0)):
+        """
+        Args / Argumentos:
+            system (ParticleSystem): Particles to draw / Partículas a dibujar
+            surface (pygame.Surface): Opaque target / Destino opaco
+            offset (tuple): Shift applied to the final blit (screen shake) / Desplazamiento del blit final (sacudida)
+        """
+        idx = system.live_indices()
+        if not len(idx):
+            return
+        down = self.DOWNSAMPLE
+        width, height = surface.get_size()
+        grid_w, grid_h = -(-width // down), -(-height // down)
+        if self._grid is None or self._grid.get_size() != (grid_w, grid_h):
+            self._grid = pygame.Surface((grid_w, grid_h))
+        # Grid cell of each particle center / Celda de la rejilla del centro de cada partícula
+        sizes = system.size[idx].astype(np.float32)
+        center = system.pos[idx] + sizes[:, None] * 0.5
+        cells = (center * (1.0 / down)).astype(np.int32)
+        inside = (cells[:, 0] >= 0) & (cells[:, 0] < grid_w) & (cells[:, 1] >= 0) & (cells[:, 1] < grid_h)
+        if not inside.all():
+            idx, sizes, cells = idx[inside], sizes[inside], cells[inside]
+            if not len(idx):
+                return
+        # Box at grid resolution, padded for the blur and snapped to BOX_STEP
+        # Caja a resolución de rejilla, con margen para el desenfoque y ajustada a BOX_STEP
+        pad = 2  # Kernel reach in cells / Alcance del kernel en celdas
+        step = self.BOX_STEP
+        x0, y0 = max(0, int(cells[:, 0].min()) - pad), max(0, int(cells[:, 1].min()) - pad)
+        box_w = min(grid_w - x0, -(-(int(cells[:, 0].max()) + pad + 1 - x0) // step) * step)
+        box_h = min(grid_h - y0, -(-(int(cells[:, 1].max()) + pad + 1 - y0) // step) * step)
+        # Light = color * alpha * covered cell area / Luz = color * alfa * área de celda cubierta
+        weight = system.alphas(idx) * (sizes * sizes * (self.GAIN / (255.0 * down * down)))
+        light = system.color[idx] * weight[:, None]
+        # One bincount over packed (cell, channel) indices / Un bincount sobre índices empaquetados (celda, canal)
+        slots = ((cells[:, 0] - x0) * box_h + (cells[:, 1] - y0)) * 3
+        packed = (slots[:, None] + np.arange(3)).ravel()
+        accum = np.bincount(packed, weights=light.ravel(), minlength=box_w * box_h * 3)
+        accum = accum.astype(np.float32).reshape(box_w, box_h, 3)
+        self._blur(accum)
+        np.minimum(accum, 255.0, out=accum)
+        pixels = pygame.surfarray.pixels3d(self._grid)
+        pixels[x0:x0 + box_w, y0:y0 + box_h] = accum
+        del pixels  # Unlock before scaling / Desbloquear antes de escalar
+        scaled_size = (box_w * down, box_h * down)
+        scaled = pygame.transform.smoothscale(self._grid.subsurface((x0, y0, box_w, box_h)), scaled_size,
+                                              self._target(scaled_size))
+        surface.blit(scaled, (x0 * down + offset[0], y0 * down + offset[1]), special_flags=pygame.BLEND_ADD)
+
+# Selectable particle renderers (F3 cycles) / Renderizadores de partículas seleccionables (F3 alterna)
+PARTICLE_RENDERERS = {renderer.name: renderer for renderer in (AtlasParticleRenderer, SplatParticleRenderer, LegacyParticleRenderer)}
+
+def benchmark_particles(counts=(1000, 10000, 20000), frames=120):
+    """
+    Report ParticleSystem update cost and each renderer's draw cost per frame at several live counts.
+    Reportar costo de actualización y de dibujo por renderizador por fotograma con varias cantidades.
+    
+    Returns / Retorna:
+        dict: count -> (update_ms, {renderer: draw_ms}) / cantidad -> (ms_actualización, {renderizador: ms_dibujo})
+    """
+    target = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+    renderers = [cls() for cls in PARTICLE_RENDERERS.values()]
+    results = {}
+    print(f"{'particles':>10}  {'update':>12}" + "".join(f"  {r.name + ' draw':>14}" for r in renderers))
+    for count in counts:
+        system = ParticleSystem(capacity=count, seed=1)
+        vx, vy = system.radial_velocities(count, 5, 20)
+        colors = system.rng.integers(0, 256, (count, 3))
+        system.emit(system.rng.uniform(0, SCREEN_WIDTH, count), system.rng.uniform(0, SCREEN_HEIGHT, count),
+                    vx, vy, colors, system.rng.integers(2, 6, count), 1e6)  # Long-lived / Larga vida
+        start = time.perf_counter()
+        for _ in range(frames):
+            system.update(1 / 60)
+        update_ms = (time.perf_counter() - start) * 1000 / frames
+        draw_ms = {}
+        for renderer in renderers:
+            renderer.draw(system, target)  # Warm sprite caches / Calentar cachés de sprites
+            draw_frames = max(1, frames // 20)
+            start = time.perf_counter()
+            for _ in range(draw_frames):
+                renderer.draw(system, target)
+            draw_ms[renderer.name] = (time.perf_counter() - start) * 1000 / draw_frames
+        results[count] = (update_ms, draw_ms)
+        print(f"{count:>10}  {update_ms:10.3f}ms" + "".join(f"  {draw_ms[r.name]:12.2f}ms" for r in renderers))
+    return results
+
+# ============================================================================
+# PARTICLE EMITTERS / EMISORES DE PARTÍCULAS
+# Data-driven burst presets / Preajustes de ráfagas basados en datos
+# ============================================================================
+
+# Burst presets; ranges are [min, max], color_jitter is per-channel [min, max] added to the base color
+# Preajustes de ráfaga; los rangos son [mín, máx], color_jitter es [mín, máx] por canal sumado al color base
+# Override any field from EMITTERS_FILE / Cualquier campo se puede sobrescribir desde EMITTERS_FILE
+EMITTER_PRESETS = {
+    'hit':             {'count': 12, 'speed': [60, 260],  'life': [0.35, 0.35], 'size': [2, 5], 'color_jitter': [[-20, 40], [-20, 40], [-20, 40]]},
+    'score':           {'count': 28, 'speed': [180, 420], 'life': [0.28, 0.55], 'size': [3, 7], 'color_jitter': [[-15, 35], [-20, 20], [-30, 30]]},
+    'shield_break':    {'count': 40, 'speed': [100, 300], 'life': [0.6, 0.6],   'size': [4, 4], 'color_jitter': [[0, 0], [0, 0], [0, 0]]},
+    'powerup_spawn':   {'count': 15, 'speed': [50, 150],  'life': [0.5, 0.5],   'size': [3, 3], 'color_jitter': [[0, 0], [0, 0], [0, 0]]},
+    'powerup_collect': {'count': 25, 'speed': [100, 300], 'life': [0.3, 0.6],   'size': [2, 5], 'color_jitter': [[0, 0], [0, 0], [0, 0]]},
+}
+
+def load_emitter_presets(path=None):
+    """
+    Built-in presets merged with optional JSON overrides (desktop only).
+    Preajustes incluidos combinados con sobrescrituras JSON opcionales (solo escritorio).
+    
+    Args / Argumentos:
+        path (Path, optional): Override file, defaults to EMITTERS_FILE / Archivo de sobrescritura
+    
+    Returns / Retorna:
+        dict: Preset name -> preset dict / Nombre -> diccionario de preajuste
+    """
+    presets = {name: dict(preset) for name, preset in EMITTER_PRESETS.items()}
+    path = EMITTERS_FILE if path is None else path
+    try:
+        if path is not None and path.exists():
+            with open(path, 'r') as f:
+                data = json.load(f)
+            if isinstance(data, dict):
+                for name, fields in data.items():
+                    if not isinstance(fields, dict):
+                        continue
+                    # Unknown names become new presets / Nombres desconocidos se vuelven preajustes nuevos
+                    merged = {**presets.get(name, EMITTER_PRESETS['hit']), **fields}
+                    try:
+                        Emitter.from_preset(merged)  # Validate shapes and ranges / Validar formas y rangos
+                    except (KeyError, TypeError, ValueError, IndexError):
+                        print(f"[Particles] Ignoring invalid emitter preset: {name}")
+                        continue
+                    presets[name] = merged
+    except (json.JSONDecodeError, IOError, ValueError):
+        print(f"[Particles] Ignoring invalid emitter file: {path}")
+    return presets
+
+class Emitter:
+    """
+    Spawns a whole particle burst from one preset with a single RNG draw.
+    Genera una ráfaga completa de partículas desde un preajuste con una sola tirada aleatoria.
+    """
+    
+    def __init__(self, count, speed, life, size, color_jitter):
+        """
+        Args / Argumentos:
+            count (int): Particles per burst / Partículas por ráfaga
+            speed, life, size: [min, max] ranges / Rangos [mín, máx]
+            color_jitter: Per-channel [min, max] offsets / Desplazamientos [mín, máx] por canal
+        
+        Raises / Lanza:
+            ValueError: Negative count, sizes or lifetimes, or a range with min > max
+                        Cantidad, tamaños o vidas negativos, o un rango con mín > máx
+        """
+        self.count = int(count)
+        if self.count < 0:
+            raise ValueError(f"count must be >= 0, got {count}")
+        for name, (low_value, high_value) in (('speed', speed), ('life', life), ('size', size)):
+            if low_value > high_value:
+                raise ValueError(f"{name} range has min > max: {[low_value, high_value]}")
+        if life[0] <= 0 or size[0] < 0:
+            raise ValueError(f"life must be > 0 and size >= 0, got life {life}, size {size}")
+        # Column order of the random draw: angle, speed, life, size, r, g, b
+        # Orden de columnas de la tirada: ángulo, velocidad, vida, tamaño, r, g, b
+        jitter = np.asarray(color_jitter, dtype=np.float32).reshape(3, 2)
+        if np.any(jitter[:, 0] > jitter[:, 1]):
+            raise ValueError(f"color_jitter range has min > max: {color_jitter}")
+        low = np.array([0.0, speed[0], life[0], size[0], *jitter[:, 0]], dtype=np.float32)
+        high = np.array([math.tau, speed[1], life[1], size[1] + 1, *(jitter[:, 1] + 1)], dtype=np.float32)
+        self._low = low
+        self._span = high - low
+    
+    @classmethod
+    def from_preset(cls, preset):
+        return cls(preset['count'], preset['speed'], preset['life'], preset['size'], preset['color_jitter'])
+    
+    def emit(self, system, x, y, color, count=None):
+        """
+        Spawn one burst into system.
+        Generar una ráfaga en system.
+        
+        Args / Argumentos:
+            system (ParticleSystem): Target system / Sistema objetivo
+            x, y (float): Origin / Origen
+            color (tuple): Base RGB color / Color RGB base
+            count (int, optional): Override the preset count / Sobrescribir la cantidad del preajuste
+        
+        Returns / Retorna:
+            int: Particles spawned / Partículas generadas
+        """
+        count = self.count if count is None else count
+        sample = self._low + system.rng.random((count, 7), dtype=np.float32) * self._span
+        angle, speed = sample[:, 0], sample[:, 1]
+        colors = np.clip(np.asarray(color[:3], dtype=np.float32) + np.floor(sample[:, 4:7]), 0, 255)
+        return system.emit(x, y, np.cos(angle) * speed, np.sin(angle) * speed,
+                           colors, np.floor(sample[:, 3]), sample[:, 2])
+
+def build_emitters(presets=None):
+    """Compile presets into Emitters. / Compilar preajustes en Emitters."""
+    presets = load_emitter_presets() if presets is None else presets
+    return {name: Emitter.from_preset(preset) for name, preset in presets.items()}
+
+SCORE_BURST_COLORS = (ORANGE,)  # Burst colors pre-rendered at load / Colores de ráfaga pre-renderizados en la carga
+
+class ScoreBurst:
+    """
+    Expanding ring effect when scoring.
+    Efecto de anillo expansivo al anotar.
+    
+    The ring animation is pre-rendered once per color into a frame sequence and
+    played back by elapsed life, so each burst costs one blit per frame.
+    La animación del anillo se pre-renderiza una vez por color en una secuencia de
+    fotogramas y se reproduce según la vida transcurrida: un blit por ráfaga.
+    """
+    LIFETIME = 0.45       # Duration in seconds / Duración en segundos
+    FRAME_RATE = 60       # Pre-rendered frames per second / Fotogramas pre-renderizados por segundo
+    START_RADIUS = 12.0   # Starting radius / Radio inicial
+    MAX_RADIUS = 160.0    # Maximum expansion / Expansión máxima
+    GROWTH = 320.0        # Expansion in pixels/sec / Expansión en píxeles/seg
+    frames = {}           # color -> [(Surface, center) or None] / color -> [(Surface, centro) o None]
+    
+    def __init__(self, x, y, base_color):
+        """
+        Create score burst effect.
+        Crear efecto de ráfaga de puntaje.
+        
+        Args / Argumentos:
+            x, y (float): Center position / Posición central
+            base_color (tuple): RGB color / Color RGB
+        """
+        self.reset(x, y, base_color)
+    
+    def reset(self, x, y, base_color):
+        """Restart the effect (pool reuse). / Reiniciar el efecto (reutilización del pool)."""
+        self.x = float(x)
+        self.y = float(y)
+        self.base_color = base_color
+        self.life = self.LIFETIME
+    
+    def update(self, dt):
+        """Update effect (expand and fade). / Actualizar efecto (expandir y desvanecer)."""
+        self.life -= dt
+    
+    def alive(self):
+        """Check if still active. / Verificar si aún está activo."""
+        return self.life > 0
+    
+    @classmethod
+    def render_frames(cls, base_color):
+        """
+        Pre-render the ring animation for one color.
+        Pre-renderizar la animación del anillo para un color.
+        
+        Args / Argumentos:
+            base_color (tuple): RGB color / Color RGB
+        
+        Returns / Retorna:
+            list: (Surface, center) per frame, None for empty frames / (Superficie, centro) por fotograma, None si vacío
+        """
+        frames = []
+        count = math.ceil(cls.LIFETIME * cls.FRAME_RATE)
+        for index in range(count):
+            elapsed = index / cls.FRAME_RATE
+            # Fade progress (0.0 = start, 1.0 = end) / Progreso de desvanecimiento (0.0 = inicio, 1.0 = fin)
+            progress = min(1.0, elapsed / cls.LIFETIME)
+            alpha_outer = int(140 * max(0.0, 1.0 - progress))
+            alpha_inner = int(220 * max(0.0, 1.0 - progress * 1.1))
+            
+            radius = cls.START_RADIUS + cls.GROWTH * elapsed
+            radius_outer = int(min(cls.MAX_RADIUS, radius * 1.6))
+            radius_inner = int(min(cls.MAX_RADIUS, radius))
+            if alpha_outer <= 0 and alpha_inner <= 0:
+                frames.append(None)
+                continue
+            
+            size = radius_outer * 2 + 4
+            burst_surf = pygame.Surface((size, size), pygame.SRCALPHA)
+            center = size // 2
+            
+            # Outer ring / Anillo exterior
+            if alpha_outer > 0 and radius_outer > 0:
+                pygame.draw.circle(burst_surf, (*base_color, alpha_outer), (center, center), radius_outer, width=4)
+            
+            # Inner core / Núcleo interior
+            if alpha_inner > 0 and radius_inner > 0:
+                core_color = (
+                    min(255, base_color[0] + 30),
+                    min(255, base_color[1] + 30),
+                    min(255, base_color[2] + 30),
+                    alpha_inner
+                )
+                pygame.draw.circle(burst_surf, core_color, (center, center), radius_inner // 3)
+            frames.append((burst_surf, center))
+        return frames
+    
+    def draw(self, surface):
+        """
+        Blit the pre-rendered frame for the elapsed life with additive blending.
+        Dibujar el fotograma pre-renderizado de la vida transcurrida con mezcla aditiva.
+        
+        Args / Argumentos:
+            surface (pygame.Surface): Target surface / Superficie objetivo
+        """
+        if self.life <= 0:
+            return
+        frames = self.frames.get(self.base_color)
+        if frames is None:
+            # Color not baked at load time / Color no pre-renderizado en la carga
+            frames = self.frames[self.base_color] = self.render_frames(self.base_color)
+        index = round((self.LIFETIME - self.life) * self.FRAME_RATE)  # Nearest frame / Fotograma más cercano
+        frame = frames[index] if index < len(frames) else None
+        if frame is None:
+            return
+        burst_surf, center = frame
+        # Additive blending for glow effect / Mezcla aditiva para efecto de brillo
+        surface.blit(burst_surf, (self.x - center, self.y - center), special_flags=pygame.BLEND_ADD)
+
+# ============================================================================
+# GLOW SPRITES / SPRITES DE BRILLO
+# Shared translucent shapes for entity glows / Formas translúcidas compartidas para brillos
+# ============================================================================
+
+GLOW_CACHE_SIZE = 64      # Max cached glow sprites / Máximo de sprites de brillo en caché
+GLOW_RADIUS_STEPS = 8     # Power-up glow pulse steps / Pasos del pulso de brillo de power-ups
+
+class GlowSpriteCache:
+    """
+    LRU cache of glow sprites keyed by (shape, size, color, alpha).
+    Caché LRU de sprites de brillo indexados por (forma, tamaño, color, alpha).
+    
+    Shapes / Formas:
+        'rect':   rounded rect of size (w, h) with an 8 px margin / rectángulo redondeado con margen de 8 px
+        'circle': filled circle of diameter size / círculo relleno de diámetro size
+        'icon':   active-effect HUD icon of diameter size / ícono del HUD de efectos activos
+    """
+    
+    def __init__(self, capacity=GLOW_CACHE_SIZE):
+        self.capacity = capacity
+        self._entries = collections.OrderedDict()  # key -> Surface / clave -> Surface
+        self.hits = 0
+        self.misses = 0
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    @staticmethod
+    def _build(shape, size, color, alpha):
+        """Draw one glow sprite. / Dibujar un sprite de brillo."""
+        if shape == 'rect':
+            width, height = size
+            sprite = pygame.Surface((width + 16, height + 16), pygame.SRCALPHA)
+            pygame.draw.rect(sprite, (*color, alpha), (8, 8, width, height), border_radius=8)
+        elif shape == 'circle':
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (*color, alpha), (size // 2, size // 2), size // 2)
+        elif shape == 'icon':
+            sprite = pygame.Surface((size, size), pygame.SRCALPHA)
+            pygame.draw.circle(sprite, (*color, alpha), (size // 2, size // 2), size // 2 - 2)
+            pygame.draw.circle(sprite, (255, 255, 255, 100), (size // 2, size // 2), size // 4)
+        else:
+            raise ValueError(f"Unknown glow shape: {shape}")
+        return sprite
+    
+    def get(self, shape, size, color, alpha):
+        """
+        Return the shared sprite for a glow, building it on first use.
+        Retornar el sprite compartido de un brillo, construyéndolo en el primer uso.
+        
+        Args / Argumentos:
+            shape (str): 'rect', 'circle' or 'icon' / 'rect', 'circle' o 'icon'
+            size (int | tuple): Diameter or (w, h) / Diámetro o (ancho, alto)
+            color (tuple): RGB color / Color RGB
+            alpha (int): Sprite alpha / Alpha del sprite
+        
+        Returns / Retorna:
+            pygame.Surface: Shared surface, do not modify / Superficie compartida, no modificar
+        """
+        key = (shape, size, tuple(color[:3]), alpha)
+        sprite = self._entries.get(key)
+        if sprite is not None:
+            self.hits += 1
+            self._entries.move_to_end(key)
+            return sprite
+        self.misses += 1
+        sprite = self._entries[key] = self._build(shape, size, key[2], alpha)
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+        return sprite
+    
+    def discard(self, shape, size):
+        """
+        Drop every sprite of one shape and size (e.g. after a paddle resize).
+        Descartar todos los sprites de una forma y tamaño (p. ej. tras redimensionar una paleta).
+        """
+        for key in [key for key in self._entries if key[:2] == (shape, size)]:
+            del self._entries[key]
+    
+    def clear(self):
+        """Drop every sprite. / Descartar todos los sprites."""
+        self._entries.clear()
+
+glow_sprites = GlowSpriteCache()  # Shared by entities and HUD / Compartido por entidades y HUD
+
+# ============================================================================
+# GAME ENTITIES / ENTIDADES DEL JUEGO
+# Paddle and Ball classes / Clases de Paleta y Bola
+# ============================================================================
+
+class Paddle:
+    """
+    Player or AI paddle.
+    Paleta del jugador o IA.
+    """
+    
+    def __init__(self, x, y, color, speed=PADDLE_SPEED):
+        """
+        Create paddle.
+        Crear paleta.
+        
+        Args / Argumentos:
+            x, y (float): Position / Posición
+            color (tuple): RGB color / Color RGB
+            speed (float): Movement speed in pixels/sec / Velocidad de movimiento en píxeles/seg
+        """
+        self.x = float(x)
+        self.y = float(y)
+        self.width = PADDLE_WIDTH
+        self._height = PADDLE_HEIGHT
+        self.speed = float(speed)
+        self.color = color
+    
+    @property
+    def height(self):
+        """Paddle height in pixels. / Altura de la paleta en píxeles."""
+        return self._height
+    
+    @height.setter
+    def height(self, value):
+        # A resize (big_paddle) retires the old glow sprite
+        # Un cambio de tamaño (big_paddle) retira el sprite de brillo anterior
+        if value != self._height:
+            glow_sprites.discard('rect', (self.width, int(self._height)))
+        self._height = value
+    
+    def get_rect(self):
+        """Get collision rectangle. / Obtener rectángulo de colisión."""
+        return pygame.Rect(int(self.x), int(self.y), self.width, self.height)
+    
+    def move(self, direction, dt):
+        """
+        Move paddle (clamped to screen).
+        Mover paleta (limitada a la pantalla).
+        
+        Args / Argumentos:
+            direction (float): -1 (up/arriba), +1 (down/abajo)
+            dt (float): Delta time / Delta de tiempo
+        """
+        # Update position and clamp to screen bounds
+        # Actualizar posición y limitar a los bordes de la pantalla
+        self.y = max(0, min(SCREEN_HEIGHT - self.height, self.y + self.speed * direction * dt))
+    
+    def draw(self, screen, glow=True):
         """
         Render paddle with glow effect.
         Renderizar paleta con efecto de brillo.
         
         Args / Argumentos:
             screen (pygame.Surface): Target surface / Superficie objetivo
+            glow (bool): Draw the glow sprite (quality tier) / Dibujar el sprite de brillo (nivel de calidad)
         """
         # Draw main paddle / Dibujar paleta principal
         rect = pygame.Rect(int(self.x), int(self.y), self.width, self.height)
         pygame.draw.rect(screen, self.color, rect, border_radius=6)
         
+        if not glow:
+            return
         # Draw glow effect / Dibujar efecto de brillo
-        glow_surf = pygame.Surface((self.width + 16, self.height + 16), pygame.SRCALPHA)
-        pygame.draw.rect(glow_surf, (*self.color[:3], 55), (8, 8, self.width, self.height), border_radius=8)
+        glow_surf = glow_sprites.get('rect', (self.width, int(self.height)), self.color, 55)
         screen.blit(glow_surf, (int(self.x) - 8, int(self.y) - 8))
 
 class Ball:
     """
-    Game ball with trail effect.
-    Bola del juego con efecto de estela.
+    Game ball; its trail is drawn by a shared TrailBuffer.
+    Bola del juego; su estela la dibuja un TrailBuffer compartido.
     """
     
     def __init__(self):
@@ -1163,21 +2490,15 @@ class Ball:
         self.speed_x = BALL_SPEED_X * random.choice([-1, 1])
         self.speed_y = BALL_SPEED_Y * random.choice([-1, 1])
         self.color = RED
-        self.trail = []  # Position history for trail / Historial de posiciones para estela
     
     def move(self, dt):
         """
-        Move ball and update trail (bounce off top/bottom walls).
-        Mover bola y actualizar estela (rebotar en paredes superior/inferior).
+        Move ball (bounce off top/bottom walls).
+        Mover bola (rebotar en paredes superior/inferior).
         
         Args / Argumentos:
             dt (float): Delta time / Delta de tiempo
         """
-        # Add current position to trail / Agregar posición actual a la estela
-        self.trail.append((int(self.x), int(self.y)))
-        if len(self.trail) > 10:
-            self.trail.pop(0)  # Keep only last 10 positions / Mantener solo las últimas 10 posiciones
-        
         # Update position / Actualizar posición
         self.x += self.speed_x * dt
         self.y += self.speed_y * dt
@@ -1190,27 +2511,19 @@ class Ball:
             self.y = SCREEN_HEIGHT - self.size
             self.speed_y = -self.speed_y
     
-    def draw(self, screen):
+    def draw(self, screen, glow=True):
         """
-        Render ball with trail and glow effect.
-        Renderizar bola con estela y efecto de brillo.
+        Render ball with glow effect.
+        Renderizar bola con efecto de brillo.
         
         Args / Argumentos:
             screen (pygame.Surface): Target surface / Superficie objetivo
+            glow (bool): Draw the glow sprite (quality tier) / Dibujar el sprite de brillo (nivel de calidad)
         """
-        # Draw trail with fade effect / Dibujar estela con efecto de desvanecimiento
-        for i, pos in enumerate(self.trail):
-            # Alpha increases with position in trail / Alpha aumenta con la posición en la estela
-            alpha = int(255 * (i / max(1, len(self.trail))))
-            color = (*self.color[:3], alpha)
-            surf = pygame.Surface((self.size + 2, self.size + 2), pygame.SRCALPHA)
-            pygame.draw.circle(surf, color, ((self.size + 2) // 2, (self.size + 2) // 2), (self.size + 2) // 2)
-            screen.blit(surf, (pos[0] - 1, pos[1] - 1))
-        
         # Draw glow effect / Dibujar efecto de brillo
-        glow = pygame.Surface((self.size + 12, self.size + 12), pygame.SRCALPHA)
-        pygame.draw.circle(glow, (*self.color[:3], 60), ((self.size + 12) // 2, (self.size + 12) // 2), (self.size + 12) // 2)
-        screen.blit(glow, (int(self.x) - 6, int(self.y) - 6))
+        if glow:
+            glow = glow_sprites.get('circle', self.size + 12, self.color, 60)
+            screen.blit(glow, (int(self.x) - 6, int(self.y) - 6))
         
         # Draw main ball / Dibujar bola principal
         pygame.draw.circle(screen, self.color, (int(self.x + self.size // 2), int(self.y + self.size // 2)), self.size // 2)
@@ -1231,7 +2544,119 @@ class Ball:
         dir_x = direction if direction in (-1, 1) else random.choice([-1, 1])
         self.speed_x = BALL_BASE_SPEED * dir_x
         self.speed_y = BALL_BASE_SPEED * 0.55 * random.choice([-1, 1])
-        self.trail = []  # Clear trail / Limpiar estela
+
+class TrailBuffer:
+    """
+    Feedback surface holding the motion trails of every ball on one layer.
+    Superficie de realimentación con las estelas de todas las bolas de una capa.
+    
+    Each frame the buffer is faded with a single alpha multiply and every ball
+    is stamped once, so the cost does not grow with trail length and no surfaces
+    are allocated per frame. Only the regions touched by recent stamps are faded and
+    blitted: overlapping stamps are merged into disjoint rects, so each ball's trail is
+    its own small region however far apart the balls are.
+    Cada fotograma el búfer se desvanece con una sola multiplicación de alpha y
+    cada bola se estampa una vez; solo se procesan las regiones de estampas recientes,
+    fusionadas en rectángulos disjuntos (una región pequeña por estela).
+    
+    The multiply rounds up, so low alphas would never reach zero; a small alpha
+    subtraction after it guarantees every stamp is fully transparent once it
+    leaves the tracked region.
+    La multiplicación redondea hacia arriba y los alphas bajos nunca llegarían a cero;
+    una pequeña resta de alpha garantiza que cada estampa sea transparente al salir
+    de la región seguida.
+    """
+    STAMP_ALPHA = 230  # Alpha of the newest trail point / Alpha del punto más nuevo
+    FADE_FLOOR = 2     # Alpha subtracted after each multiply / Alpha restado tras cada multiplicación
+    
+    def __init__(self, size=(SCREEN_WIDTH, SCREEN_HEIGHT)):
+        self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        self.surface.fill((0, 0, 0, 0))
+        self._rect = self.surface.get_rect()
+        self._stamps = collections.deque()  # Stamp rects per frame / Rects de estampas por fotograma
+        self.regions = []  # Disjoint rects covering live stamps / Rects disjuntos que cubren las estampas vivas
+        self._fade = (None, 255, 0)  # (trail_length, keep, horizon)
+    
+    def _fade_for(self, length):
+        """
+        Multiplier and frames until a stamp reaches alpha 0, for one trail length.
+        Multiplicador y fotogramas hasta que una estampa llega a alpha 0, para una longitud.
+        """
+        if self._fade[0] != length:
+            # Fade to 10% over trail_length frames / Desvanecer al 10% en trail_length fotogramas
+            keep = int(255 * 0.1 ** (1 / length))
+            # Mirror pygame's BLEND_RGBA_MULT rounding / Replicar el redondeo de BLEND_RGBA_MULT
+            alpha, horizon = self.STAMP_ALPHA, 0
+            while alpha > 0:
+                alpha = max(0, ((alpha * keep + 255) >> 8) - self.FADE_FLOOR)
+                horizon += 1
+            self._fade = (length, keep, horizon)
+        return self._fade[1], self._fade[2]
+    
+    def clear(self):
+        """Erase every trail. / Borrar todas las estelas."""
+        if self._stamps:
+            self.surface.fill((0, 0, 0, 0))
+            self._stamps.clear()
+        self.regions = []
+    
+    def update(self, balls, length=10):
+        """
+        Fade the existing trails and stamp the current ball positions.
+        Desvanecer las estelas existentes y estampar las posiciones actuales.
+        
+        Args / Argumentos:
+            balls (iterable): Balls to stamp / Bolas a estampar
+            length (int): Frames to fade to 10%, 0 disables trails (quality tier)
+                          Fotogramas hasta el 10%, 0 desactiva las estelas (nivel de calidad)
+        """
+        if length <= 0:
+            self.clear()
+            return
+        keep, horizon = self._fade_for(length)
+        for region in self.regions:
+            self.surface.fill((255, 255, 255, keep), region, special_flags=pygame.BLEND_RGBA_MULT)
+            self.surface.fill((0, 0, 0, self.FADE_FLOOR), region, special_flags=pygame.BLEND_RGBA_SUB)
+        rects = []
+        for ball in balls:
+            radius = (ball.size + 2) // 2
+            center = (int(ball.x + ball.size // 2), int(ball.y + ball.size // 2))
+            rect = pygame.draw.circle(self.surface, (*ball.color[:3], self.STAMP_ALPHA), center, radius).clip(self._rect)
+            if rect.width and rect.height:  # Off-screen stamps cover nothing / Las estampas fuera de pantalla no cubren nada
+                rects.append(rect)
+        self._stamps.append(rects)
+        # After `horizon` fades a stamp is fully transparent and stops being tracked
+        # Tras `horizon` desvanecimientos una estampa es transparente y deja de seguirse
+        while len(self._stamps) > horizon:
+            self._stamps.popleft()
+        self.regions = self._merge(rect for frame in self._stamps for rect in frame)
+    
+    @staticmethod
+    def _merge(rects):
+        """
+        Union overlapping rects until the result is pairwise disjoint (so no pixel is faded twice).
+        Unir rects superpuestos hasta que sean disjuntos (ningún píxel se desvanece dos veces).
+        """
+        regions = []
+        for rect in rects:
+            rect = rect.copy()
+            hit = rect.collidelist(regions)
+            while hit != -1:
+                rect.union_ip(regions.pop(hit))
+                hit = rect.collidelist(regions)
+            regions.append(rect)
+        return regions
+    
+    def draw(self, screen):
+        """
+        Blit the trails under the balls.
+        Dibujar las estelas bajo las bolas.
+        
+        Args / Argumentos:
+            screen (pygame.Surface): Target surface / Superficie objetivo
+        """
+        if self.regions:
+            screen.blits([(self.surface, region.topleft, region) for region in self.regions], doreturn=False)
 
 # ============================================================================
 # GRAPHICS UTILITIES / UTILIDADES GRÁFICAS
@@ -1265,53 +2690,748 @@ def create_window_icon():
 
 def create_title_logo():
     """
-    Create pixel art logo "PONG V2" with gradient (light grey → white).
-    Crear logo pixel art "PONG V2" con gradiente (gris claro → blanco).
+    Create pixel art logo "PONG V2" with gradient (light grey → white).
+    Crear logo pixel art "PONG V2" con gradiente (gris claro → blanco).
+    
+    Returns / Retorna:
+        pygame.Surface: Logo surface / Superficie del logo
+    """
+    # Create surface for "PONG V2" / Crear superficie para "PONG V2"
+    logo = pygame.Surface((480, 100), pygame.SRCALPHA)
+    logo.fill((0, 0, 0, 0))
+    
+    # Pixel font style (8x8 grid per character) / Estilo de fuente pixel (cuadrícula 8x8 por carácter)
+    pixel_size = 8
+    
+    # Define "PONG V2" in pixel art / Definir "PONG V2" en pixel art
+    # Each letter is a list of (x, y) coordinates for filled pixels
+    # Cada letra es una lista de coordenadas (x, y) para píxeles rellenos
+    letters = {
+        'P': [(0,0),(1,0),(2,0),(0,1),(2,1),(0,2),(1,2),(2,2),(0,3),(0,4),(0,5)],
+        'O': [(0,0),(1,0),(2,0),(0,1),(2,1),(0,2),(2,2),(0,3),(2,3),(0,4),(2,4),(0,5),(1,5),(2,5)],
+        'N': [(0,0),(0,1),(0,2),(0,3),(0,4),(0,5),(1,1),(2,2),(2,3),(3,0),(3,1),(3,2),(3,3),(3,4),(3,5)],
+        'G': [(0,0),(1,0),(2,0),(0,1),(0,2),(2,2),(0,3),(2,3),(0,4),(2,4),(0,5),(1,5),(2,5)],
+        'V': [(0,0),(0,1),(0,2),(1,3),(1,4),(2,5),(3,4),(3,3),(4,2),(4,1),(4,0)],
+        '2': [(0,0),(1,0),(2,0),(2,1),(2,2),(1,2),(0,3),(0,4),(0,5),(1,5),(2,5)]
+    }
+    
+    # Draw "PONG" with gradient / Dibujar "PONG" con gradiente
+    x_offset = 10
+    for char in ['P', 'O', 'N', 'G']:
+        for px, py in letters[char]:
+            # Gradient: light grey (180) at bottom → white (255) at top
+            # Gradiente: gris claro (180) en la base → blanco (255) arriba
+            color_value = int(180 + (255 - 180) * (1 - py / 5))
+            color = (color_value, color_value, color_value)
+            pygame.draw.rect(logo, color, (x_offset + px * pixel_size, 10 + py * pixel_size, pixel_size, pixel_size))
+        x_offset += 50
+    
+    x_offset += 30  # Space between "PONG" and "V2" / Espacio entre "PONG" y "V2"
+    
+    # Draw "V2" with gradient / Dibujar "V2" con gradiente
+    for char in ['V', '2']:
+        for px, py in letters[char]:
+            color_value = int(180 + (255 - 180) * (1 - py / 5))
+            color = (color_value, color_value, color_value)
+            pygame.draw.rect(logo, color, (x_offset + px * pixel_size, 10 + py * pixel_size, pixel_size, pixel_size))
+        x_offset += 50
+    
+    return logo
+
+# ============================================================================
+# PROCEDURAL ASSETS / RECURSOS PROCEDURALES
+# Whole-array NumPy builders for full-screen surfaces
+# Constructores NumPy de arreglo completo para superficies de pantalla completa
+# ============================================================================
+
+# Background gradients: (top RGB, RGB change from top to bottom)
+# Gradientes de fondo: (RGB superior, cambio RGB de arriba a abajo)
+THEME_GRADIENTS = {
+    'dark': ((30, 30, 36), (15, 15, 20)),          # #1E1E24 → (45, 45, 56)
+    'light': ((139, 126, 116), (-25, -22, -20)),   # #8B7E74 → (114, 104, 96)
+}
+
+# Theme cycle order for toggle_theme / Orden de ciclo de temas para toggle_theme
+THEMES = list(THEME_GRADIENTS)
+
+def build_background(width, height, theme='dark'):
+    """
+    Build vertical gradient background for a theme in one NumPy pass.
+    Construir fondo con gradiente vertical para un tema en una pasada NumPy.
+
+    Args / Argumentos:
+        width, height (int): Surface size / Tamaño de la superficie
+        theme (str): Theme name from THEME_GRADIENTS / Nombre de tema de THEME_GRADIENTS
+
+    Returns / Retorna:
+        pygame.Surface: Opaque gradient surface / Superficie opaca con gradiente
+    """
+    top, delta = THEME_GRADIENTS.get(theme, THEME_GRADIENTS['dark'])
+    # One color per row, truncated like int() / Un color por fila, truncado como int()
+    t = np.arange(height, dtype=np.float64)[:, None] / height
+    rows = (np.asarray(top, dtype=np.float64) + np.asarray(delta, dtype=np.float64) * t).astype(np.uint8)
+    surface = pygame.Surface((width, height))
+    # surfarray is indexed [x, y] / surfarray se indexa [x, y]
+    pygame.surfarray.blit_array(surface, np.broadcast_to(rows[None, :, :], (width, height, 3)))
+    return surface
+
+def build_vignette(width, height):
+    """
+    Build radial vignette (darkens edges) via pixels_alpha.
+    Construir viñeta radial (oscurece bordes) mediante pixels_alpha.
+
+    Returns / Retorna:
+        pygame.Surface: Black SRCALPHA surface with radial alpha / Superficie negra SRCALPHA con alfa radial
+    """
+    vignette = pygame.Surface((width, height), pygame.SRCALPHA)
+    vignette.fill((0, 0, 0, 0))
+    cx, cy = width / 2, height / 2
+    max_dist = math.hypot(cx, cy)
+    xs = np.arange(width, dtype=np.float64)[:, None] - cx
+    ys = np.arange(height, dtype=np.float64)[None, :] - cy
+    # Alpha increases with distance from center / Alpha aumenta con la distancia al centro
+    alpha = 200 * np.maximum(0.0, np.hypot(xs, ys) / max_dist - 0.35)
+    alpha_view = pygame.surfarray.pixels_alpha(vignette)
+    alpha_view[:] = np.minimum(alpha, 255).astype(np.uint8)
+    del alpha_view  # Unlock surface / Desbloquear superficie
+    return vignette
+
+def build_scanlines(width, height):
+    """
+    Build CRT scanlines (2px dark band every 4px) via pixels_alpha.
+    Construir líneas de escaneo CRT (banda oscura de 2px cada 4px) mediante pixels_alpha.
+    """
+    scanlines = pygame.Surface((width, height), pygame.SRCALPHA)
+    scanlines.fill((0, 0, 0, 0))
+    alpha_view = pygame.surfarray.pixels_alpha(scanlines)
+    alpha_view[:, (np.arange(height) % 4) < 2] = 40
+    del alpha_view
+    return scanlines
+
+def build_center_glow(width, height):
+    """Build purple center glow. / Construir brillo central morado."""
+    glow = pygame.Surface((width, height), pygame.SRCALPHA)
+    pygame.draw.circle(glow, (140, 40, 200, 120), (width // 2, height // 2), height // 2)
+    return glow
+
+def benchmark_assets(resolutions=((800, 600), (1280, 720), (1920, 1080), (2560, 1440)), repeats=3):
+    """
+    Report procedural asset build time per resolution (--benchmark-assets).
+    Reportar tiempo de construcción de recursos por resolución (--benchmark-assets).
+
+    Returns / Retorna:
+        dict: {(w, h): {asset_name: best_ms}} / {(ancho, alto): {recurso: mejor_ms}}
+    """
+    builders = {
+        'background': lambda w, h: build_background(w, h, 'dark'),
+        'vignette': build_vignette,
+        'scanlines': build_scanlines,
+        'center_glow': build_center_glow,
+    }
+    results = {}
+    print(f"{'resolution':>12}  " + "  ".join(f"{name:>12}" for name in builders) + f"  {'total':>9}")
+    for w, h in resolutions:
+        row = {}
+        for name, builder in builders.items():
+            best = float('inf')
+            for _ in range(repeats):
+                start = time.perf_counter()
+                builder(w, h)
+                best = min(best, (time.perf_counter() - start) * 1000)
+            row[name] = best
+        results[(w, h)] = row
+        print(f"{f'{w}x{h}':>12}  " + "  ".join(f"{row[n]:10.2f}ms" for n in builders) + f"  {sum(row.values()):7.2f}ms")
+    return results
+
+# Bump when any builder output changes (invalidates cached blobs)
+# Incrementar cuando cambie la salida de un constructor (invalida blobs en caché)
+ASSET_VERSION = 1
+
+class AssetCache:
+    """
+    Content-addressed on-disk cache for baked procedural surfaces.
+    Caché en disco direccionada por contenido para superficies procedurales horneadas.
+
+    File format / Formato de archivo:
+        MAGIC (8 bytes) + width, height (uint32 LE) + blake2b digest (16 bytes) + raw RGBA pixels
+        MAGIC (8 bytes) + ancho, alto (uint32 LE) + resumen blake2b (16 bytes) + píxeles RGBA crudos
+
+    Entries are keyed by a hash of (name, size, theme, ASSET_VERSION). Corrupt entries
+    (bad header, truncated data, checksum mismatch) are deleted and rebuilt.
+    Las entradas se indexan por un hash de (nombre, tamaño, tema, ASSET_VERSION). Las entradas
+    corruptas (cabecera inválida, datos truncados, checksum incorrecto) se eliminan y reconstruyen.
+    """
+    MAGIC = b'PONGAST1'
+    HEADER = struct.Struct('<8sII16s')
+
+    def __init__(self, directory=CACHE_DIR, version=ASSET_VERSION):
+        """
+        Args / Argumentos:
+            directory (Path or None): Cache directory, None disables the cache / Directorio de caché, None lo desactiva
+            version (int): Asset version mixed into every key / Versión de recursos incluida en cada clave
+        """
+        self.directory = Path(directory) / 'assets' if directory is not None else None
+        self.version = version
+        self.hits = 0      # Loaded from disk / Cargados del disco
+        self.misses = 0    # Built procedurally / Construidos proceduralmente
+        self.rejected = 0  # Corrupt entries rebuilt / Entradas corruptas reconstruidas
+        self._pruned = False
+
+    def key(self, name, size, theme=None):
+        """
+        Content-addressed key for an asset.
+        Clave direccionada por contenido para un recurso.
+
+        Returns / Retorna:
+            str: Hex digest / Resumen hexadecimal
+        """
+        payload = json.dumps([name, int(size[0]), int(size[1]), theme, self.version])
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def _path(self, name, size, theme=None):
+        """Cache file path (version prefix allows pruning stale files). / Ruta del archivo de caché."""
+        return self.directory / f"v{self.version}-{name}-{self.key(name, size, theme)[:24]}.rgba"
+
+    def load(self, name, size, theme=None):
+        """
+        Load cached surface, or None if missing/corrupt.
+        Cargar superficie en caché, o None si falta/está corrupta.
+        """
+        if self.directory is None:
+            return None
+        path = self._path(name, size, theme)
+        try:
+            data = path.read_bytes()
+        except OSError:
+            return None  # Not cached yet / Aún no está en caché
+        width, height = int(size[0]), int(size[1])
+        try:
+            magic, w, h, digest = self.HEADER.unpack_from(data)
+            payload = memoryview(data)[self.HEADER.size:]
+            valid = (magic == self.MAGIC and (w, h) == (width, height) and len(payload) == width * height * 4
+                     and hashlib.blake2b(payload, digest_size=16).digest() == digest)
+        except struct.error:
+            valid = False
+        if not valid:
+            # Corrupt or truncated entry - remove so it gets rebuilt / Entrada corrupta - eliminar para reconstruir
+            self.rejected += 1
+            try:
+                path.unlink()
+            except OSError:
+                pass
+            return None
+        # Zero-copy view over the file bytes / Vista sin copia sobre los bytes del archivo
+        return pygame.image.frombuffer(payload, (width, height), 'RGBA')
+
+    def store(self, name, surface, theme=None):
+        """
+        Write surface to cache atomically (errors ignored).
+        Escribir superficie en caché atómicamente (errores ignorados).
+        """
+        if self.directory is None:
+            return
+        size = surface.get_size()
+        payload = pygame.image.tobytes(surface, 'RGBA')
+        header = self.HEADER.pack(self.MAGIC, size[0], size[1], hashlib.blake2b(payload, digest_size=16).digest())
+        path = self._path(name, size, theme)
+        tmp_path = path.with_suffix(f'.tmp{os.getpid()}')
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._prune_stale()
+            with open(tmp_path, 'wb') as f:
+                f.write(header)
+                f.write(payload)
+            os.replace(tmp_path, path)  # Readers never see partial files / Lectores nunca ven archivos parciales
+        except OSError:
+            pass  # Read-only or full disk - cache is optional / Disco de solo lectura o lleno - caché opcional
+
+    def _prune_stale(self):
+        """Delete blobs from older ASSET_VERSIONs (once per run). / Eliminar blobs de versiones anteriores."""
+        if self._pruned:
+            return
+        self._pruned = True
+        prefix = f"v{self.version}-"
+        for path in self.directory.glob('v*-*'):
+            if not path.name.startswith(prefix):
+                try:
+                    path.unlink()
+                except OSError:
+                    pass
+
+    def get_or_build(self, name, size, builder, theme=None, alpha=True, convert=True):
+        """
+        Return cached surface or build, store and return it.
+        Devolver superficie en caché o construirla, guardarla y devolverla.
+
+        Args / Argumentos:
+            name (str): Asset name / Nombre del recurso
+            size (tuple): (width, height) / (ancho, alto)
+            builder (callable): Zero-argument builder returning a Surface / Constructor sin argumentos que devuelve Surface
+            theme (str, optional): Theme the asset depends on / Tema del que depende el recurso
+            alpha (bool): Keep per-pixel alpha / Mantener alfa por píxel
+            convert (bool): Convert to display format (main thread only) / Convertir a formato de pantalla (solo hilo principal)
+
+        Returns / Retorna:
+            pygame.Surface: Asset in display format when a display exists / Recurso en formato de pantalla si existe
+        """
+        surface = self.load(name, size, theme)
+        if surface is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            surface = builder()
+            self.store(name, surface, theme)
+        return self.finalize(surface, alpha) if convert else surface
+
+    @staticmethod
+    def finalize(surface, alpha=True):
+        """
+        Convert a raw (loaded or baked) surface to display format (main thread only).
+        Convertir una superficie cruda (cargada u horneada) al formato de pantalla (solo hilo principal).
+        """
+        if pygame.display.get_surface() is not None:
+            return surface.convert_alpha() if alpha else surface.convert()
+        if not alpha and surface.get_flags() & pygame.SRCALPHA:
+            opaque = pygame.Surface(surface.get_size())
+            opaque.blit(surface, (0, 0))
+            return opaque
+        return surface
+
+class ThemeAtlas:
+    """
+    Prebuilt background per theme so switching theme is a reference swap.
+    Fondo preconstruido por tema para que cambiar de tema sea un cambio de referencia.
+
+    The active theme is built synchronously; the others are baked (or loaded from the
+    AssetCache) on a daemon thread. Finished surfaces are converted to display format
+    on the main thread by poll(), once per frame, never inside a click handler.
+    El tema activo se construye de forma síncrona; los demás se hornean (o se cargan de
+    AssetCache) en un hilo daemon. poll() convierte las superficies terminadas al formato
+    de pantalla en el hilo principal, una por fotograma, nunca en un manejador de clic.
+    """
+
+    def __init__(self, cache, size, themes=THEMES):
+        """
+        Args / Argumentos:
+            cache (AssetCache): Shared asset cache / Caché de recursos compartida
+            size (tuple): Background size / Tamaño del fondo
+            themes (list): Theme names in cycle order / Nombres de temas en orden de ciclo
+        """
+        self.cache = cache
+        self.size = size
+        self.themes = list(themes)
+        self.surfaces = {}     # theme -> display-format surface / tema -> superficie en formato de pantalla
+        self._pending = {}     # theme -> raw surface from worker / tema -> superficie cruda del hilo
+        self._lock = threading.Lock()
+        self._thread = None
+        self.sync_builds = 0   # Fallback builds on the main thread / Construcciones de respaldo en hilo principal
+
+    def _build_raw(self, theme):
+        """Load or bake one theme without touching the display. / Cargar u hornear un tema sin tocar la pantalla."""
+        w, h = self.size
+        return self.cache.get_or_build('background', self.size, lambda: build_background(w, h, theme),
+                                       theme=theme, alpha=False, convert=False)
+
+    def _finalize(self, theme, raw):
+        """Convert raw surface to display format (main thread). / Convertir superficie cruda (hilo principal)."""
+        surface = self.surfaces[theme] = AssetCache.finalize(raw, alpha=False)
+        return surface
+
+    def start(self, current):
+        """
+        Finalize the current theme now and bake the rest in the background.
+        Finalizar el tema actual ahora y hornear el resto en segundo plano.
+        """
+        with self._lock:
+            raw = self._pending.pop(current, None)
+        self._finalize(current, raw if raw is not None else self._build_raw(current))
+        remaining = [t for t in self.themes if t not in self.surfaces and self._pending.get(t) is None]
+        if not remaining:
+            return
+        if IS_WEB:
+            # No threads under Emscripten - bake on first poll() instead
+            # Sin hilos bajo Emscripten - hornear en el primer poll()
+            with self._lock:
+                self._pending.update({t: None for t in remaining})
+            return
+        self._thread = threading.Thread(target=self.bake, args=(remaining,), daemon=True)
+        self._thread.start()
+
+    def bake(self, themes=None):
+        """
+        Bake raw surfaces into the pending set (any thread, no display access).
+        Hornear superficies crudas en el conjunto pendiente (cualquier hilo, sin acceso a pantalla).
+        """
+        for theme in (self.themes if themes is None else themes):
+            if theme in self.surfaces or self._pending.get(theme) is not None:
+                continue
+            raw = self._build_raw(theme)
+            with self._lock:
+                self._pending[theme] = raw
+
+    def poll(self):
+        """
+        Finalize at most one finished theme (call once per frame).
+        Finalizar como máximo un tema terminado (llamar una vez por fotograma).
+        """
+        if not self._pending:
+            return
+        with self._lock:
+            theme = next(iter(self._pending))
+            raw = self._pending.pop(theme)
+        self._finalize(theme, raw if raw is not None else self._build_raw(theme))
+
+    @property
+    def ready(self):
+        """True once every theme is finalized. / True cuando todos los temas están finalizados."""
+        return len(self.surfaces) == len(self.themes)
+
+    def get(self, theme):
+        """
+        Background for a theme; builds synchronously only if the worker has not finished.
+        Fondo para un tema; construye síncronamente solo si el hilo no ha terminado.
+        """
+        surface = self.surfaces.get(theme)
+        if surface is not None:
+            return surface
+        with self._lock:
+            raw = self._pending.pop(theme, None)
+        if raw is None:
+            self.sync_builds += 1
+            raw = self._build_raw(theme)
+        return self._finalize(theme, raw)
+
+    def next_theme(self, theme):
+        """Theme after `theme` in cycle order. / Tema siguiente en orden de ciclo."""
+        index = self.themes.index(theme) if theme in self.themes else -1
+        return self.themes[(index + 1) % len(self.themes)]
+
+# ============================================================================
+# SCREEN UPDATES / ACTUALIZACIONES DE PANTALLA
+# Dirty rectangles and retained layers / Rectángulos sucios y capas retenidas
+# ============================================================================
+
+class DirtyRegions:
+    """
+    Decides between a full redraw + flip() and pushing only changed rects with display.update().
+    Decide entre redibujar todo + flip() y enviar solo los rectángulos cambiados con display.update().
+    
+    A screen passes a signature of everything that affects its static widgets (hover,
+    toggles, language...). Same signature as the previous frame -> only the animated
+    widgets are redrawn and marked. Any other screen presenting in between, or a window
+    expose/resize, forces a full frame.
+    Una pantalla pasa una firma de todo lo que afecta a sus widgets estáticos (hover,
+    interruptores, idioma...). Misma firma que el fotograma anterior -> solo se redibujan
+    y marcan los widgets animados. Otra pantalla presentando entre medias, o una
+    exposición/redimensión de la ventana, fuerza un fotograma completo.
+    """
+    
+    def __init__(self, on_present=None):
+        """
+        Args / Argumentos:
+            on_present (callable, optional): Called before each present / Llamado antes de cada presentación
+        """
+        self.on_present = on_present
+        self._signature = None
+        self._presented = False        # Presented this frame / Presentado este fotograma
+        self._presented_last = False   # Presented last frame / Presentado el fotograma anterior
+        self.rects = []
+        self.full_frames = 0
+        self.partial_frames = 0
+        self.pixels = 0  # Pixels pushed last frame / Píxeles enviados el último fotograma
+    
+    def tick(self):
+        """Call once per frame before drawing. / Llamar una vez por fotograma antes de dibujar."""
+        self._presented_last, self._presented = self._presented, False
+        if pygame.event.peek((pygame.WINDOWEXPOSED, pygame.WINDOWRESIZED, pygame.WINDOWRESTORED)):
+            self.invalidate()
+    
+    def invalidate(self):
+        """Force the next frame to be full. / Forzar que el próximo fotograma sea completo."""
+        self._signature = None
+    
+    def begin(self, signature):
+        """
+        Returns / Retorna:
+            bool: True if the whole screen must be redrawn / True si hay que redibujar toda la pantalla
+        """
+        full = not self._presented_last or signature != self._signature
+        self._signature = signature
+        return full
+    
+    def mark(self, rect):
+        """Record a changed area. / Registrar un área cambiada."""
+        self.rects.append(pygame.Rect(rect))
+    
+    def present(self, full):
+        """Flip the whole screen or update only the marked rects. / Voltear toda la pantalla o actualizar solo los rectángulos marcados."""
+        if self.on_present is not None:
+            self.on_present()
+        if full:
+            pygame.display.flip()
+            self.full_frames += 1
+            self.pixels = SCREEN_WIDTH * SCREEN_HEIGHT
+        else:
+            if self.rects:
+                pygame.display.update(self.rects)
+            self.partial_frames += 1
+            self.pixels = sum(rect.width * rect.height for rect in self.rects)
+        self.rects.clear()
+        self._presented = True
+
+# Font sizes each screen draws with, preloaded so no screen loads a font mid-frame
+# Tamaños de fuente que usa cada pantalla, precargados para no cargar fuentes a mitad de fotograma
+#   26-28: _draw_modern_button at hover scales 1.0-1.08 / escalas de hover 1.0-1.08;  19: diagnostics button
+BUTTON_FONT_SIZES = (26, 27, 28)
+SCREEN_FONTS = {
+    'base': (28, 36, 72),  # small_font, font, large_font
+    'menu': BUTTON_FONT_SIZES + (19,),
+    'settings': BUTTON_FONT_SIZES,
+    'multiplayer': BUTTON_FONT_SIZES,
+}
+
+class FontRegistry:
+    """
+    Loads each (face, size) once and shares the instance.
+    Carga cada (fuente, tamaño) una vez y comparte la instancia.
+    """
+    
+    def __init__(self):
+        self._fonts = {}
+        self.loads = 0      # Font files parsed / Archivos de fuente analizados
+        self.requests = 0   # get() calls / llamadas a get()
+        self.late_loads = 0  # Loads after preloading finished / Cargas después de la precarga
+        self._preloaded = False
+    
+    def __len__(self):
+        return len(self._fonts)
+    
+    def get(self, size, face=None):
+        """
+        Shared font for (face, size); face None is pygame's default font.
+        Fuente compartida para (face, size); face None es la fuente por defecto de pygame.
+        """
+        self.requests += 1
+        key = (face, int(size))
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = pygame.font.Font(face, key[1])
+            self.loads += 1
+            if self._preloaded:
+                self.late_loads += 1
+                print(f"[Fonts] Late load: {face or 'default'} {key[1]}px")
+        return font
+    
+    def preload(self, screens=None, face=None):
+        """
+        Load the sizes listed in SCREEN_FONTS for the given screens (all by default).
+        Cargar los tamaños de SCREEN_FONTS para las pantallas dadas (todas por defecto).
+        """
+        for screen in (SCREEN_FONTS if screens is None else screens):
+            for size in SCREEN_FONTS[screen]:
+                self.get(size, face)
+        self.requests = 0
+        self._preloaded = True
+
+# Cached menu buttons / Botones de menú en caché
+BUTTON_CACHE_SIZE = 48  # Buttons x hover states x scale steps / Botones x estados de hover x pasos de escala
+BUTTON_MARGIN = 10      # Room for the hover glow / Espacio para el brillo de hover
+
+class TextCache:
+    """
+    LRU cache of rendered text keyed by (font, text, color, quantized scale), bounded by bytes.
+    Caché LRU de texto renderizado indexado por (fuente, texto, color, escala cuantizada), limitado por bytes.
+    
+    Scaled variants are smoothscaled once from the cached 1.0 render, so scale
+    animations (score pop, game-over pulse) cycle through a few cached surfaces.
+    Las variantes escaladas se generan una vez desde el render 1.0 en caché, así las
+    animaciones de escala recorren unas pocas superficies en caché.
+    """
+    SCALE_STEP = 0.02
+    
+    def __init__(self, max_bytes=8 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._entries = collections.OrderedDict()  # key -> Surface / clave -> Surface
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def __len__(self):
+        return len(self._entries)
+    
+    @classmethod
+    def quantize(cls, scale):
+        """Snap a scale to SCALE_STEP. / Ajustar una escala a SCALE_STEP."""
+        return round(round(scale / cls.SCALE_STEP) * cls.SCALE_STEP, 4)
+    
+    def render(self, font, text, color, scale=1.0):
+        """
+        Cached equivalent of font.render(text, True, color), optionally scaled.
+        Equivalente en caché de font.render(text, True, color), opcionalmente escalado.
+        
+        Args / Argumentos:
+            font (pygame.font.Font): Font / Fuente
+            text (str): Text / Texto
+            color (tuple): RGB(A) color / Color RGB(A)
+            scale (float): Scale, quantized to SCALE_STEP / Escala, cuantizada a SCALE_STEP
+        
+        Returns / Retorna:
+            pygame.Surface: Shared surface, do not modify / Superficie compartida, no modificar
+        """
+        scale = self.quantize(scale)
+        key = (font, text, tuple(color), scale)
+        surface = self._entries.get(key)
+        if surface is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        if scale == 1.0:
+            surface = font.render(text, True, color)
+        else:
+            base = self.render(font, text, color)
+            size = (max(1, int(base.get_width() * scale)), max(1, int(base.get_height() * scale)))
+            surface = pygame.transform.smoothscale(base, size)
+        self._entries[key] = surface
+        self.bytes += self._size(surface)
+        while self.bytes > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self.bytes -= self._size(evicted)
+            self.evictions += 1
+        return surface
+    
+    @staticmethod
+    def _size(surface):
+        return surface.get_width() * surface.get_height() * surface.get_bytesize()
+    
+    def clear(self):
+        self._entries.clear()
+        self.bytes = 0
+
+# Playing-screen layer geometry / Geometría de capas de la pantalla de juego
+CENTER_LINE_STEPS = 64   # Cached phases of the center-line pulse / Fases en caché del pulso de la línea central
+HUD_LAYER_HEIGHT = 120   # Top band holding scores, labels and badge / Franja superior con puntajes, etiquetas e insignia
+
+class LayerCompositor:
+    """
+    Named, retained layers: each caches its rendered surface(s) by an input key and
+    re-renders only when the key changes.
+    Capas con nombre y retenidas: cada una guarda sus superficies renderizadas por una
+    clave de entrada y solo vuelve a renderizar cuando la clave cambia.
     
-    Returns / Retorna:
-        pygame.Surface: Logo surface / Superficie del logo
+    Layers with capacity > 1 keep an LRU of frames (e.g. a looping animation).
+    Las capas con capacity > 1 guardan un LRU de fotogramas (p. ej. una animación en bucle).
     """
-    # Create surface for "PONG V2" / Crear superficie para "PONG V2"
-    logo = pygame.Surface((480, 100), pygame.SRCALPHA)
-    logo.fill((0, 0, 0, 0))
     
-    # Pixel font style (8x8 grid per character) / Estilo de fuente pixel (cuadrícula 8x8 por carácter)
-    pixel_size = 8
+    def __init__(self):
+        self.layers = {}  # name -> {'render', 'capacity', 'frames'} / nombre -> datos de capa
+        self.rebuilds = {}  # name -> render count / nombre -> cantidad de renderizados
     
-    # Define "PONG V2" in pixel art / Definir "PONG V2" en pixel art
-    # Each letter is a list of (x, y) coordinates for filled pixels
-    # Cada letra es una lista de coordenadas (x, y) para píxeles rellenos
-    letters = {
-        'P': [(0,0),(1,0),(2,0),(0,1),(2,1),(0,2),(1,2),(2,2),(0,3),(0,4),(0,5)],
-        'O': [(0,0),(1,0),(2,0),(0,1),(2,1),(0,2),(2,2),(0,3),(2,3),(0,4),(2,4),(0,5),(1,5),(2,5)],
-        'N': [(0,0),(0,1),(0,2),(0,3),(0,4),(0,5),(1,1),(2,2),(2,3),(3,0),(3,1),(3,2),(3,3),(3,4),(3,5)],
-        'G': [(0,0),(1,0),(2,0),(0,1),(0,2),(2,2),(0,3),(2,3),(0,4),(2,4),(0,5),(1,5),(2,5)],
-        'V': [(0,0),(0,1),(0,2),(1,3),(1,4),(2,5),(3,4),(3,3),(4,2),(4,1),(4,0)],
-        '2': [(0,0),(1,0),(2,0),(2,1),(2,2),(1,2),(0,3),(0,4),(0,5),(1,5),(2,5)]
-    }
+    def add(self, name, render, capacity=1):
+        """
+        Args / Argumentos:
+            name (str): Layer name / Nombre de la capa
+            render (callable): key -> Surface
+            capacity (int): Cached keys kept / Claves guardadas en caché
+        """
+        self.layers[name] = {'render': render, 'capacity': capacity, 'frames': collections.OrderedDict()}
+        self.rebuilds[name] = 0
     
-    # Draw "PONG" with gradient / Dibujar "PONG" con gradiente
-    x_offset = 10
-    for char in ['P', 'O', 'N', 'G']:
-        for px, py in letters[char]:
-            # Gradient: light grey (180) at bottom → white (255) at top
-            # Gradiente: gris claro (180) en la base → blanco (255) arriba
-            color_value = int(180 + (255 - 180) * (1 - py / 5))
-            color = (color_value, color_value, color_value)
-            pygame.draw.rect(logo, color, (x_offset + px * pixel_size, 10 + py * pixel_size, pixel_size, pixel_size))
-        x_offset += 50
+    def get(self, name, key):
+        """Cached surface for key, rendering it on a miss. / Superficie en caché para key, renderizándola si falta."""
+        layer = self.layers[name]
+        frames = layer['frames']
+        surface = frames.get(key)
+        if surface is None:
+            surface = frames[key] = layer['render'](key)
+            self.rebuilds[name] += 1
+            while len(frames) > layer['capacity']:
+                frames.popitem(last=False)
+        else:
+            frames.move_to_end(key)
+        return surface
     
-    x_offset += 30  # Space between "PONG" and "V2" / Espacio entre "PONG" y "V2"
+    def invalidate(self, name=None):
+        """Drop cached frames of one layer (or all). / Descartar fotogramas en caché de una capa (o todas)."""
+        for layer_name in ([name] if name else self.layers):
+            self.layers[layer_name]['frames'].clear()
+
+# ============================================================================
+# BLOOM / RESPLANDOR
+# One full-screen glow pass over the entity layer / Un pase de brillo de pantalla completa sobre la capa de entidades
+# ============================================================================
+
+BLOOM_DOWNSAMPLE = 4    # Blur resolution divisor / Divisor de resolución del desenfoque
+BLOOM_RADIUS = 3        # Box radius at blur resolution / Radio de caja a resolución de desenfoque
+BLOOM_PASSES = 2        # Box passes per axis (2 ~ Gaussian) / Pases de caja por eje (2 ~ gaussiano)
+BLOOM_STRENGTH = 0.9    # Glow brightness / Brillo del resplandor
+
+def box_blur(data, radius, axis):
+    """
+    Box blur along one axis using a running sum (zero padded).
+    Desenfoque de caja a lo largo de un eje con suma acumulada (relleno con ceros).
     
-    # Draw "V2" with gradient / Dibujar "V2" con gradiente
-    for char in ['V', '2']:
-        for px, py in letters[char]:
-            color_value = int(180 + (255 - 180) * (1 - py / 5))
-            color = (color_value, color_value, color_value)
-            pygame.draw.rect(logo, color, (x_offset + px * pixel_size, 10 + py * pixel_size, pixel_size, pixel_size))
-        x_offset += 50
+    Args / Argumentos:
+        data (np.ndarray): float32 image / Imagen float32
+        radius (int): Box radius / Radio de la caja
+        axis (int): Axis to blur / Eje a desenfocar
     
-    return logo
+    Returns / Retorna:
+        np.ndarray: Blurred image, same shape / Imagen desenfocada, misma forma
+    """
+    data = np.moveaxis(data, axis, 0)
+    pad = ((radius + 1, radius),) + ((0, 0),) * (data.ndim - 1)
+    total = np.cumsum(np.pad(data, pad), axis=0, dtype=np.float32)
+    width = 2 * radius + 1
+    return np.moveaxis((total[width:] - total[:-width]) * (1.0 / width), 0, axis)
+
+class BloomPass:
+    """
+    Full-screen bloom: downsample the entity layer, blur it with a separable box
+    filter in NumPy and add it back with BLEND_ADD. Cost depends on screen size only,
+    not on how many objects glow.
+    Bloom de pantalla completa: reducir la capa de entidades, desenfocarla con un filtro
+    de caja separable en NumPy y sumarla con BLEND_ADD. El costo depende solo del tamaño
+    de pantalla, no de cuántos objetos brillan.
+    """
+    
+    def __init__(self, size=(SCREEN_WIDTH, SCREEN_HEIGHT), downsample=BLOOM_DOWNSAMPLE,
+                 radius=BLOOM_RADIUS, passes=BLOOM_PASSES, strength=BLOOM_STRENGTH):
+        self.size = size
+        self.small_size = (max(1, size[0] // downsample), max(1, size[1] // downsample))
+        self.radius = radius
+        self.passes = passes
+        self.strength = strength
+        self._small = pygame.Surface(self.small_size, pygame.SRCALPHA)  # Downsampled layer / Capa reducida
+        self._glow = pygame.Surface(self.small_size)  # Blurred light / Luz desenfocada
+        self._glow_full = pygame.Surface(size)  # Upsampled light / Luz ampliada
+        self.ms = 0.0  # Last pass time / Tiempo del último pase
+    
+    def apply(self, layer, target, offset=(0, 0)):
+        """
+        Add the bloom of an SRCALPHA layer onto target.
+        Sumar el bloom de una capa SRCALPHA sobre target.
+        
+        Args / Argumentos:
+            layer (pygame.Surface): Entity layer / Capa de entidades
+            target (pygame.Surface): Surface to brighten / Superficie a iluminar
+            offset (tuple): Where layer was blitted / Dónde se dibujó la capa
+        """
+        start = time.perf_counter()
+        pygame.transform.smoothscale(layer, self.small_size, self._small)
+        # Premultiply so transparent pixels add no light / Premultiplicar para que los píxeles transparentes no sumen luz
+        rgb = pygame.surfarray.array3d(self._small).astype(np.float32)
+        alpha = pygame.surfarray.array_alpha(self._small).astype(np.float32)
+        light = rgb * (alpha * (self.strength / 255.0))[..., None]
+        for axis in (0, 1):
+            for _ in range(self.passes):
+                light = box_blur(light, self.radius, axis)
+        np.minimum(light, 255.0, out=light)
+        pygame.surfarray.blit_array(self._glow, light.astype(np.uint8))
+        pygame.transform.smoothscale(self._glow, self.size, self._glow_full)
+        target.blit(self._glow_full, offset, special_flags=pygame.BLEND_ADD)
+        self.ms = (time.perf_counter() - start) * 1000.0
 
 # ============================================================================
 # MAIN GAME CLASS / CLASE PRINCIPAL DEL JUEGO
@@ -1325,17 +3445,37 @@ class Game:
     Clase principal del juego - maneja toda la lógica, renderizado y gestión de estados.
     """
     
-    def __init__(self):
+    def __init__(self, profiler=None, defer_loading=None):
         """
         Initialize game with all systems (graphics, audio, networking, UI).
         Inicializar juego con todos los sistemas (gráficos, audio, red, UI).
+        
+        The window opens first; assets and sounds are then produced by load() behind a
+        splash screen (or later by load_async() when loading is deferred).
+        La ventana se abre primero; los recursos y sonidos los produce load() detrás de una
+        pantalla de carga (o después load_async() cuando la carga se difiere).
+        
+        Args / Argumentos:
+            profiler (StartupProfiler): Optional phase timer (--profile-startup) / Temporizador de fases opcional
+            defer_loading (bool): Skip load() here (default: True in browser) / Omitir load() aquí (por defecto: True en navegador)
         """
+        if profiler is None:
+            profiler = StartupProfiler(enabled=False)
+        self._profiler = profiler
+        
+        # Open display subsystem (audio is initialized below) / Abrir subsistema de pantalla (audio más abajo)
+        with profiler.phase('init_display'):
+            init_display()
+        
         # Load saved settings from JSON file / Cargar configuración guardada desde archivo JSON
-        saved = load_settings()
+        with profiler.phase('load_settings'):
+            saved = load_settings()
         self.fullscreen = saved.get('fullscreen', False)
         self.audio_enabled = saved.get('audio_enabled', True)
         self.language = saved.get('language', 'en')
         self.theme = saved.get('theme', 'dark')  # Theme: 'dark' or 'light' / Tema: 'oscuro' o 'claro'
+        if self.theme not in THEMES:
+            self.theme = THEMES[0]  # Unknown theme in settings / Tema desconocido en configuración
         
         # Detect if running in web/browser environment
         try:
@@ -1345,57 +3485,74 @@ class Game:
             IS_WEB_ENV = False
         
         # Create window with appropriate mode / Crear ventana con modo apropiado
-        if IS_WEB_ENV:
-            # In web mode, use existing display created by pygbag
-            # En modo web, usar pantalla existente creada por pygbag
-            self.screen = pygame.display.get_surface()
-            if self.screen is None:
-                # Fallback: create display if not already initialized
-                self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-        elif self.fullscreen:
-            # SCALED mode maintains aspect ratio in fullscreen
-            # Modo SCALED mantiene la proporción en pantalla completa
-            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN | pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
-        else:
-            # Hardware surface for better performance in windowed mode
-            # Superficie de hardware para mejor rendimiento en modo ventana
-            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.DOUBLEBUF | pygame.HWSURFACE, vsync=1)
+        with profiler.phase('set_mode'):
+            if IS_WEB_ENV:
+                # In web mode, use existing display created by pygbag
+                # En modo web, usar pantalla existente creada por pygbag
+                self.screen = pygame.display.get_surface()
+                if self.screen is None:
+                    # Fallback: create display if not already initialized
+                    self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
+            elif self.fullscreen:
+                # SCALED mode maintains aspect ratio in fullscreen
+                # Modo SCALED mantiene la proporción en pantalla completa
+                self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.FULLSCREEN | pygame.SCALED | pygame.DOUBLEBUF, vsync=1)
+            else:
+                # Hardware surface for better performance in windowed mode
+                # Superficie de hardware para mejor rendimiento en modo ventana
+                self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.DOUBLEBUF | pygame.HWSURFACE, vsync=1)
         
         if not IS_WEB_ENV:
             pygame.display.set_caption("Pong AI - Incredible Edition")
             
             # Set window icon (32x32 colorful pong scene) - Desktop only
             # Configurar ícono de ventana (escena pong colorida 32x32) - Solo escritorio
-            icon = create_window_icon()
-            pygame.display.set_icon(icon)
-            
-            # Save icon as .ico file for Windows taskbar (requires PIL/Pillow)
-            # Guardar ícono como archivo .ico para barra de tareas de Windows (requiere PIL/Pillow)
-            try:
-                from PIL import Image
-                icon_path = Path(__file__).parent / 'icon.ico'
-                # Convert pygame surface to PIL Image / Convertir superficie pygame a imagen PIL
-                icon_str = pygame.image.tostring(icon, 'RGBA')
-                pil_icon = Image.frombytes('RGBA', icon.get_size(), icon_str)
-                pil_icon.save(str(icon_path), format='ICO', sizes=[(32, 32)])
-            except Exception:
-                # PIL not installed or error during conversion - not critical
-                # PIL no instalado o error durante conversión - no crítico
-                pass
+            with profiler.phase('window_icon'):
+                self._window_icon = create_window_icon()
+                pygame.display.set_icon(self._window_icon)
+        else:
+            self._window_icon = None
         
-        # Create pixel art title logo for menu / Crear logo pixel art para menú
-        self.title_logo = create_title_logo()
+        # Baked asset cache (warm starts skip procedural generation)
+        # Caché de recursos horneados (inicios en caliente omiten la generación procedural)
+        self.asset_cache = AssetCache()
+        self.theme_atlas = ThemeAtlas(self.asset_cache, (SCREEN_WIDTH, SCREEN_HEIGHT))
+        
+        # Produced by load() / Producidos por load()
+        self.loaded = False
+        self.title_logo = None  # Pixel art title logo for menu / Logo pixel art para menú
+        self.sounds = dict.fromkeys(SOUND_BANK_NAMES)  # Silent until loaded / Silencio hasta cargar
+        self.sound_cache = SoundCache()  # Power-up effect variants / Variantes de efectos de power-up
+        self.voices = VoiceManager()  # Channel pooling and voice stealing / Agrupación de canales y robo de voces
+        self.music = MusicStream(self.voices)  # Procedural background music / Música de fondo procedural
         
         # Initialize pygame subsystems / Inicializar subsistemas pygame
-        self.clock = pygame.time.Clock()
-        self.font = pygame.font.Font(None, 36)  # Medium text / Texto mediano
-        self.large_font = pygame.font.Font(None, 72)  # Scores / Puntajes
-        self.small_font = pygame.font.Font(None, 28)  # Small UI text / Texto UI pequeño
+        with profiler.phase('fonts'):
+            self.clock = pygame.time.Clock()
+            self.fonts = FontRegistry()  # Shared font instances / Instancias de fuente compartidas
+            self.fonts.preload()  # Every screen's sizes up front / Los tamaños de cada pantalla por adelantado
+            self.font = self.fonts.get(36)  # Medium text / Texto mediano
+            self.large_font = self.fonts.get(72)  # Scores / Puntajes
+            self.small_font = self.fonts.get(28)  # Small UI text / Texto UI pequeño
         
         # Rendering surfaces for performance optimization / Superficies de renderizado para optimización
-        self._game_layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        self._tint_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        self._sweep_surface = pygame.Surface((SCREEN_WIDTH, 140), pygame.SRCALPHA)
+        with profiler.phase('render_surfaces'):
+            self._game_layer = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+            self._tint_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+            self._sweep_surface = pygame.Surface((SCREEN_WIDTH, 140), pygame.SRCALPHA)
+            self.ball_trails = TrailBuffer()  # Match ball trails / Estelas de la partida
+            self._demo_trails = TrailBuffer()  # Menu demo trail / Estela de la demo del menú
+            self.bloom = BloomPass()  # Optional full-screen glow (F4) / Brillo de pantalla completa opcional (F4)
+            self.bloom_enabled = False
+            self.text_cache = TextCache()  # Rendered strings / Cadenas renderizadas
+            self._button_cache = collections.OrderedDict()  # Finished buttons / Botones terminados
+            self.button_cache_misses = 0
+            # Retained layers of the playing screen / Capas retenidas de la pantalla de juego
+            self.compositor = LayerCompositor()
+            self.compositor.add('background', lambda key: self.base_background)
+            self.compositor.add('center_line', self._render_center_line, capacity=CENTER_LINE_STEPS)
+            self._hud_surface = pygame.Surface((SCREEN_WIDTH, HUD_LAYER_HEIGHT), pygame.SRCALPHA)
+            self.compositor.add('hud', self._render_hud_layer)
         self._cached_bg_phase = -1.0  # Background animation phase cache / Caché de fase de animación de fondo
         self._cached_background = None  # Cached background surface / Superficie de fondo en caché
         
@@ -1408,9 +3565,15 @@ class Game:
         self.player_score = 0
         self.ai_score = 0
         
-        # Particle system (object pooling for performance) / Sistema de partículas (pooling de objetos para rendimiento)
-        self.particle_pool = ParticlePool(360)  # Pre-allocate 360 particles / Pre-asignar 360 partículas
-        self.particles = []
+        # Particle system (preallocated NumPy arrays) / Sistema de partículas (arreglos NumPy preasignados)
+        self.particles = ParticleSystem(2048)
+        self.emitters = build_emitters()  # Burst presets (+ EMITTERS_FILE) / Preajustes de ráfaga
+        self.particle_renderer = next(iter(PARTICLE_RENDERERS))  # Active renderer name / Nombre del renderizador activo
+        self._particle_renderers = {}  # name -> renderer instance / nombre -> instancia
+        self.particle_draw_ms = {}  # name -> smoothed draw time / nombre -> tiempo de dibujo suavizado
+        self.quality = QualityGovernor()  # Adaptive effect tiers / Niveles de efectos adaptativos
+        self.dirty = DirtyRegions(on_present=self.quality.end_work)  # Partial presents for static screens / Presentación parcial en pantallas estáticas
+        self._apply_quality()
         
         # UI state / Estado UI
         self.difficulty_hitboxes = []  # Clickable difficulty buttons / Botones de dificultad clickeables
@@ -1448,6 +3611,12 @@ class Game:
         self.left_pop = 0.0  # Left paddle hit animation / Animación de golpe de paleta izquierda
         self.right_pop = 0.0  # Right paddle hit animation / Animación de golpe de paleta derecha
         self.score_bursts = []  # Active score burst effects / Efectos de ráfaga de puntaje activos
+        # Pools for transient entities / Pools para entidades transitorias
+        self.pools = {
+            'burst': ObjectPool(ScoreBurst, capacity=8),
+            'powerup': ObjectPool(PowerUp, capacity=8),
+            'ball': ObjectPool(Ball, capacity=8),
+        }
         
         # Power-up system (Phase 2 feature) / Sistema de power-ups (característica Fase 2)
         self.powerups: list = []  # Active power-ups / Power-ups activos
@@ -1495,12 +3664,9 @@ class Game:
         self.demo_player_score = 0
         self.demo_ai_score = 0
         
-        # Disable audio if settings say so / Deshabilitar audio si la configuración lo dice
-        if not self.audio_enabled:
-            pygame.mixer.stop()
-        
-        # Create audio assets / Crear recursos de audio
-        self._create_assets()
+        # Bake assets and sounds behind the splash screen / Hornear recursos y sonidos detrás de la pantalla de carga
+        if not (IS_WEB if defer_loading is None else defer_loading):
+            self.load()
     
     def t(self, key):
         """
@@ -1543,7 +3709,7 @@ class Game:
         Alternar audio encendido/apagado y guardar configuración.
         """
         self.audio_enabled = not self.audio_enabled
-        if not self.audio_enabled:
+        if not self.audio_enabled and pygame.mixer.get_init():
             pygame.mixer.stop()  # Stop all sounds / Detener todos los sonidos
         save_settings(self.fullscreen, self.show_debug_hud, self.diff_index, self.audio_enabled, self.language, self.theme)
     
@@ -1553,44 +3719,33 @@ class Game:
         Alternar entre inglés y español.
         """
         self.language = 'es' if self.language == 'en' else 'en'
+        self._button_cache.clear()  # Labels changed / Las etiquetas cambiaron
         save_settings(self.fullscreen, self.show_debug_hud, self.diff_index, self.audio_enabled, self.language, self.theme)
     
     def toggle_theme(self):
         """
-        Toggle between dark and light mode.
-        Alternar entre modo oscuro y claro.
+        Cycle to the next theme (dark -> light -> ...).
+        Cambiar al siguiente tema (oscuro -> claro -> ...).
         """
-        self.theme = 'light' if self.theme == 'dark' else 'dark'
+        self.theme = self.theme_atlas.next_theme(self.theme)
         print(f"[Theme] Switched to {self.theme} mode")  # Debug
         
-        # RECREATE base background surface with new theme colors
-        self.base_background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        for y in range(SCREEN_HEIGHT):
-            t = y / SCREEN_HEIGHT
-            if self.theme == 'light':
-                # Light mode: Darker gray-brown #8B7E74 (139,126,116) for better contrast
-                r = int(139 - 25 * t)  # 139 → 114
-                g = int(126 - 22 * t)  # 126 → 104
-                b = int(116 - 20 * t)  # 116 → 96
-            else:
-                # Dark mode: Dark gray #1E1E24 (30,30,36)
-                r = int(30 + 15 * t)  # 30 → 45
-                g = int(30 + 15 * t)  # 30 → 45
-                b = int(36 + 20 * t)  # 36 → 56
-            pygame.draw.line(self.base_background, (r, g, b), (0, y), (SCREEN_WIDTH, y))
+        # Prebuilt background - reference swap only / Fondo preconstruido - solo cambio de referencia
+        self.base_background = self.theme_atlas.get(self.theme)
+        self._button_cache.clear()
         
         save_settings(self.fullscreen, self.show_debug_hud, self.diff_index, self.audio_enabled, self.language, self.theme)
     
-    def _play_sound(self, sound):
+    def _play_sound(self, name):
         """
-        Play sound if audio is enabled.
-        Reproducir sonido si el audio está habilitado.
+        Play a shared sound effect through the voice manager if audio is enabled.
+        Reproducir un efecto compartido mediante el gestor de voces si el audio está habilitado.
         
         Args / Argumentos:
-            sound (pygame.mixer.Sound): Sound to play / Sonido a reproducir
+            name (str): 'bounce', 'score' or 'paddle' (also the voice category) / (también la categoría de voz)
         """
         if self.audio_enabled:
-            sound.play()
+            self.voices.play(self.sounds.get(name), name)
     
     def play_sound(self, sound_type, pitch=1.0):
         """
@@ -1601,30 +3756,13 @@ class Game:
             sound_type (str): Type of sound / Tipo de sonido
             pitch (float): Pitch multiplier / Multiplicador de tono
         """
-        if not self.audio_enabled:
+        if not self.audio_enabled or not init_audio():
             return
         
         try:
-            if sound_type == 'powerup_collect':
-                # Rising arpeggio / Arpegio ascendente
-                duration = 0.05
-                for freq in [500, 650, 800, 1000]:
-                    samples = int(44100 * duration)
-                    wave = np.sin(2 * np.pi * freq * pitch * np.linspace(0, duration, samples))
-                    wave = (wave * 8000).astype(np.int16)
-                    stereo = np.column_stack((wave, wave))
-                    sound = pygame.sndarray.make_sound(stereo)
-                    sound.play()
-            elif sound_type == 'powerup_expire':
-                # Descending tone / Tono descendente
-                duration = 0.3
-                samples = int(44100 * duration)
-                freqs = np.linspace(600, 300, samples)
-                wave = np.sin(2 * np.pi * freqs * np.linspace(0, duration, samples))
-                wave = (wave * 6000).astype(np.int16)
-                stereo = np.column_stack((wave, wave))
-                sound = pygame.sndarray.make_sound(stereo)
-                sound.play()
+            # Pre-synthesized variants; misses are synthesized once and kept
+            # Variantes pre-sintetizadas; los fallos se sintetizan una vez y se guardan
+            self.voices.play(self.sound_cache.get(sound_type, pitch), 'powerup')
         except Exception:
             pass  # Audio synthesis failed, not critical / Síntesis de audio falló, no crítico
     
@@ -1696,8 +3834,7 @@ class Game:
         self.ai_score = 0
         self.left_pop = 0.0
         self.right_pop = 0.0
-        self.score_bursts.clear()
-        self._clear_particles()
+        self._clear_effects()
         self.dragging = False
         self.menu_hover_index = None
         self.state = "playing"
@@ -1796,49 +3933,169 @@ class Game:
             self.demo_player_score += 1
             self.demo_ball.reset()
     
-    def _create_assets(self):
-        """
-        Create visual assets (background, vignette, scanlines, glow).
-        Crear recursos visuales (fondo, viñeta, líneas de escaneo, brillo).
-        """
-        # Create gradient background based on theme / Crear fondo con gradiente según tema
-        # Dark mode: #1E1E24 (30,30,36), Light mode: #8B7E74 (139,126,116)
-        self.base_background = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-        for y in range(SCREEN_HEIGHT):
-            t = y / SCREEN_HEIGHT  # Vertical position ratio / Ratio de posición vertical
-            if self.theme == 'light':
-                # Light mode: Darker gray-brown #8B7E74 for better contrast
-                r = int(139 - 25 * t)  # 139 → 114
-                g = int(126 - 22 * t)  # 126 → 104
-                b = int(116 - 20 * t)  # 116 → 96
-            else:
-                # Dark mode: Dark gray #1E1E24
-                r = int(30 + 15 * t)  # 30 → 45 dark gray
-                g = int(30 + 15 * t)  # 30 → 45
-                b = int(36 + 20 * t)  # 36 → 56 subtle blue tint
-            pygame.draw.line(self.base_background, (r, g, b), (0, y), (SCREEN_WIDTH, y))
-        
-        # Create vignette effect (darkens edges) / Crear efecto viñeta (oscurece bordes)
-        self.vignette = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        cx, cy = SCREEN_WIDTH / 2, SCREEN_HEIGHT / 2
-        max_dist = math.hypot(cx, cy)
-        for y in range(SCREEN_HEIGHT):
-            for x in range(SCREEN_WIDTH):
-                # Distance from center / Distancia desde el centro
-                dist = math.hypot(x - cx, y - cy)
-                # Alpha increases with distance / Alpha aumenta con distancia
-                alpha = int(200 * max(0, (dist / max_dist) - 0.35))
-                if alpha > 0:
-                    self.vignette.set_at((x, y), (0, 0, 0, min(255, alpha)))
+    def _loading_steps(self):
+        """
+        Loading pipeline: (name, work, finish) tuples.
+        Tubería de carga: tuplas (nombre, trabajo, final).
+        
+        `work` runs on a worker thread and must not touch the display or mixer;
+        `finish` receives its result on the main thread.
+        `work` se ejecuta en un hilo y no debe tocar la pantalla ni el mezclador;
+        `finish` recibe su resultado en el hilo principal.
+        """
+        size = (SCREEN_WIDTH, SCREEN_HEIGHT)
+        cache = self.asset_cache
+        
+        def export_icon():
+            # Save icon as .ico file for Windows taskbar (requires PIL/Pillow)
+            # Guardar ícono como archivo .ico para barra de tareas de Windows (requiere PIL/Pillow)
+            if self._window_icon is None:
+                return
+            try:
+                from PIL import Image
+                icon_path = Path(__file__).parent / 'icon.ico'
+                # Convert pygame surface to PIL Image / Convertir superficie pygame a imagen PIL
+                icon_str = pygame.image.tostring(self._window_icon, 'RGBA')
+                pil_icon = Image.frombytes('RGBA', self._window_icon.get_size(), icon_str)
+                pil_icon.save(str(icon_path), format='ICO', sizes=[(32, 32)])
+            except Exception:
+                # PIL not installed or error during conversion - not critical
+                # PIL no instalado o error durante conversión - no crítico
+                pass
         
-        # Create scanlines effect (CRT monitor look) / Crear efecto líneas de escaneo (apariencia monitor CRT)
-        self.scanlines = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        for y in range(0, SCREEN_HEIGHT, 4):
-            pygame.draw.rect(self.scanlines, (0, 0, 0, 40), (0, y, SCREEN_WIDTH, 2))
+        def bake_overlays():
+            # Loaded from the asset cache or built with NumPy (see PROCEDURAL ASSETS)
+            # Cargados de la caché de recursos o construidos con NumPy (ver RECURSOS PROCEDURALES)
+            return {
+                'vignette': cache.get_or_build('vignette', size, lambda: build_vignette(*size), convert=False),  # Darkens edges / Oscurece bordes
+                'scanlines': cache.get_or_build('scanlines', size, lambda: build_scanlines(*size), convert=False),  # CRT monitor look / Apariencia monitor CRT
+                'center_glow': cache.get_or_build('center_glow', size, lambda: build_center_glow(*size), convert=False),  # Center glow / Brillo central
+            }
+        
+        def adopt_overlays(raw):
+            for name, surface in raw.items():
+                setattr(self, name, AssetCache.finalize(surface))
+        
+        def adopt_backgrounds(_):
+            # Every theme prebuilt; toggle_theme only swaps references
+            # Todos los temas preconstruidos; toggle_theme solo cambia referencias
+            self.theme_atlas.start(self.theme)
+            self.base_background = self.theme_atlas.get(self.theme)  # Theme gradient / Gradiente del tema
+        
+        def synth_sounds():
+            # Shared effects and prewarmed variants in one bank / Efectos compartidos y variantes en un banco
+            patches = {name: SFX_PATCHES[name] for name in SOUND_BANK_NAMES}
+            patches.update(self.sound_cache.patches(EFFECT_PREWARM))
+            return load_or_render_bank(patches)
+        
+        def adopt_sounds(bank):
+            # Audio subsystem and shared sound bank / Subsistema de audio y banco de sonidos compartido
+            init_audio()
+            self.voices.setup()
+            sounds = get_sound_bank(bank)
+            self.sounds = {name: sounds.get(name) for name in SOUND_BANK_NAMES}
+            self.sound_cache.adopt(sounds)
+            # Disable audio if settings say so / Deshabilitar audio si la configuración lo dice
+            if not self.audio_enabled and pygame.mixer.get_init():
+                pygame.mixer.stop()
+        
+        def adopt_title_logo(raw):
+            self.title_logo = AssetCache.finalize(raw)
+        
+        def render_burst_frames():
+            return {color: ScoreBurst.render_frames(color) for color in SCORE_BURST_COLORS}
+        
+        return [
+            ('icon_ico_export', export_icon, None),
+            ('title_logo', lambda: cache.get_or_build('title_logo', (480, 100), create_title_logo, convert=False), adopt_title_logo),
+            ('backgrounds', self.theme_atlas.bake, adopt_backgrounds),
+            ('overlays', bake_overlays, adopt_overlays),
+            ('score_bursts', render_burst_frames, ScoreBurst.frames.update),
+            ('sounds', synth_sounds, adopt_sounds),
+            ('external_ip', prefetch_external_ip, None),  # Returns at once, lookup continues in background / Retorna de inmediato
+        ]
+    
+    def _finish_step(self, name, finish, value):
+        """Run a step's main-thread half. / Ejecutar la mitad de hilo principal de un paso."""
+        if finish is not None:
+            with self._profiler.phase(f'adopt:{name}'):
+                finish(value)
+    
+    def load(self):
+        """
+        Run loading steps on a worker thread while the main thread draws the splash.
+        Ejecutar pasos de carga en un hilo mientras el hilo principal dibuja la pantalla de carga.
+        """
+        if self.loaded:
+            return
+        steps = self._loading_steps()
+        results = queue.Queue()
+        
+        def worker():
+            for name, work, _ in steps:
+                try:
+                    with self._profiler.phase(name):
+                        value = work()
+                except Exception as e:
+                    results.put((e, True))
+                    return
+                results.put((value, False))
+        
+        threading.Thread(target=worker, daemon=True).start()
+        done = 0
+        while done < len(steps):
+            self._draw_splash(done / len(steps))
+            try:
+                value, failed = results.get(timeout=1 / 60)
+            except queue.Empty:
+                continue  # Keep the window responsive / Mantener la ventana receptiva
+            if failed:
+                raise value
+            name, _, finish = steps[done]
+            self._finish_step(name, finish, value)
+            done += 1
+        self.loaded = True
+    
+    async def load_async(self):
+        """
+        Run loading steps inline, yielding to the browser between steps (no threads in pygbag).
+        Ejecutar pasos de carga en línea, cediendo al navegador entre pasos (sin hilos en pygbag).
+        """
+        if self.loaded:
+            return
+        steps = self._loading_steps()
+        for index, (name, work, finish) in enumerate(steps):
+            self._draw_splash(index / len(steps))
+            await asyncio.sleep(0)  # Let the page (and docs/loading.html) animate / Dejar que la página anime
+            with self._profiler.phase(name):
+                value = work()
+            self._finish_step(name, finish, value)
+        self.loaded = True
+    
+    def _draw_splash(self, progress):
+        """
+        Minimal loading screen: title and progress bar.
+        Pantalla de carga mínima: título y barra de progreso.
         
-        # Create center glow effect / Crear efecto de brillo central
-        self.center_glow = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        pygame.draw.circle(self.center_glow, (140, 40, 200, 120), (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2), SCREEN_HEIGHT // 2)
+        Args / Argumentos:
+            progress (float): 0.0 to 1.0 / 0.0 a 1.0
+        """
+        cx, cy = SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2
+        self.screen.fill((15, 15, 20))
+        title = self.text(self.large_font, self.t('title'), WHITE)
+        self.screen.blit(title, title.get_rect(center=(cx, cy - 60)))
+        bar = pygame.Rect(0, 0, 360, 14)
+        bar.center = (cx, cy + 10)
+        fill = bar.inflate(-6, -6)
+        fill.width = int(fill.width * max(0.0, min(1.0, progress)))
+        if fill.width > 0:
+            pygame.draw.rect(self.screen, (100, 220, 255), fill, border_radius=4)
+        pygame.draw.rect(self.screen, (80, 120, 200), bar, 2, border_radius=7)
+        label = self.text(self.small_font, f"{self.t('loading')}... {int(progress * 100)}%", (150, 150, 170))
+        self.screen.blit(label, label.get_rect(center=(cx, cy + 50)))
+        pygame.display.flip()
+        pygame.event.pump()  # Window stays responsive while loading / La ventana sigue respondiendo al cargar
+    
     def check_collision(self):
         """
         Check ball collisions with paddles and score boundaries.
@@ -1854,7 +4111,7 @@ class Game:
             self._reflect_ball(self.player)
             self.create_particles(self.ball.x, self.ball.y + self.ball.size / 2, BLUE)
             self._shake(0.12, 4)  # Screen shake effect / Efecto de sacudida de pantalla
-            self._play_sound(paddle_sound)
+            self._play_sound('paddle')
         
         # AI paddle collision / Colisión con paleta IA
         if ball_rect.colliderect(ai_rect) and self.ball.speed_x > 0:
@@ -1862,7 +4119,7 @@ class Game:
             self._reflect_ball(self.ai)
             self.create_particles(self.ball.x + self.ball.size, self.ball.y + self.ball.size / 2, GREEN)
             self._shake(0.12, 4)
-            self._play_sound(paddle_sound)
+            self._play_sound('paddle')
         
         # Left boundary - AI scores / Límite izquierdo - IA anota
         if ball_rect.right < 0:
@@ -1876,22 +4133,14 @@ class Game:
                 if self.audio_enabled:
                     self.play_sound('powerup_collect', pitch=0.8)
                 # Visual feedback / Retroalimentación visual
-                for _ in range(40):
-                    particle = self.particle_pool.acquire()
-                    particle.reset(50, SCREEN_HEIGHT // 2, POWERUP_COLORS['shield'], size=4, life=0.6)
-                    angle = random.random() * math.tau
-                    speed = random.uniform(100, 300)
-                    particle.speed_x = math.cos(angle) * speed
-                    particle.speed_y = math.sin(angle) * speed
-                    particle.initial_life = particle.life
-                    self.particles.append(particle)
+                self.emit_burst('shield_break', 50, SCREEN_HEIGHT // 2, POWERUP_COLORS['shield'])
             else:
                 self.ai_score += 1
                 self.right_pop = 0.5  # Paddle pop animation / Animación de pop de paleta
                 self.spawn_score_burst('right')
                 self.ball.reset(direction=1)  # Reset towards player / Resetear hacia jugador
                 self._shake(0.25, 8)
-                self._play_sound(score_sound)
+                self._play_sound('score')
         # Right boundary - Player scores / Límite derecho - Jugador anota
         elif ball_rect.left > SCREEN_WIDTH:
             self.player_score += 1
@@ -1899,28 +4148,33 @@ class Game:
             self.spawn_score_burst('left')
             self.ball.reset(direction=-1)  # Reset towards AI / Resetear hacia IA
             self._shake(0.25, 8)
-            self._play_sound(score_sound)
+            self._play_sound('score')
         
         # Check win condition / Verificar condición de victoria
         if self.player_score >= WIN_SCORE or self.ai_score >= WIN_SCORE:
             self.state = "gameover"
             self.gameover_phase = 0.0
             self.dragging = False
-            self._play_sound(bounce_sound)
+            self._play_sound('bounce')
+    
+    def _clear_effects(self):
+        """
+        Clear particles and score bursts, then shrink entity pools to their recent peak.
+        Limpiar partículas y ráfagas de puntaje, luego reducir los pools a su pico reciente.
+        """
+        self._clear_particles()
+        self.ball_trails.clear()
+        self.pools['burst'].release_all(self.score_bursts)
+        for pool in self.pools.values():
+            pool.trim()
     
     def _clear_particles(self):
         """
-        Clear all particles and return to pool.
-        Limpiar todas las partículas y devolver al pool.
+        Clear all particles (counts are on the performance HUD).
+        Limpiar todas las partículas (los conteos están en el HUD de rendimiento).
         """
-        if not self.particles:
-            return
-        particle_count = len(self.particles)
-        print(f"[Debug] Clearing {particle_count} particles")
-        for particle in self.particles:
-            self.particle_pool.release(particle)
-        self.particles.clear()
-        print(f"[Debug] Particles cleared, pool size: {len(self.particle_pool._pool)}")
+        if self.particles:
+            self.particles.clear()
     
     def create_particles(self, x, y, color):
         """
@@ -1931,16 +4185,22 @@ class Game:
             x, y (float): Position / Posición
             color (tuple): Base RGB color / Color RGB base
         """
-        for _ in range(12):
-            # Vary color slightly for visual interest / Variar color ligeramente para interés visual
-            varied = (
-                max(0, min(255, color[0] + random.randint(-20, 40))),
-                max(0, min(255, color[1] + random.randint(-20, 40))),
-                max(0, min(255, color[2] + random.randint(-20, 40)))
-            )
-            particle = self.particle_pool.acquire()
-            particle.reset(x, y, varied)
-            self.particles.append(particle)
+        self.emit_burst('hit', x, y, color)
+    
+    def emit_burst(self, preset, x, y, color):
+        """
+        Spawn one burst from a named emitter preset.
+        Generar una ráfaga desde un preajuste de emisor con nombre.
+        
+        Args / Argumentos:
+            preset (str): Key in EMITTER_PRESETS / Clave en EMITTER_PRESETS
+            x, y (float): Origin / Origen
+            color (tuple): Base RGB color / Color RGB base
+        """
+        emitter = self.emitters[preset]
+        # Quality tier thins bursts / El nivel de calidad reduce las ráfagas
+        count = max(1, round(emitter.count * self.quality.tier['particle_scale']))
+        emitter.emit(self.particles, x, y, color, count)
     
     def update_particles(self, dt):
         """
@@ -1950,12 +4210,9 @@ class Game:
         Args / Argumentos:
             dt (float): Delta time / Delta de tiempo
         """
-        if not self.particles:
-            return
-        # Keep only alive particles, release dead ones to pool
-        # Mantener solo partículas vivas, devolver muertas al pool
-        alive = [p for p in self.particles if p.update(dt) or not self.particle_pool.release(p)]
-        self.particles = alive
+        # One vectorized step; dead slots return to the free stack
+        # Un paso vectorizado; los huecos muertos vuelven a la pila libre
+        self.particles.update(dt)
     
     def spawn_score_burst(self, side):
         """
@@ -1970,45 +4227,63 @@ class Game:
         target_y = 92
         
         # Create expanding ring / Crear anillo expansivo
-        self.score_bursts.append(ScoreBurst(target_x, target_y, ORANGE))
+        self.score_bursts.append(self.pools['burst'].acquire(target_x, target_y, ORANGE))
         
         # Create explosion particles / Crear partículas de explosión
-        for _ in range(28):
-            # Color variation / Variación de color
-            varied = (
-                max(0, min(255, ORANGE[0] + random.randint(-15, 35))),
-                max(0, min(255, ORANGE[1] + random.randint(-20, 20))),
-                max(0, min(255, ORANGE[2] + random.randint(-30, 30)))
-            )
-            particle = self.particle_pool.acquire()
-            particle.reset(target_x, target_y, varied, size=random.randint(3, 7), life=random.uniform(0.28, 0.55))
-            
-            # Random direction / Dirección aleatoria
-            angle = random.random() * math.tau
-            speed = random.uniform(180, 420)
-            particle.speed_x = math.cos(angle) * speed
-            particle.speed_y = math.sin(angle) * speed
-            particle.initial_life = particle.life
-            self.particles.append(particle)
+        self.emit_burst('score', target_x, target_y, ORANGE)
     
     def update_score_bursts(self, dt):
         """Update score burst effects. / Actualizar efectos de ráfaga de puntaje."""
         if not self.score_bursts:
             return
-        for burst in self.score_bursts:
-            burst.update(dt)
-        # Remove dead bursts / Eliminar ráfagas muertas
-        self.score_bursts = [b for b in self.score_bursts if b.alive()]
+        bursts = self.score_bursts
+        # Reverse walk so dead bursts can be popped in place / Recorrido inverso para quitar ráfagas muertas en el sitio
+        for i in range(len(bursts) - 1, -1, -1):
+            bursts[i].update(dt)
+            if not bursts[i].alive():
+                self.pools['burst'].release(bursts.pop(i))
     
     def draw_score_bursts(self, surface):
         """Draw all score bursts. / Dibujar todas las ráfagas de puntaje."""
         for burst in self.score_bursts:
             burst.draw(surface)
     
-    def draw_particles(self, surface):
-        """Draw all particles. / Dibujar todas las partículas."""
-        for p in self.particles:
-            p.draw(surface)
+    def draw_particles(self, surface, offset=(0, 0)):
+        """
+        Draw all particles with the active renderer.
+        Dibujar todas las partículas con el renderizador activo.
+        
+        Args / Argumentos:
+            surface (pygame.Surface): Entity layer / Capa de entidades
+            offset (tuple): Where the layer will be blitted (screen shake); additive renderers
+                            draw straight to the screen and apply it themselves
+                            Dónde se dibujará la capa (sacudida); los renderizadores aditivos
+                            dibujan directo en pantalla y lo aplican ellos mismos
+        """
+        name = self.particle_renderer
+        if getattr(PARTICLE_RENDERERS[name], 'additive', False) and not self.quality.tier['post_effects']:
+            # Governor disabled post effects: fall back to the atlas
+            # El gobernador desactivó los efectos posteriores: volver al atlas
+            name = 'atlas'
+        renderer = self._particle_renderers.get(name)
+        if renderer is None:
+            renderer = self._particle_renderers[name] = PARTICLE_RENDERERS[name]()
+        start = time.perf_counter()
+        if getattr(renderer, 'additive', False):
+            # Additive glow goes straight onto the opaque screen, beneath the game layer
+            # El brillo aditivo va directo a la pantalla opaca, bajo la capa del juego
+            renderer.draw(self.particles, self.screen, offset)
+        else:
+            renderer.draw(self.particles, surface)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        previous = self.particle_draw_ms.get(name)
+        self.particle_draw_ms[name] = elapsed_ms if previous is None else previous * 0.9 + elapsed_ms * 0.1
+    
+    def cycle_particle_renderer(self):
+        """Switch to the next particle renderer (F3). / Cambiar al siguiente renderizador de partículas (F3)."""
+        names = list(PARTICLE_RENDERERS)
+        self.particle_renderer = names[(names.index(self.particle_renderer) + 1) % len(names)]
+        print(f"[Particles] Renderer: {self.particle_renderer}")
     
     # ============================================================================
     # POWER-UP SYSTEM METHODS / MÉTODOS DEL SISTEMA DE POWER-UPS
@@ -2045,7 +4320,7 @@ class Game:
         x = SCREEN_WIDTH // 2 + random.randint(-200, 200)
         y = random.randint(100, SCREEN_HEIGHT - 100)
         
-        powerup = PowerUp(
+        powerup = self.pools['powerup'].acquire(
             type=powerup_type,
             x=x,
             y=y,
@@ -2055,16 +4330,7 @@ class Game:
         self.powerups.append(powerup)
         
         # Spawn particle effect / Efecto de partículas al aparecer
-        color = POWERUP_COLORS[powerup_type]
-        for _ in range(15):
-            particle = self.particle_pool.acquire()
-            particle.reset(x, y, color, size=3, life=0.5)
-            angle = random.random() * math.tau
-            speed = random.uniform(50, 150)
-            particle.speed_x = math.cos(angle) * speed
-            particle.speed_y = math.sin(angle) * speed
-            particle.initial_life = particle.life
-            self.particles.append(particle)
+        self.emit_burst('powerup_spawn', x, y, POWERUP_COLORS[powerup_type])
     
     def update_powerups(self, dt):
         """
@@ -2087,6 +4353,7 @@ class Game:
             # Remove expired power-ups / Eliminar power-ups expirados
             if powerup.lifetime <= 0:
                 self.powerups.remove(powerup)
+                self.pools['powerup'].release(powerup)
     
     def check_powerup_collision(self, paddle):
         """
@@ -2114,16 +4381,8 @@ class Game:
                     self.play_sound('powerup_collect', pitch=1.5)
                 
                 # Particle burst at collection point / Ráfaga de partículas en punto de recolección
-                color = POWERUP_COLORS[powerup.type]
-                for _ in range(25):
-                    particle = self.particle_pool.acquire()
-                    particle.reset(powerup.x, powerup.y, color, size=random.randint(2, 5), life=random.uniform(0.3, 0.6))
-                    angle = random.random() * math.tau
-                    speed = random.uniform(100, 300)
-                    particle.speed_x = math.cos(angle) * speed
-                    particle.speed_y = math.sin(angle) * speed
-                    particle.initial_life = particle.life
-                    self.particles.append(particle)
+                self.emit_burst('powerup_collect', powerup.x, powerup.y, POWERUP_COLORS[powerup.type])
+                self.pools['powerup'].release(powerup)
     
     def activate_powerup(self, type: str):
         """
@@ -2140,7 +4399,7 @@ class Game:
         elif type == 'multi_ball':
             # Create 2 additional balls / Crear 2 bolas adicionales
             for _ in range(2):
-                new_ball = Ball()
+                new_ball = self.pools['ball'].acquire()
                 new_ball.x = self.ball.x
                 new_ball.y = self.ball.y
                 new_ball.speed_x = self.ball.speed_x * random.uniform(0.8, 1.2)
@@ -2224,10 +4483,13 @@ class Game:
         if self.audio_enabled:
             self.play_sound('powerup_expire')
     
-    def draw_powerups(self):
+    def draw_powerups(self, surface):
         """
         Draw all active power-ups.
         Dibujar todos los power-ups activos.
+        
+        Args / Argumentos:
+            surface (pygame.Surface): Entity layer, so bloom picks them up / Capa de entidades, para que el bloom los incluya
         """
         for powerup in self.powerups:
             if not powerup.active:
@@ -2237,18 +4499,20 @@ class Game:
             glow_intensity = 0.5 + 0.5 * math.sin(powerup.glow_phase)
             color = POWERUP_COLORS[powerup.type]
             
-            # Draw glow / Dibujar brillo
-            glow_radius = int(powerup.size * (1.5 + 0.3 * glow_intensity))
-            glow_surf = pygame.Surface((glow_radius * 2, glow_radius * 2), pygame.SRCALPHA)
-            pygame.draw.circle(glow_surf, (*color, 50), (glow_radius, glow_radius), glow_radius)
-            self.screen.blit(glow_surf, (powerup.x - glow_radius, powerup.y - glow_radius))
+            # Draw glow; the pulse snaps to GLOW_RADIUS_STEPS cached radii
+            # Dibujar brillo; el pulso se ajusta a GLOW_RADIUS_STEPS radios en caché
+            if self.object_glow:
+                step = round(glow_intensity * (GLOW_RADIUS_STEPS - 1)) / (GLOW_RADIUS_STEPS - 1)
+                glow_radius = int(powerup.size * (1.5 + 0.3 * step))
+                glow_surf = glow_sprites.get('circle', glow_radius * 2, color, 50)
+                surface.blit(glow_surf, (powerup.x - glow_radius, powerup.y - glow_radius))
             
             # Draw power-up circle / Dibujar círculo del power-up
-            pygame.draw.circle(self.screen, color, (int(powerup.x), int(powerup.y)), int(powerup.size / 2))
+            pygame.draw.circle(surface, color, (int(powerup.x), int(powerup.y)), int(powerup.size / 2))
             
             # Draw inner highlight / Dibujar resaltado interior
             highlight_color = tuple(min(255, c + 80) for c in color)
-            pygame.draw.circle(self.screen, highlight_color, (int(powerup.x), int(powerup.y)), int(powerup.size / 4))
+            pygame.draw.circle(surface, highlight_color, (int(powerup.x), int(powerup.y)), int(powerup.size / 4))
     
     def draw_active_effects_hud(self):
         """
@@ -2264,14 +4528,11 @@ class Game:
             color = POWERUP_COLORS[effect_type]
             
             # Draw icon background / Dibujar fondo del ícono
-            icon_surf = pygame.Surface((40, 40), pygame.SRCALPHA)
-            pygame.draw.circle(icon_surf, (*color, 200), (20, 20), 18)
-            pygame.draw.circle(icon_surf, (255, 255, 255, 100), (20, 20), 10)
-            self.screen.blit(icon_surf, (SCREEN_WIDTH - 60, y_offset))
+            self.screen.blit(glow_sprites.get('icon', 40, color, 200), (SCREEN_WIDTH - 60, y_offset))
             
             # Draw timer text / Dibujar texto del temporizador
             if time_remaining > 0:
-                timer_text = self.small_font.render(f"{int(time_remaining)}s", True, WHITE)
+                timer_text = self.text(self.small_font, f"{int(time_remaining)}s", WHITE)
                 self.screen.blit(timer_text, (SCREEN_WIDTH - 55, y_offset + 45))
             
             y_offset += 70
@@ -2296,11 +4557,39 @@ class Game:
         
         Inspired by minimalist game UIs - focus on text, subtle effects only.
         Inspirado en UIs minimalistas de juegos - enfoque en texto, efectos sutiles solamente.
+        
+        The finished button is cached per (text, hovered, scale step, glow color, font size);
+        hover animations pick from the cached scale steps.
+        El botón terminado se guarda por (texto, hover, paso de escala, color de brillo, tamaño);
+        las animaciones de hover eligen entre los pasos de escala en caché.
         """
+        scale = TextCache.quantize(scale)
         if font_size is None:
             font_size = int(26 * scale)
+        key = (text, hovered, scale, tuple(glow_color), font_size)
+        button = self._button_cache.get(key)
+        if button is None:
+            self.button_cache_misses += 1
+            button = self._button_cache[key] = self._build_button(text, hovered, scale, glow_color, font_size)
+            while len(self._button_cache) > BUTTON_CACHE_SIZE:
+                self._button_cache.popitem(last=False)
+        else:
+            self._button_cache.move_to_end(key)
+        surface, btn_w, btn_h = button
+        btn_x = int(x - btn_w / 2)
+        btn_y = int(y - btn_h / 2)
+        self.screen.blit(surface, (btn_x - BUTTON_MARGIN, btn_y - BUTTON_MARGIN))
+        return pygame.Rect(btn_x, btn_y, btn_w, btn_h)
+    
+    def _build_button(self, text, hovered, scale, glow_color, font_size):
+        """
+        Render a complete button (background, glow, border, text) with a BUTTON_MARGIN border for the glow.
+        Renderizar un botón completo (fondo, brillo, borde, texto) con un margen BUTTON_MARGIN para el brillo.
         
-        font = pygame.font.Font(None, font_size)
+        Returns / Retorna:
+            tuple: (surface, btn_w, btn_h)
+        """
+        font = self.fonts.get(font_size)
         text_w, text_h = font.size(text)
         
         # Smaller padding - more compact, less boxy
@@ -2308,10 +4597,8 @@ class Game:
         padding_y = int(14 * scale)
         btn_w = text_w + padding_x * 2
         btn_h = text_h + padding_y * 2
-        btn_x = int(x - btn_w / 2)
-        btn_y = int(y - btn_h / 2)
-        
-        btn_rect = pygame.Rect(btn_x, btn_y, btn_w, btn_h)
+        m = BUTTON_MARGIN
+        button = pygame.Surface((btn_w + m * 2, btn_h + m * 2), pygame.SRCALPHA)
         
         # SUBTLE background - barely visible, not a harsh box
         gradient_surf = pygame.Surface((btn_w, btn_h), pygame.SRCALPHA)
@@ -2339,7 +4626,7 @@ class Game:
         pygame.draw.rect(mask, (255, 255, 255, 255), mask.get_rect(), border_radius=12)
         bg_surf = mask.copy()
         bg_surf.blit(gradient_surf, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
-        self.screen.blit(bg_surf, (btn_x, btn_y))
+        button.blit(bg_surf, (m, m))
         
         # Soft pastel glow when hovered - beautiful and subtle
         if hovered:
@@ -2350,7 +4637,7 @@ class Game:
                     expand = i * 4
                     rect = pygame.Rect(expand, expand, glow_surf.get_width() - expand * 2, glow_surf.get_height() - expand * 2)
                     pygame.draw.rect(glow_surf, (*glow_color, alpha), rect, border_radius=14)
-            self.screen.blit(glow_surf, (btn_x - 10, btn_y - 10))
+            button.blit(glow_surf, (m - 10, m - 10))
         
         # Pastel border - BOLDER for better visibility (2-3px)
         if hovered:
@@ -2363,22 +4650,23 @@ class Game:
         
         border_surf = pygame.Surface((btn_w, btn_h), pygame.SRCALPHA)
         pygame.draw.rect(border_surf, border_color, border_surf.get_rect(), width=border_width, border_radius=11)
-        self.screen.blit(border_surf, (btn_x, btn_y))
+        button.blit(border_surf, (m, m))
         
         # Text - the STAR of the button, not the box!
+        center = (m + (btn_w + 1) // 2, m + (btn_h + 1) // 2)  # Matches int(x - btn_w / 2) placement / Coincide con la colocación
         text_color = (255, 255, 255) if hovered else (200, 210, 230)
         text_surf = font.render(text, True, text_color)
         
         # Subtle text shadow for depth
         if hovered:
             shadow_surf = font.render(text, True, (0, 0, 0, 100))
-            shadow_rect = shadow_surf.get_rect(center=(x + 1, y + 1))
-            self.screen.blit(shadow_surf, shadow_rect)
+            shadow_rect = shadow_surf.get_rect(center=(center[0] + 1, center[1] + 1))
+            button.blit(shadow_surf, shadow_rect)
         
-        text_rect = text_surf.get_rect(center=(x, y))
-        self.screen.blit(text_surf, text_rect)
+        text_rect = text_surf.get_rect(center=center)
+        button.blit(text_surf, text_rect)
         
-        return btn_rect
+        return button, btn_w, btn_h
     
     def _draw_toggle(self, x, y, enabled, hovered, switch_w=80, switch_h=36):
         """
@@ -2451,6 +4739,8 @@ class Game:
         demo_surface.fill((0, 0, 0, 0))
         self.demo_player.draw(demo_surface)
         self.demo_ai.draw(demo_surface)
+        self._demo_trails.update((self.demo_ball,))
+        self._demo_trails.draw(demo_surface)
         self.demo_ball.draw(demo_surface)
         # Draw center line segments with individual alpha (no square artifacts)
         for i in range(0, SCREEN_HEIGHT, 16):
@@ -2463,7 +4753,7 @@ class Game:
         logo_rect = self.title_logo.get_rect(center=(SCREEN_WIDTH // 2, 80 + 10 * math.sin(t * 1.5)))
         self.screen.blit(self.title_logo, logo_rect)
         # Subtitle in pastel sage green #A0AF84 (160, 175, 132)
-        subtitle = self.font.render(self.t('subtitle'), True, (160, 175, 132))
+        subtitle = self.text(self.font, self.t('subtitle'), (160, 175, 132))
         subtitle_rect = subtitle.get_rect(center=(cx, 140 + 8 * math.sin(t * 2.2)))
         self.screen.blit(subtitle, subtitle_rect)
         # CLEAN, MINIMAL DESIGN - Everything fits on screen (720px height)
@@ -2488,7 +4778,7 @@ class Game:
             else:
                 color = (140, 155, 180)
             
-            text = self.font.render(diff_labels[idx], True, color)
+            text = self.text(self.font, diff_labels[idx], color)
             text_rect = text.get_rect(center=(cx, y))
             
             # Subtle highlight for active - NO UGLY BOXES
@@ -2536,7 +4826,7 @@ class Game:
             self.screen.blit(text, text_rect)
         
         # Hint text - smaller, subtle
-        hint = self.small_font.render(self.t('difficulty_hint'), True, (110, 125, 150))
+        hint = self.text(self.small_font, self.t('difficulty_hint'), (110, 125, 150))
         hint_rect = hint.get_rect(center=(cx, base_y + len(self.difficulties) * spacing + 18))
         self.screen.blit(hint, hint_rect)
         
@@ -2589,6 +4879,7 @@ class Game:
         if fade > 0:
             self._tint_surface.fill((0, 0, 0, int(255 * fade)))
             self.screen.blit(self._tint_surface, (0, 0))
+        self.quality.end_work()
         pygame.display.flip()
     def draw_settings(self):
         """
@@ -2603,22 +4894,43 @@ class Game:
         - Back button / Botón de atrás
         - Hover effects / Efectos de hover
         """
-        self._draw_background()
         cx = SCREEN_WIDTH // 2
         t = self.elapsed
+        self.menu_phase = min(self.menu_phase + self.dt, 1.0)
+        fade = max(0.0, 1.0 - self.menu_phase)
+        back_hovered = self.settings_hover_item == "back"
+        back_scale = self._get_button_scale('settings_back', back_hovered)
+        if 'settings_back' not in self.button_scales:
+            self.button_scales['settings_back'] = 1.0
+        # Everything that changes the static widgets / Todo lo que cambia los widgets estáticos
+        full = self.dirty.begin(('settings', self.language, self.theme, id(self.base_background), self.fullscreen,
+                                 self.audio_enabled, self.show_debug_hud, self.settings_fullscreen_hover,
+                                 self.settings_hover_item, round(back_scale, 3), fade))
+        
+        # Animated title: the only widget redrawn on idle frames / Título animado: único widget redibujado en reposo
         title_color = (255, int(180 + 70 * math.sin(t)), int(200 + 40 * math.cos(t * 0.8)))
         title = self.large_font.render(self.t('settings'), True, title_color)
         title_rect = title.get_rect(center=(cx, 120 + 8 * math.sin(t * 1.5)))
+        title_area = pygame.Rect(0, 0, title.get_width(), title.get_height() + 18)
+        title_area.center = (cx, 120)
+        if not full:
+            self.screen.blit(self.base_background, title_area, title_area)
+            self.screen.blit(title, title_rect)
+            self.dirty.mark(title_area)
+            self.dirty.present(full)
+            return
+        
+        self._draw_background()
         self.screen.blit(title, title_rect)
         fullscreen_y = 240
-        self.screen.blit(self.font.render(self.t('fullscreen'), True, WHITE), self.font.render(self.t('fullscreen'), True, WHITE).get_rect(center=(cx - 100, fullscreen_y)))
+        self.screen.blit(self.text(self.font, self.t('fullscreen'), WHITE), self.text(self.font, self.t('fullscreen'), WHITE).get_rect(center=(cx - 100, fullscreen_y)))
         self._fullscreen_toggle_rect = self._draw_toggle(cx + 120, fullscreen_y, self.fullscreen, self.settings_fullscreen_hover)
         audio_y = 320
-        self.screen.blit(self.font.render(self.t('audio'), True, WHITE), self.font.render(self.t('audio'), True, WHITE).get_rect(center=(cx - 95, audio_y)))
+        self.screen.blit(self.text(self.font, self.t('audio'), WHITE), self.text(self.font, self.t('audio'), WHITE).get_rect(center=(cx - 95, audio_y)))
         self._audio_toggle_rect = self._draw_toggle(cx + 120, audio_y, self.audio_enabled, self.settings_hover_item == "audio_toggle")
         lang_y = 400
-        self.screen.blit(self.font.render(self.t('language'), True, WHITE), self.font.render(self.t('language'), True, WHITE).get_rect(center=(cx - 110, lang_y)))
-        lang_text = self.font.render("EN" if self.language == 'en' else "ES", True, (100, 220, 255))
+        self.screen.blit(self.text(self.font, self.t('language'), WHITE), self.text(self.font, self.t('language'), WHITE).get_rect(center=(cx - 110, lang_y)))
+        lang_text = self.text(self.font, "EN" if self.language == 'en' else "ES", (100, 220, 255))
         lang_rect = lang_text.get_rect(center=(cx + 120, lang_y))
         lang_hit = pygame.Rect(lang_rect.left - 25, lang_rect.top - 10, lang_rect.width + 50, lang_rect.height + 20)
         lang_hovered = self.settings_hover_item == "language_toggle"
@@ -2632,8 +4944,8 @@ class Game:
         
         # Theme toggle - Dark/Light mode selector
         theme_y = 480
-        self.screen.blit(self.font.render(self.t('theme'), True, WHITE), self.font.render(self.t('theme'), True, WHITE).get_rect(center=(cx - 105, theme_y)))
-        theme_text = self.font.render(self.t('dark_mode') if self.theme == 'dark' else self.t('light_mode'), True, (195, 181, 159) if self.theme == 'light' else (100, 220, 255))
+        self.screen.blit(self.text(self.font, self.t('theme'), WHITE), self.text(self.font, self.t('theme'), WHITE).get_rect(center=(cx - 105, theme_y)))
+        theme_text = self.text(self.font, self.t(f'{self.theme}_mode'), (195, 181, 159) if self.theme == 'light' else (100, 220, 255))
         theme_rect = theme_text.get_rect(center=(cx + 120, theme_y))
         theme_hit = pygame.Rect(theme_rect.left - 25, theme_rect.top - 10, theme_rect.width + 50, theme_rect.height + 20)
         theme_hovered = self.settings_hover_item == "theme_toggle"
@@ -2647,28 +4959,22 @@ class Game:
         
         # HUD toggle - MOVED HIGHER to prevent back button overlap
         toggle_y = 560  # Moved from 480 to 560
-        self.screen.blit(self.font.render(self.t('hud'), True, WHITE), self.font.render(self.t('hud'), True, WHITE).get_rect(center=(cx - 80, toggle_y)))
+        self.screen.blit(self.text(self.font, self.t('hud'), WHITE), self.text(self.font, self.t('hud'), WHITE).get_rect(center=(cx - 80, toggle_y)))
         self._debug_toggle_rect = self._draw_toggle(cx + 120, toggle_y, self.show_debug_hud, self.settings_hover_item == "debug_toggle")
         # Back button - NO EMOJI! Pastel rose #D6A2AD, at BOTTOM
         back_y = SCREEN_HEIGHT - 60  # At bottom with proper spacing
-        back_hovered = self.settings_hover_item == "back"
-        back_scale = self._get_button_scale('settings_back', back_hovered)
-        if 'settings_back' not in self.button_scales:
-            self.button_scales['settings_back'] = 1.0
         self._back_button_rect = self._draw_modern_button(
             "< " + self.t('back'), cx, back_y, back_hovered, back_scale, (214, 162, 173)
         )
         
-        # Draw fade-in overlay BEFORE display.flip() / Dibujar overlay de fade ANTES de display.flip()
+        # Draw fade-in overlay / Dibujar overlay de fade
         # Note: This doesn't block input - pygame processes events before rendering
         # Nota: Esto no bloquea la entrada - pygame procesa eventos antes de renderizar
-        self.menu_phase = min(self.menu_phase + self.dt, 1.0)
-        fade = max(0.0, 1.0 - self.menu_phase)
         if fade > 0:
             self._tint_surface.fill((0, 0, 0, int(255 * fade)))
             self.screen.blit(self._tint_surface, (0, 0))
         
-        pygame.display.flip()
+        self.dirty.present(full)
     
     def draw_multiplayer_menu(self):
         """
@@ -2691,7 +4997,7 @@ class Game:
         title_rect = title.get_rect(center=(cx, 100 + 8 * math.sin(t * 1.5)))
         self.screen.blit(title, title_rect)
         host_y = 220
-        host_text = self.font.render(self.t('host_game'), True, WHITE)
+        host_text = self.text(self.font, self.t('host_game'), WHITE)
         host_rect = host_text.get_rect(center=(cx, host_y))
         host_hit = pygame.Rect(host_rect.left - 50, host_rect.top - 15, host_rect.width + 100, host_rect.height + 30)
         host_hovered = hasattr(self, '_mp_host_hover') and self._mp_host_hover
@@ -2703,7 +5009,7 @@ class Game:
         self.screen.blit(host_text, host_rect)
         self._host_button_rect = host_hit
         join_y = 300
-        join_label = self.font.render(self.t('join_private'), True, (200, 210, 230))
+        join_label = self.text(self.font, self.t('join_private'), (200, 210, 230))
         join_label_rect = join_label.get_rect(center=(cx, join_y))
         self.screen.blit(join_label, join_label_rect)
         input_y = join_y + 50
@@ -2715,12 +5021,12 @@ class Game:
         pygame.draw.rect(self.screen, box_color, input_rect, border_radius=12)
         pygame.draw.rect(self.screen, (150, 200, 255), input_rect, 3, border_radius=12)
         input_display = self.join_code_input if self.join_code_input else self.t('code_hint')
-        input_text = self.font.render(input_display, True, WHITE if self.join_code_input else (150, 150, 150))
+        input_text = self.text(self.font, input_display, WHITE if self.join_code_input else (150, 150, 150))
         input_text_rect = input_text.get_rect(center=input_rect.center)
         self.screen.blit(input_text, input_text_rect)
         self._input_box_rect = input_rect
         join_btn_y = input_y + 70
-        join_btn_text = self.font.render(self.t('join'), True, WHITE)
+        join_btn_text = self.text(self.font, self.t('join'), WHITE)
         join_btn_rect = join_btn_text.get_rect(center=(cx, join_btn_y))
         join_btn_hit = pygame.Rect(join_btn_rect.left - 40, join_btn_rect.top - 12, join_btn_rect.width + 80, join_btn_rect.height + 24)
         join_btn_hovered = hasattr(self, '_join_btn_hover') and self._join_btn_hover
@@ -2732,10 +5038,10 @@ class Game:
         self.screen.blit(join_btn_text, join_btn_rect)
         self._join_button_rect = join_btn_hit
         public_y = join_btn_y + 90
-        public_label = self.font.render(self.t('or'), True, (180, 180, 200))
+        public_label = self.text(self.font, self.t('or'), (180, 180, 200))
         public_label_rect = public_label.get_rect(center=(cx, public_y - 15))
         self.screen.blit(public_label, public_label_rect)
-        public_btn_text = self.font.render(self.t('find_public'), True, WHITE)
+        public_btn_text = self.text(self.font, self.t('find_public'), WHITE)
         public_btn_rect = public_btn_text.get_rect(center=(cx, public_y + 30))
         public_btn_hit = pygame.Rect(public_btn_rect.left - 50, public_btn_rect.top - 15, public_btn_rect.width + 100, public_btn_rect.height + 30)
         public_btn_hovered = hasattr(self, '_public_btn_hover') and self._public_btn_hover
@@ -2748,11 +5054,11 @@ class Game:
         self._public_button_rect = public_btn_hit
         if self.multiplayer_status:
             status_color = (120, 255, 140) if "Connected" in self.multiplayer_status or "Hosting" in self.multiplayer_status else (255, 180, 120)
-            status_text = self.small_font.render(self.multiplayer_status, True, status_color)
+            status_text = self.text(self.small_font, self.multiplayer_status, status_color)
             status_rect = status_text.get_rect(center=(cx, public_y + 95))
             self.screen.blit(status_text, status_rect)
         back_y = SCREEN_HEIGHT - 100
-        back_text = self.font.render(self.t('back'), True, (220, 230, 255))
+        back_text = self.text(self.font, self.t('back'), (220, 230, 255))
         back_rect = back_text.get_rect(center=(cx, back_y))
         arrow_x = back_rect.left - 35
         arrow_y = back_y
@@ -2773,6 +5079,7 @@ class Game:
         if fade > 0:
             self._tint_surface.fill((0, 0, 0, int(255 * fade)))
             self.screen.blit(self._tint_surface, (0, 0))
+        self.quality.end_work()
         pygame.display.flip()
     def run_diagnostics(self):
         self.test_results = []
@@ -2815,17 +5122,15 @@ class Game:
         except Exception as e:
             self.test_results.append(("Collision Detection", "FAIL", str(e)))
         try:
-            test_pool = ParticlePool(50)
-            acquired = []
-            for _ in range(30):
-                acquired.append(test_pool.acquire())
-            for p in acquired:
-                test_pool.release(p)
-            pool_size = len(test_pool._pool)
-            if pool_size >= 50:
-                self.test_results.append(("Particle System", "PASS", f"Pool recycling: {pool_size} available"))
+            test_system = ParticleSystem(50)
+            vx, vy = test_system.radial_velocities(30, 10, 20)
+            test_system.emit(0, 0, vx, vy, (255, 255, 255), 3, 0.1)
+            test_system.update(0.2)  # All expire / Todas expiran
+            available = test_system.capacity - len(test_system)
+            if available >= 50:
+                self.test_results.append(("Particle System", "PASS", f"Slot recycling: {available} available"))
             else:
-                self.test_results.append(("Particle System", "WARN", f"Pool leak: {pool_size} available"))
+                self.test_results.append(("Particle System", "WARN", f"Slot leak: {available} available"))
         except Exception as e:
             self.test_results.append(("Particle System", "FAIL", str(e)))
         try:
@@ -2840,6 +5145,14 @@ class Game:
                 self.test_results.append(("Audio Engine", "FAIL", "Synthesis failed"))
         except Exception as e:
             self.test_results.append(("Audio Engine", "FAIL", str(e)))
+        try:
+            cache = self.sound_cache
+            lookups = cache.hits + cache.misses
+            hit_rate = 100.0 * cache.hits / lookups if lookups else 100.0
+            status = "PASS" if hit_rate >= 90.0 else "WARN"
+            self.test_results.append(("Sound Cache", status, f"{cache.hits} hits / {cache.misses} misses ({len(cache)} cached)"))
+        except Exception as e:
+            self.test_results.append(("Sound Cache", "FAIL", str(e)))
         try:
             import time
             start = time.perf_counter()
@@ -2893,7 +5206,8 @@ class Game:
         try:
             import sys
             paddle_mem = sys.getsizeof(self.player) + sys.getsizeof(self.ai)
-            particle_mem = sum(sys.getsizeof(p) for p in self.particles[:10]) if self.particles else 0
+            # Array bytes for up to 10 live particles / Bytes de arreglo para hasta 10 partículas vivas
+            particle_mem = self.particles.nbytes // self.particles.capacity * min(10, len(self.particles))
             ball_mem = sys.getsizeof(self.ball)
             total_kb = (paddle_mem + particle_mem + ball_mem) / 1024
             if total_kb < 10:
@@ -2915,17 +5229,24 @@ class Game:
         - Color-coded pass/warn/fail status / Estado codificado por colores pass/warn/fail
         - Close button / Botón de cerrar
         """
+        close_hovered = hasattr(self, '_diag_close_hover') and self._diag_close_hover
+        # Static screen: redraw only when results, hover or language change
+        # Pantalla estática: redibujar solo si cambian resultados, hover o idioma
+        full = self.dirty.begin(('diagnostics', self.language, id(self.base_background), tuple(self.test_results), close_hovered))
+        if not full:
+            self.dirty.present(full)
+            return
         self._draw_background()
         cx = SCREEN_WIDTH // 2
         t = self.elapsed
-        title = self.large_font.render(self.t('system_diagnostics'), True, (180, 220, 255))
+        title = self.text(self.large_font, self.t('system_diagnostics'), (180, 220, 255))
         title_rect = title.get_rect(center=(cx, 60))
         self.screen.blit(title, title_rect)
         y_offset = 140
         line_height = 45
         for idx, (test_name, status, details) in enumerate(self.test_results):
             name_color = (220, 230, 255)
-            name_text = self.font.render(test_name, True, name_color)
+            name_text = self.text(self.font, test_name, name_color)
             name_rect = name_text.get_rect(topleft=(80, y_offset))
             self.screen.blit(name_text, name_rect)
             if status == "PASS":
@@ -2941,11 +5262,11 @@ class Game:
             badge_h = 30
             badge_rect = pygame.Rect(badge_x, y_offset + 3, badge_w, badge_h)
             pygame.draw.rect(self.screen, badge_color, badge_rect, border_radius=15)
-            status_text = self.small_font.render(status, True, badge_text_color)
+            status_text = self.text(self.small_font, status, badge_text_color)
             status_rect = status_text.get_rect(center=badge_rect.center)
             self.screen.blit(status_text, status_rect)
             detail_color = (160, 170, 190)
-            detail_text = self.small_font.render(details[:50], True, detail_color)
+            detail_text = self.text(self.small_font, details[:50], detail_color)
             detail_rect = detail_text.get_rect(topleft=(100, y_offset + 22))
             self.screen.blit(detail_text, detail_rect)
             y_offset += line_height
@@ -2958,7 +5279,7 @@ class Game:
         else:
             summary_color = (255, 180, 100)
             summary_msg = f"Some Issues Detected ({passed}/{total} passed)"
-        summary = self.font.render(summary_msg, True, summary_color)
+        summary = self.text(self.font, summary_msg, summary_color)
         summary_rect = summary.get_rect(center=(cx, summary_y))
         glow_box = pygame.Rect(summary_rect.left - 20, summary_rect.top - 10, 
                                summary_rect.width + 40, summary_rect.height + 20)
@@ -2966,17 +5287,16 @@ class Game:
         pygame.draw.rect(self.screen, (*summary_color[:3], pulse), glow_box, border_radius=15)
         self.screen.blit(summary, summary_rect)
         close_y = SCREEN_HEIGHT - 40
-        close_text = self.small_font.render(self.t('close'), True, (200, 210, 230))
+        close_text = self.text(self.small_font, self.t('close'), (200, 210, 230))
         close_rect = close_text.get_rect(center=(cx, close_y))
         close_hit = pygame.Rect(close_rect.left - 25, close_rect.top - 8, close_rect.width + 50, close_rect.height + 16)
-        close_hovered = hasattr(self, '_diag_close_hover') and self._diag_close_hover
         if close_hovered:
             glow = pygame.Surface((close_hit.width, close_hit.height), pygame.SRCALPHA)
             pygame.draw.rect(glow, (80, 160, 255, 100), glow.get_rect(), border_radius=12)
             self.screen.blit(glow, close_hit)
         self.screen.blit(close_text, close_rect)
         self._diag_close_rect = close_hit
-        pygame.display.flip()
+        self.dirty.present(full)
     def draw_host_waiting(self):
         """
         Draw host waiting screen with connection code and status.
@@ -2989,61 +5309,82 @@ class Game:
         - Connection status / Estado de conexión
         - Cancel button / Botón de cancelar
         """
-        self._draw_background()
         cx = SCREEN_WIDTH // 2
         t = self.elapsed
-        title = self.large_font.render(self.t('hosting_game'), True, (150, 255, 180))
+        host = self.network_host
+        cancel_hovered = hasattr(self, '_cancel_hover') and self._cancel_hover
+        full = self.dirty.begin(('host_waiting', self.language, id(self.base_background), cancel_hovered,
+                                 host and (host.code, host.local_ip, host.external_ip, host.connected)))
+        if not full:
+            # Only the waiting dots animate / Solo animan los puntos de espera
+            if host:
+                self._draw_waiting_dots(cx, t)
+            self.dirty.present(full)
+            return
+        self._draw_background()
+        title = self.text(self.large_font, self.t('hosting_game'), (150, 255, 180))
         title_rect = title.get_rect(center=(cx, 150))
         self.screen.blit(title, title_rect)
         if self.network_host:
-            code_text = self.large_font.render(f"Code: {self.network_host.code}", True, (255, 255, 150))
+            code_text = self.text(self.large_font, f"Code: {self.network_host.code}", (255, 255, 150))
             code_rect = code_text.get_rect(center=(cx, 250))
             code_box = pygame.Rect(code_rect.left - 40, code_rect.top - 20, code_rect.width + 80, code_rect.height + 40)
             pulse = int(120 + 60 * math.sin(t * 3))
             pygame.draw.rect(self.screen, (100, 200, 255, pulse), code_box, border_radius=20)
             self.screen.blit(code_text, code_rect)
             y = 310
-            lan_title = self.font.render("LAN (Same WiFi):", True, (120, 255, 140))
+            lan_title = self.text(self.font, "LAN (Same WiFi):", (120, 255, 140))
             self.screen.blit(lan_title, lan_title.get_rect(center=(cx, y)))
             y += 30
-            lan_code = self.small_font.render(f"{self.t('share_code')} {self.network_host.code}", True, (200, 220, 255))
+            lan_code = self.text(self.small_font, f"{self.t('share_code')} {self.network_host.code}", (200, 220, 255))
             self.screen.blit(lan_code, lan_code.get_rect(center=(cx, y)))
             y += 22
-            lan_ip = self.small_font.render(f"{self.t('or_ip')} {self.network_host.local_ip}:5555", True, (180, 200, 220))
+            lan_ip = self.text(self.small_font, f"{self.t('or_ip')} {self.network_host.local_ip}:5555", (180, 200, 220))
             self.screen.blit(lan_ip, lan_ip.get_rect(center=(cx, y)))
             y += 40
-            net_title = self.font.render(self.t('internet'), True, (255, 200, 120))
+            net_title = self.text(self.font, self.t('internet'), (255, 200, 120))
             self.screen.blit(net_title, net_title.get_rect(center=(cx, y)))
             y += 30
             if self.network_host.external_ip:
-                net_line1 = self.small_font.render("1. Port forward 5555 in router settings", True, (200, 220, 255))
+                net_line1 = self.text(self.small_font, "1. Port forward 5555 in router settings", (200, 220, 255))
                 self.screen.blit(net_line1, net_line1.get_rect(center=(cx, y)))
                 y += 22
-                net_line2 = self.small_font.render(f"2. Share: {self.network_host.external_ip}:5555", True, (180, 200, 220))
+                net_line2 = self.text(self.small_font, f"2. Share: {self.network_host.external_ip}:5555", (180, 200, 220))
                 self.screen.blit(net_line2, net_line2.get_rect(center=(cx, y)))
             else:
-                net_error = self.small_font.render("(Can't detect external IP)", True, (255, 150, 150))
+                net_error = self.text(self.small_font, "(Can't detect external IP)", (255, 150, 150))
                 self.screen.blit(net_error, net_error.get_rect(center=(cx, y)))
-            dots = "." * (int(t * 2) % 4)
-            waiting_text = self.font.render(f"{self.t('waiting_player')}{dots}", True, (180, 190, 220))
-            waiting_rect = waiting_text.get_rect(center=(cx, 420))
-            self.screen.blit(waiting_text, waiting_rect)
+            self._draw_waiting_dots(cx, t)
             if self.network_host.connected:
-                conn_text = self.large_font.render(self.t('player_connected'), True, (120, 255, 140))
+                conn_text = self.text(self.large_font, self.t('player_connected'), (120, 255, 140))
                 conn_rect = conn_text.get_rect(center=(cx, SCREEN_HEIGHT // 2))
                 self.screen.blit(conn_text, conn_rect)
         cancel_y = SCREEN_HEIGHT - 100
-        cancel_text = self.font.render(self.t('cancel'), True, (255, 180, 180))
+        cancel_text = self.text(self.font, self.t('cancel'), (255, 180, 180))
         cancel_rect = cancel_text.get_rect(center=(cx, cancel_y))
         cancel_hit = pygame.Rect(cancel_rect.left - 40, cancel_rect.top - 12, cancel_rect.width + 80, cancel_rect.height + 24)
-        cancel_hovered = hasattr(self, '_cancel_hover') and self._cancel_hover
         if cancel_hovered:
             glow = pygame.Surface((cancel_hit.width, cancel_hit.height), pygame.SRCALPHA)
             pygame.draw.rect(glow, (255, 100, 100, 100), glow.get_rect(), border_radius=18)
             self.screen.blit(glow, cancel_hit)
         self.screen.blit(cancel_text, cancel_rect)
         self._cancel_button_rect = cancel_hit
-        pygame.display.flip()
+        self.dirty.present(full)
+    
+    def _draw_waiting_dots(self, cx, t):
+        """
+        Draw the animated "waiting for player..." line over a restored background.
+        Dibujar la línea animada "esperando jugador..." sobre el fondo restaurado.
+        """
+        label = self.t('waiting_player')
+        # Area sized for three dots so shrinking text is erased / Área para tres puntos para borrar el texto al encogerse
+        area = pygame.Rect((0, 0), self.font.size(f"{label}..."))
+        area.center = (cx, 420)
+        self.screen.blit(self.base_background, area, area)
+        dots = "." * (int(t * 2) % 4)
+        waiting_text = self.text(self.font, f"{label}{dots}", (180, 190, 220))
+        self.screen.blit(waiting_text, waiting_text.get_rect(center=(cx, 420)))
+        self.dirty.mark(area)
     
     def _draw_background(self):
         """
@@ -3060,6 +5401,7 @@ class Game:
         """
         # Draw CLEAN base gradient ONLY - NO OVERLAYS to show theme colors!
         # Dibujar gradiente base LIMPIO - SIN superposiciones para mostrar colores del tema!
+        self.theme_atlas.poll()  # Adopt themes baked in the background / Adoptar temas horneados en segundo plano
         self.screen.blit(self.base_background, (0, 0))
         
         # ALL ANIMATED OVERLAYS DISABLED - background is now clearly visible!
@@ -3118,12 +5460,108 @@ class Game:
         self.ball.speed_x = math.cos(angle) * speed * dir_x
         self.ball.speed_y = math.sin(angle) * speed
     def _draw_performance_hud(self):
+        """
+        Draw debug overlay, one stats line per subsystem (bottom-left).
+        Dibujar overlay de depuración, una línea de estadísticas por subsistema (abajo a la izquierda).
+        """
         fps = self.clock.get_fps()
         particle_count = len(self.particles)
         ball_speed = math.hypot(self.ball.speed_x, self.ball.speed_y)
-        stats = f"{fps:5.1f} FPS • Particles {particle_count:03d} • Speed {int(ball_speed):03d} px/s"
-        text = self.small_font.render(stats, True, (180, 190, 220))
-        self.screen.blit(text, (20, SCREEN_HEIGHT - 36))
+        cache, voices, music = self.sound_cache, self.voices, self.music
+        draw_stats = " • ".join(f"{name}{'*' if name == self.particle_renderer else ''} {ms:.2f} ms"
+                                for name, ms in self.particle_draw_ms.items())
+        lines = [
+            f"Particle draw (F3): {draw_stats or '-'}",
+            f"Music {music.bpm:.0f} BPM • chunk {music.chunk_ms:.2f} ms (avg {music.avg_chunk_ms:.2f} ms per {music.chunk_seconds:.1f} s)",
+            f"Voices +{voices.started} started • {voices.dropped} dropped • {voices.stolen} stolen (this frame)",
+            f"Sound cache {len(cache)}/{cache.capacity} • {cache.hits} hits • {cache.misses} misses",
+            f"Text cache {len(self.text_cache)} • {self.text_cache.bytes // 1024}/{self.text_cache.max_bytes // 1024} KB • {self.text_cache.hits} hits • {self.text_cache.misses} misses",
+            f"Buttons {len(self._button_cache)}/{BUTTON_CACHE_SIZE} cached • {self.button_cache_misses} builds",
+            f"Bloom (F4) {'on' if self._bloom_active() else 'off'} • {self.bloom.ms:.2f} ms",
+            f"Glow sprites {len(glow_sprites)}/{glow_sprites.capacity} • {glow_sprites.hits} hits • {glow_sprites.misses} builds",
+            f"Fonts {len(self.fonts)} loaded ({self.fonts.late_loads} late) • {self.fonts.requests} requests",
+            "Layer rebuilds " + " • ".join(f"{name} {count}" for name, count in self.compositor.rebuilds.items()),
+            "Pools " + " • ".join(f"{name} {pool.in_use}+{len(pool)} (created {pool.created}, peak {pool.peak})"
+                                  for name, pool in self.pools.items()),
+            f"Quality {self.quality.tier['name']} • p{self.quality.percentile} work {self.quality.frame_ms:.1f}/{self.quality.budget_ms:.1f} ms • {self.quality.changes} changes",
+            f"{fps:5.1f} FPS • Particles {particle_count:03d} • Speed {int(ball_speed):03d} px/s",
+        ]
+        y = SCREEN_HEIGHT - 36 - 26 * (len(lines) - 1)
+        for line in lines:
+            self.screen.blit(self.small_font.render(line, True, (180, 190, 220)), (20, y))
+            y += 26
+    
+    def text(self, font, text, color, scale=1.0):
+        """Render text through the shared TextCache. / Renderizar texto con el TextCache compartido."""
+        return self.text_cache.render(font, text, color, scale)
+    
+    def _render_center_line(self, step):
+        """
+        Render one phase of the pulsing center line.
+        Renderizar una fase de la línea central pulsante.
+        
+        Args / Argumentos:
+            step (int): Phase step in [0, CENTER_LINE_STEPS) / Paso de fase
+        """
+        layer = pygame.Surface((6, SCREEN_HEIGHT), pygame.SRCALPHA)
+        phase = step * math.tau / CENTER_LINE_STEPS
+        for i in range(0, SCREEN_HEIGHT, 16):
+            pulse = int(150 + 80 * math.sin(phase + i * 0.08))
+            pygame.draw.rect(layer, (pulse, 100, 255, 220), (0, i, 6, 10), border_radius=3)
+        return layer
+    
+    def _render_hud_layer(self, key):
+        """
+        Render scores, player labels and difficulty badge (top band of the screen).
+        Renderizar puntajes, etiquetas de jugadores e insignia de dificultad (franja superior).
+        
+        Args / Argumentos:
+            key (tuple): (player_score, ai_score, left_scale, right_scale, two_player, language, diff_index)
+        """
+        player_score, ai_score, left_scale, right_scale, two_player, _, diff_index = key
+        # Redrawn in place: the 'hud' layer keeps a single frame (capacity 1)
+        # Se redibuja en el sitio: la capa 'hud' guarda un solo fotograma (capacidad 1)
+        layer = self._hud_surface
+        layer.fill((0, 0, 0, 0))
+        left_str, right_str = str(player_score), str(ai_score)
+        # Pop animation picks cached scaled variants / La animación pop usa variantes escaladas en caché
+        l_surf = self.text(self.font, left_str, WHITE, left_scale)
+        r_surf = self.text(self.font, right_str, WHITE, right_scale)
+        l_shadow = self.text(self.font, left_str, (30, 10, 60), left_scale)
+        r_shadow = self.text(self.font, right_str, (30, 10, 60), right_scale)
+        l_pos = (SCREEN_WIDTH // 4 - l_surf.get_width() // 2, 20)
+        r_pos = (3 * SCREEN_WIDTH // 4 - r_surf.get_width() // 2, 20)
+        layer.blit(l_shadow, (l_pos[0] + 3, l_pos[1] + 4))
+        layer.blit(r_shadow, (r_pos[0] + 3, r_pos[1] + 4))
+        layer.blit(l_surf, l_pos)
+        layer.blit(r_surf, r_pos)
+        
+        # Dynamic labels for 2-player mode / Etiquetas dinámicas para modo 2 jugadores
+        if two_player:
+            player_label = self.text(self.small_font, "Player 1", (200, 210, 230))
+            ai_label = self.text(self.small_font, "Player 2", (200, 210, 230))
+        else:
+            player_label = self.text(self.small_font, self.t('player'), (200, 210, 230))
+            ai_label = self.text(self.small_font, self.t('ai'), (200, 210, 230))
+        
+        layer.blit(player_label, (SCREEN_WIDTH // 4 - player_label.get_width() // 2, 80))
+        layer.blit(ai_label, (3 * SCREEN_WIDTH // 4 - ai_label.get_width() // 2, 80))
+        if not hasattr(self, '_badge_cache'):
+            self._badge_cache = {}
+        diff_keys = ['easy', 'medium', 'hard']
+        diff_key = diff_keys[diff_index] if diff_index < len(diff_keys) else 'medium'
+        cache_key = f"{diff_key}_{self.language}"
+        if cache_key not in self._badge_cache:
+            badge_text = self.text(self.small_font, self.t(diff_key).upper(), (220, 230, 255))
+            badge_surface = pygame.Surface((badge_text.get_width() + 30, badge_text.get_height() + 12), pygame.SRCALPHA)
+            pygame.draw.rect(badge_surface, (30, 120, 220, 160), badge_surface.get_rect(), border_radius=12)
+            badge_surface.blit(badge_text, (15, 6))
+            self._badge_cache[cache_key] = badge_surface
+        badge = self._badge_cache[cache_key]
+        badge_rect = badge.get_rect(topright=(SCREEN_WIDTH - 40, 28))
+        layer.blit(badge, badge_rect)
+        return layer
+    
     def draw(self):
         """
         Draw active game (playing state).
@@ -3140,73 +5578,49 @@ class Game:
         - Game over overlay / Superposición de game over
         - Debug HUD (optional) / HUD de debug (opcional)
         """
-        self._draw_background()
+        # Static background layer / Capa de fondo estático
+        self.theme_atlas.poll()
+        self.screen.blit(self.compositor.get('background', id(self.base_background)), (0, 0))
         
         # Calculate screen shake offset / Calcular offset de sacudida de pantalla
         ox = oy = 0
         if self.shake_time > 0:
             ox = random.randint(-int(self.shake_mag), int(self.shake_mag))
             oy = random.randint(-int(self.shake_mag), int(self.shake_mag))
+        # Dynamic entities layer / Capa de entidades dinámicas
         self._game_layer.fill((0, 0, 0, 0))
-        self.player.draw(self._game_layer)
-        self.ai.draw(self._game_layer)
-        self.ball.draw(self._game_layer)
+        glow = self.object_glow
+        self.player.draw(self._game_layer, glow)
+        self.ai.draw(self._game_layer, glow)
+        self.ball_trails.update([self.ball, *self.balls], self.quality.tier['trail_length'])
+        self.ball_trails.draw(self._game_layer)
+        self.ball.draw(self._game_layer, glow)
         
         # Draw multi-balls / Dibujar multi-bolas
         for ball in self.balls:
-            ball.draw(self._game_layer)
-        
-        for i in range(0, SCREEN_HEIGHT, 16):
-            pulse = int(150 + 80 * math.sin(self.elapsed * 2 + i * 0.08))
-            color = (pulse, 100, 255, 220)
-            pygame.draw.rect(self._game_layer, color, (SCREEN_WIDTH // 2 - 3, i, 6, 10), border_radius=3)
-        self.draw_particles(self._game_layer)
+            ball.draw(self._game_layer, glow)
+        
+        # Center line pulse loops every pi seconds; frames are cached per phase step
+        # El pulso de la línea central se repite cada pi segundos; fotogramas en caché por paso de fase
+        step = int(self.elapsed * 2 / math.tau * CENTER_LINE_STEPS) % CENTER_LINE_STEPS
+        self._game_layer.blit(self.compositor.get('center_line', step), (SCREEN_WIDTH // 2 - 3, 0))
+        # Power-ups live on the entity layer so the bloom pass lights them
+        # Los power-ups van en la capa de entidades para que el bloom los ilumine
+        self.draw_powerups(self._game_layer)
+        self.draw_particles(self._game_layer, (ox, oy))
         self.screen.blit(self._game_layer, (ox, oy))
+        if self._bloom_active():
+            self.bloom.apply(self._game_layer, self.screen, (ox, oy))
         self.draw_score_bursts(self.screen)
-        left_scale = self._score_scale('left')
-        right_scale = self._score_scale('right')
-        left_str = str(self.player_score)
-        right_str = str(self.ai_score)
-        l_text = self.font.render(left_str, True, WHITE)
-        r_text = self.font.render(right_str, True, WHITE)
-        l_surf = pygame.transform.smoothscale(l_text, (int(max(1, l_text.get_width() * left_scale)), int(max(1, l_text.get_height() * left_scale))))
-        r_surf = pygame.transform.smoothscale(r_text, (int(max(1, r_text.get_width() * right_scale)), int(max(1, r_text.get_height() * right_scale))))
-        l_shadow = pygame.transform.smoothscale(self.font.render(left_str, True, (30, 10, 60)), l_surf.get_size())
-        r_shadow = pygame.transform.smoothscale(self.font.render(right_str, True, (30, 10, 60)), r_surf.get_size())
-        l_pos = (SCREEN_WIDTH // 4 - l_surf.get_width() // 2, 20)
-        r_pos = (3 * SCREEN_WIDTH // 4 - r_surf.get_width() // 2, 20)
-        self.screen.blit(l_shadow, (l_pos[0] + 3, l_pos[1] + 4))
-        self.screen.blit(r_shadow, (r_pos[0] + 3, r_pos[1] + 4))
-        self.screen.blit(l_surf, l_pos)
-        self.screen.blit(r_surf, r_pos)
-        
-        # Dynamic labels for 2-player mode / Etiquetas dinámicas para modo 2 jugadores
-        if self.game_mode == "2player":
-            player_label = self.small_font.render("Player 1", True, (200, 210, 230))
-            ai_label = self.small_font.render("Player 2", True, (200, 210, 230))
-        else:
-            player_label = self.small_font.render(self.t('player'), True, (200, 210, 230))
-            ai_label = self.small_font.render(self.t('ai'), True, (200, 210, 230))
         
-        self.screen.blit(player_label, (SCREEN_WIDTH // 4 - player_label.get_width() // 2, 80))
-        self.screen.blit(ai_label, (3 * SCREEN_WIDTH // 4 - ai_label.get_width() // 2, 80))
-        if not hasattr(self, '_badge_cache'):
-            self._badge_cache = {}
-        diff_keys = ['easy', 'medium', 'hard']
-        diff_key = diff_keys[self.diff_index] if self.diff_index < len(diff_keys) else 'medium'
-        cache_key = f"{diff_key}_{self.language}"
-        if cache_key not in self._badge_cache:
-            badge_text = self.small_font.render(self.t(diff_key).upper(), True, (220, 230, 255))
-            badge_surface = pygame.Surface((badge_text.get_width() + 30, badge_text.get_height() + 12), pygame.SRCALPHA)
-            pygame.draw.rect(badge_surface, (30, 120, 220, 160), badge_surface.get_rect(), border_radius=12)
-            badge_surface.blit(badge_text, (15, 6))
-            self._badge_cache[cache_key] = badge_surface
-        badge = self._badge_cache[cache_key]
-        badge_rect = badge.get_rect(topright=(SCREEN_WIDTH - 40, 28))
-        self.screen.blit(badge, badge_rect)
+        # Slow-changing HUD layer: scores, labels, difficulty badge
+        # Capa HUD de cambio lento: puntajes, etiquetas, insignia de dificultad
+        hud_key = (self.player_score, self.ai_score,
+                   TextCache.quantize(self._score_scale('left')), TextCache.quantize(self._score_scale('right')),
+                   self.game_mode == "2player", self.language, self.diff_index)
+        self.screen.blit(self.compositor.get('hud', hud_key), (0, 0))
         
-        # Draw power-ups and active effects HUD / Dibujar power-ups y HUD de efectos activos
-        self.draw_powerups()
+        # Active effects HUD / HUD de efectos activos
         self.draw_active_effects_hud()
         
         if self.show_debug_hud:
@@ -3225,14 +5639,14 @@ class Game:
             overlay_alpha = max(0, min(220, overlay_alpha))
             self._tint_surface.fill((10, 0, 30, overlay_alpha))
             self.screen.blit(self._tint_surface, (0, 0))
-            over = self.large_font.render(f"{winner} wins!", True, (255, 255, 150))
             scale = 1.0 + 0.15 * math.sin(self.elapsed * 4) * self.gameover_phase
-            over_scaled = pygame.transform.smoothscale(over, (int(over.get_width() * scale), int(over.get_height() * scale)))
+            over_scaled = self.text(self.large_font, f"{winner} wins!", (255, 255, 150), scale)
             over_rect = over_scaled.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 - 40))
-            tip = self.font.render("SPACE / ENTER to restart", True, WHITE)
+            tip = self.text(self.font, "SPACE / ENTER to restart", WHITE)
             tip_rect = tip.get_rect(center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2 + 40))
             self.screen.blit(over_scaled, over_rect)
             self.screen.blit(tip, tip_rect)
+        self.quality.end_work()
         pygame.display.flip()
     
     def run(self):
@@ -3252,6 +5666,61 @@ class Game:
             # Modo escritorio: Usar bucle síncrono tradicional
             self._run_sync()
     
+    def _begin_frame(self):
+        """
+        Per-frame bookkeeping shared by every game loop (sync, async and web wrapper).
+        Contabilidad por fotograma compartida por todos los bucles (sync, async y wrapper web).
+        """
+        dt_ms = self.clock.tick(60)
+        # Previous frame's work, timed from after tick() to before present; waits in
+        # tick(), flip() (vsync) and browser yields are excluded
+        # Trabajo del fotograma anterior, medido desde tras tick() hasta antes de presentar;
+        # se excluyen las esperas de tick(), flip() (vsync) y las cesiones al navegador
+        work_ms = self.quality.work_ms
+        self.quality.work_ms = None
+        self.quality.begin_work()
+        self.dt = max(0.001, dt_ms / 1000.0)
+        self.elapsed += self.dt
+        self.voices.begin_frame()
+        self.dirty.tick()
+        self._update_music()
+        if work_ms is not None and self.quality.update(work_ms):
+            self._apply_quality()
+    
+    def _apply_quality(self):
+        """
+        Derive per-object glow from the governor's tier; bloom replaces it.
+        Derivar el brillo por objeto del nivel del gobernador; el bloom lo reemplaza.
+        
+        draw() passes it (and the tier's trail_length) to the entities of this Game only.
+        draw() lo pasa (junto con trail_length del nivel) solo a las entidades de este Game.
+        """
+        self.object_glow = self.quality.tier['glow'] and not self._bloom_active()
+    
+    def _bloom_active(self):
+        """Bloom is on and the quality tier allows post effects. / Bloom activo y el nivel de calidad permite post-efectos."""
+        return self.bloom_enabled and self.quality.tier['post_effects']
+    
+    def toggle_bloom(self):
+        """Toggle the full-screen bloom pass (F4). / Alternar el pase de bloom de pantalla completa (F4)."""
+        self.bloom_enabled = not self.bloom_enabled
+        self._apply_quality()
+        print(f"[Bloom] {'On' if self.bloom_enabled else 'Off'}")
+    
+    def _update_music(self):
+        """
+        Stream background music, tempo following ball speed while playing.
+        Transmitir música de fondo, con tempo según la velocidad de la bola al jugar.
+        """
+        if not (self.audio_enabled and self.loaded):
+            return
+        bpm = MUSIC_BASE_BPM
+        if self.state == "playing":
+            base_speed = math.hypot(BALL_BASE_SPEED, BALL_BASE_SPEED * 0.55)  # Serve speed / Velocidad de saque
+            ratio = math.hypot(self.ball.speed_x, self.ball.speed_y) / base_speed
+            bpm = MUSIC_BASE_BPM * max(0.8, min(1.6, ratio))
+        self.music.update(bpm)
+    
     def _run_sync(self):
         """
         Synchronous game loop for desktop - original implementation.
@@ -3275,13 +5744,12 @@ class Game:
         - "diagnostics": Network diagnostics / Diagnósticos de red
         """
         # [SYNC LOOP MARKER] - For identifying this loop vs async
+        self.load()  # No-op unless loading was deferred / Sin efecto salvo si la carga se difirió
         self.player_move_dir = 0.0
         self.ai_move_dir = 0.0
         self._2player_button_hover = False
         while True:
-            dt_ms = self.clock.tick(60)
-            self.dt = max(0.001, dt_ms / 1000.0)
-            self.elapsed += self.dt
+            self._begin_frame()
             self.shake_time, self.left_pop, self.right_pop = max(0.0, self.shake_time - self.dt), max(0.0, self.left_pop - self.dt), max(0.0, self.right_pop - self.dt)
             self.update_score_bursts(self.dt)
             self._update_button_animations()  # Smooth button hover animations / Animaciones suaves de hover de botones
@@ -3502,6 +5970,10 @@ class Game:
                         self.toggle_fullscreen()
                     elif event.key == pygame.K_m:
                         self.toggle_audio()
+                    elif event.key == pygame.K_F3:
+                        self.cycle_particle_renderer()
+                    elif event.key == pygame.K_F4:
+                        self.toggle_bloom()
                     if self.state == "menu":
                         if event.key in (pygame.K_UP, pygame.K_w):
                             self.diff_index = (self.diff_index - 1) % len(self.difficulties)
@@ -3572,8 +6044,7 @@ class Game:
                             self.gameover_phase = 0.0
                             self.dragging = False
                             self.menu_hover_index = None
-                            self._clear_particles()
-                            self.score_bursts.clear()
+                            self._clear_effects()
             self.handle_input()
             if self.state == "playing":
                 self.player.move(self.player_move_dir, self.dt)
@@ -3644,19 +6115,19 @@ class Game:
         - Performance may be lower than desktop
         """
         # [ASYNC LOOP MARKER] - For identifying this loop vs sync
+        await self.load_async()  # Splash + loading, yielding between steps / Pantalla de carga, cediendo entre pasos
         self.player_move_dir = 0.0
         self.ai_move_dir = 0.0
         self._2player_button_hover = False
         while True:
-            dt_ms = self.clock.tick(60)
-            self.dt = max(0.001, dt_ms / 1000.0)
-            self.elapsed += self.dt
+            self._begin_frame()
             self.shake_time, self.left_pop, self.right_pop = max(0.0, self.shake_time - self.dt), max(0.0, self.left_pop - self.dt), max(0.0, self.right_pop - self.dt)
             self.update_score_bursts(self.dt)
             self._update_button_animations()  # Smooth button hover animations / Animaciones suaves de hover de botones
             
             # Yield to browser event loop / Ceder al bucle de eventos del navegador
             await asyncio.sleep(0)
+            self.quality.begin_work()  # Don't count the yield / No contar la cesión
             
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
@@ -3755,6 +6226,10 @@ class Game:
                         self.toggle_fullscreen()
                     elif event.key == pygame.K_m:
                         self.toggle_audio()
+                    elif event.key == pygame.K_F3:
+                        self.cycle_particle_renderer()
+                    elif event.key == pygame.K_F4:
+                        self.toggle_bloom()
                     if self.state == "menu":
                         if event.key in (pygame.K_UP, pygame.K_w):
                             self.diff_index = (self.diff_index - 1) % len(self.difficulties)
@@ -3794,8 +6269,7 @@ class Game:
                             self.gameover_phase = 0.0
                             self.dragging = False
                             self.menu_hover_index = None
-                            self._clear_particles()
-                            self.score_bursts.clear()
+                            self._clear_effects()
             self.handle_input()
             if self.state == "playing":
                 self.player.move(self.player_move_dir, self.dt)
@@ -3816,6 +6290,7 @@ class Game:
                     ball_rect = ball.get_rect()
                     if ball_rect.right < 0 or ball_rect.left > SCREEN_WIDTH:
                         self.balls.remove(ball)
+                        self.pools['ball'].release(ball)
                 
                 self.check_collision()
                 
@@ -3844,10 +6319,52 @@ class Game:
 # PROGRAM ENTRY POINT / PUNTO DE ENTRADA DEL PROGRAMA
 # ============================================================================
 
+def parse_cli_args(argv=None):
+    """
+    Parse command-line options (developer tools).
+    Analizar opciones de línea de comandos (herramientas de desarrollo).
+
+    Returns / Retorna:
+        argparse.Namespace: Parsed options / Opciones analizadas
+    """
+    import argparse
+    parser = argparse.ArgumentParser(description="Pong AI V2 - Neon Edition")
+    parser.add_argument('--benchmark-assets', action='store_true',
+                        help="Report procedural asset build time per resolution and exit")
+    parser.add_argument('--benchmark-particles', action='store_true',
+                        help="Report particle update/draw cost at 1k, 10k and 20k live particles and exit")
+    parser.add_argument('--import-budget', type=float, metavar='MS',
+                        help="Report how long 'import main' takes and fail if it exceeds MS or initializes pygame")
+    parser.add_argument('--profile-startup', nargs='?', const='startup_profile.json', metavar='PATH',
+                        help="Time each startup phase, print a breakdown and write a JSON report (default: startup_profile.json)")
+    return parser.parse_args(argv)
+
 if __name__ == "__main__":
+    # Developer tools / Herramientas de desarrollo
+    cli_args = parse_cli_args()
+    if cli_args.benchmark_assets:
+        benchmark_assets()
+        sys.exit(0)
+    if cli_args.benchmark_particles:
+        benchmark_particles()
+        sys.exit(0)
+    if cli_args.import_budget is not None:
+        import_ms, side_effects = measure_import_time()
+        print(f"import main: {import_ms:.1f} ms (budget {cli_args.import_budget:.0f} ms)")
+        if side_effects:
+            print(f"import main initialized: {', '.join(side_effects)}")
+        sys.exit(0 if import_ms <= cli_args.import_budget and not side_effects else 1)
+    if cli_args.profile_startup:
+        profiler = StartupProfiler()
+        Game(profiler=profiler)
+        profiler.print_report()
+        profiler.write_json(cli_args.profile_startup)
+        print(f"Report written to {cli_args.profile_startup}")
+        sys.exit(0)
+
     # Main entry point with foolproof error handling
     # Punto de entrada principal con manejo de errores a prueba de tontos
-    
+
     try:
         game = Game()
         game.run()
@@ -56,7 +56,7 @@ class AsyncGameWrapper:
     """
     def __init__(self):
         print("[Web] 🎮 Creating game instance...")
-        self.game = Game()
+        self.game = Game(defer_loading=True)  # Assets load in run() behind the splash
         self.running = True
         self.frame_count = 0
         print("[Web] ✅ Game instance created!")
@@ -68,6 +68,7 @@ class AsyncGameWrapper:
         """
         print("[Web] 🚀 Starting game loop...")
         await asyncio.sleep(0)  # Allow browser to render progress
+        await self.game.load_async()  # Yields between loading steps
         
         self.game.player_move_dir = 0.0
         self.game.ai_move_dir = 0.0
@@ -75,10 +76,8 @@ class AsyncGameWrapper:
         print("[Web] ▶️ Game is now running!")
 
         while self.running:
-            # Frame timing
-            dt_ms = self.game.clock.tick(60)
-            self.game.dt = max(0.001, dt_ms / 1000.0)
-            self.game.elapsed += self.game.dt
+            # Frame timing and per-frame counters
+            self.game._begin_frame()
             
             # Progress feedback (every 300 frames = ~5 seconds)
             self.frame_count += 1
@@ -128,9 +127,7 @@ class AsyncGameWrapper:
             elif self.game.state == "gameover":
                 self.game.draw()
 
-            # Update display
-            pygame.display.flip()
-
+            # Every draw_* presents its own frame (flip or dirty rects)
             # CRITICAL: Yield control to browser event loop
             await asyncio.sleep(0)
     
@@ -255,6 +252,10 @@ class AsyncGameWrapper:
                 self.game.toggle_fullscreen()
             elif event.key == pygame.K_m:
                 self.game.toggle_audio()
+            elif event.key == pygame.K_F3:
+                self.game.cycle_particle_renderer()
+            elif event.key == pygame.K_F4:
+                self.game.toggle_bloom()
             if self.game.state == "menu":
                 if event.key in (pygame.K_UP, pygame.K_w):
                     self.game.diff_index = (self.game.diff_index - 1) % len(self.game.difficulties)
@@ -313,8 +314,7 @@ class AsyncGameWrapper:
                     self.game.gameover_phase = 0.0
                     self.game.dragging = False
                     self.game.menu_hover_index = None
-                    self.game._clear_particles()
-                    self.game.score_bursts.clear()
+                    self.game._clear_effects()
 
 # ============================================================================
 # WEB ENTRY POINT